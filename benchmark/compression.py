@@ -0,0 +1,87 @@
+"""
+Size and throughput of compressed schema files against their uncompressed formats.
+
+Usage:
+    python -m benchmark.compression --instances 5000 --repeat 3
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel
+
+from schemantic.schema import HomologSchema
+from schemantic.schema.abstract import BaseSchema
+
+SUFFIXES = (
+    ".yaml",
+    ".yaml.gz",
+    ".yaml.xz",
+    ".yaml.bz2",
+    ".toml",
+    ".toml.gz",
+    ".toml.xz",
+    ".toml.bz2",
+    ".json",
+    ".json.gz",
+    ".json.xz",
+    ".json.bz2",
+)
+
+
+class Worker(BaseModel):
+    host: str = "localhost"
+    port: int
+    threads: int
+    queue: str = "default"
+
+
+def compression_benchmark(instances: int, repeat: int) -> list[dict]:
+    schema = HomologSchema.from_originating_type(
+        Worker, instance_names=OrderedSet(f"worker-{i:05d}" for i in range(instances))
+    )
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in SUFFIXES:
+            path = Path(directory) / f"schema{suffix}"
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                schema.dump(path)
+            dump_seconds = (time.perf_counter() - start) / repeat
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                BaseSchema.load(path)
+            load_seconds = (time.perf_counter() - start) / repeat
+
+            size = path.stat().st_size
+            results.append(
+                dict(
+                    suffix=suffix,
+                    bytes=size,
+                    dump_seconds=dump_seconds,
+                    load_seconds=load_seconds,
+                    load_mb_per_second=size / load_seconds / 1e6,
+                )
+            )
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(json.dumps(compression_benchmark(args.instances, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
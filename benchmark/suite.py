@@ -0,0 +1,228 @@
+"""
+Scaling benchmarks for the single, homolog, group, and culture paradigms over pydantic models, dataclasses, and
+plain classes. Results are emitted as JSON; pass a stored result with --compare to flag regressions.
+
+Usage:
+    python -m benchmark --fields 20 --instances 1000 --output result.json
+    python -m benchmark --compare baseline.json --threshold 1.25
+"""
+
+import argparse
+import functools
+import json
+import pickle
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from ordered_set import OrderedSet
+
+from benchmark.synthetic import (
+    ORIGIN_KINDS,
+    OriginKind,
+    define_culture,
+    define_group,
+    define_homolog,
+    define_single,
+    make_culture,
+    make_group,
+    make_homolog,
+    make_origins,
+    make_single,
+    required_values,
+)
+from schemantic.schema import CultureSchema, HomologSchema, SingleSchema
+from schemantic.schema.abstract import BaseSchema
+from schemantic.utils.constant import SCHEMA_DEFINED_MAPPING_KEY
+
+DEFAULT_FORMATS = (".yaml", ".toml", ".json")
+
+
+def measure(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> dict[str, float]:
+    """
+    Time func `repeat` times; setup runs untimed before each call, and its result is passed to func if not None.
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        func(argument) if argument is not None else func()  # type: ignore[call-arg]
+        timings.append(time.perf_counter() - start)
+
+    return dict(min=min(timings), mean=statistics.fmean(timings), median=statistics.median(timings), repeat=repeat)
+
+
+def _benchmark_schema(
+    results: dict[str, dict[str, float]],
+    prefix: str,
+    schema: BaseSchema,
+    defined: dict,
+    formats: Iterable[str],
+    repeat: int,
+) -> None:
+    results[f"{prefix}.schema"] = measure(schema.schema, repeat)
+    results[f"{prefix}.parse_schema"] = measure(lambda: schema.parse_schema(defined), repeat)
+    results[f"{prefix}.parse_schema_to_instance"] = measure(lambda: schema.parse_schema_to_instance(defined), repeat)
+    results[f"{prefix}.pickle_round_trip"] = measure(lambda: pickle.loads(pickle.dumps(schema)), repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in formats:
+            path = Path(directory) / f"schema{suffix}"
+            results[f"{prefix}.dump{suffix}"] = measure(functools.partial(schema.dump, path), repeat)
+            results[f"{prefix}.load{suffix}"] = measure(functools.partial(schema.load, path), repeat)
+
+
+def _benchmark_large_group(results: dict[str, dict[str, float]], n_fields: int, n_members: int, repeat: int) -> None:
+    """
+    Member indexes and hashing of a group with many members; independent of the origin kind, so plain classes are
+    used as they are the cheapest to create.
+    """
+    group = make_group("class", n_fields, n_members)
+    names = list(group.schema_mapping_name_to_instance_schema)
+    culture = CultureSchema(source_schemas=OrderedSet((group,)))
+    defined = {"common": {SCHEMA_DEFINED_MAPPING_KEY: required_values(n_fields)}}
+    defined.update((name, {SCHEMA_DEFINED_MAPPING_KEY: {}}) for name in names)
+
+    results["large_group.hash"] = measure(lambda: hash(group), repeat)
+    results["large_group.lookup"] = measure(
+        lambda: [group.schema_mapping_name_to_instance_schema[name] for name in names], repeat
+    )
+    results["large_group.origin_lookup"] = measure(
+        lambda: [group.member_label_to_origin[name] for name in names], repeat
+    )
+    results["large_group.culture_membership"] = measure(lambda: group in culture.source_schemas, repeat)
+    results["large_group.parse_schema"] = measure(lambda: group.parse_schema(defined), repeat)
+
+
+def _make_single_schemas(kind: OriginKind, n_fields: int, n_members: int) -> list[SingleSchema]:
+    return [SingleSchema(origin=origin) for origin in make_origins(kind, n_fields, n_members)]
+
+
+def run_suite(
+    kinds: Iterable[OriginKind],
+    n_fields: int,
+    n_members: int,
+    n_instances: int,
+    n_sources: int,
+    formats: Iterable[str],
+    repeat: int,
+    n_large_members: int = 0,
+) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for kind in kinds:
+        results[f"{kind}.schematic"] = measure(
+            lambda schemas: [schema.schematic for schema in schemas],
+            repeat,
+            setup=functools.partial(_make_single_schemas, kind, n_fields, n_members),
+        )
+        results[f"{kind}.parametrize"] = measure(
+            lambda origins: [(SingleSchema[origin], HomologSchema[origin]) for origin in origins],
+            repeat,
+            setup=functools.partial(make_origins, kind, n_fields, n_members),
+        )
+
+        single = make_single(kind, n_fields)
+        _benchmark_schema(results, f"{kind}.single", single, define_single(single, n_fields), formats, repeat)
+
+        homolog = make_homolog(kind, n_fields, n_instances)
+        _benchmark_schema(results, f"{kind}.homolog", homolog, define_homolog(homolog, n_fields), formats, repeat)
+        fast_homolog = make_homolog(kind, n_fields, n_instances, fast_constructor=True)
+        fast_defined = define_homolog(fast_homolog, n_fields)
+        results[f"{kind}.homolog.parse_schema_to_instance.fast_constructor"] = measure(
+            functools.partial(fast_homolog.parse_schema_to_instance, fast_defined), repeat
+        )
+
+        group = make_group(kind, n_fields, n_members)
+        _benchmark_schema(results, f"{kind}.group", group, define_group(group, n_fields), formats, repeat)
+
+        culture = make_culture(kind, n_fields, n_sources, n_members, n_instances)
+        _benchmark_schema(results, f"{kind}.culture", culture, define_culture(culture, n_fields), formats, repeat)
+
+    if n_large_members:
+        _benchmark_large_group(results, n_fields, n_large_members, repeat)
+
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+    min_seconds: float = 0.0,
+) -> dict[str, float]:
+    """
+    Ratio of current to baseline minimum time for every benchmark that regressed beyond the threshold.
+    Benchmarks faster than min_seconds in both runs are too noisy to compare and are skipped.
+    """
+    return {
+        name: result["min"] / baseline[name]["min"]
+        for name, result in results.items()
+        if name in baseline
+        and baseline[name]["min"] > 0
+        and max(result["min"], baseline[name]["min"]) >= min_seconds
+        and result["min"] / baseline[name]["min"] > threshold
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", nargs="+", choices=ORIGIN_KINDS, default=list(ORIGIN_KINDS))
+    parser.add_argument("--fields", type=int, default=20, help="Fields per origin")
+    parser.add_argument("--members", type=int, default=20, help="Members per group")
+    parser.add_argument("--instances", type=int, default=200, help="Instances per homolog")
+    parser.add_argument("--sources", type=int, default=6, help="Source schemas per culture")
+    parser.add_argument("--large-members", type=int, default=5000, help="Members of the large group; 0 to skip")
+    parser.add_argument("--formats", nargs="+", default=list(DEFAULT_FORMATS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the JSON result here instead of stdout")
+    parser.add_argument("--compare", type=Path, help="Stored result to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression")
+    parser.add_argument("--min-seconds", type=float, default=1e-4, help="Ignore benchmarks faster than this")
+    args = parser.parse_args(argv)
+
+    parameters = dict(
+        kinds=args.kinds,
+        fields=args.fields,
+        members=args.members,
+        instances=args.instances,
+        sources=args.sources,
+        large_members=args.large_members,
+        formats=args.formats,
+        repeat=args.repeat,
+    )
+    output: dict[str, Any] = dict(
+        meta=dict(python=platform.python_version(), platform=platform.platform(), parameters=parameters),
+        results=run_suite(
+            args.kinds,
+            args.fields,
+            args.members,
+            args.instances,
+            args.sources,
+            args.formats,
+            args.repeat,
+            args.large_members,
+        ),
+    )
+
+    exit_code = 0
+    if args.compare:
+        regressions = compare(
+            output["results"], json.loads(args.compare.read_text())["results"], args.threshold, args.min_seconds
+        )
+        output["regressions"] = regressions
+        if regressions:
+            exit_code = 1
+            for name, ratio in sorted(regressions.items(), key=lambda kv: -kv[1]):
+                print(f"REGRESSION {name}: {ratio:.2f}x", file=sys.stderr)
+
+    serialized = json.dumps(output, indent=2)
+    if args.output:
+        args.output.write_text(serialized)
+    else:
+        print(serialized)
+
+    return exit_code
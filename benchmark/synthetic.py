@@ -0,0 +1,145 @@
+"""
+Synthetic origins and schemas of configurable size for the benchmarks.
+
+Every origin has `required` int fields followed by optional str fields with a default.
+"""
+
+import itertools
+from dataclasses import field, make_dataclass
+from typing import Any, Callable, Literal, Type
+
+from ordered_set import OrderedSet
+from pydantic import create_model
+
+from schemantic.schema import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+from schemantic.utils.constant import SCHEMA_DEFINED_MAPPING_KEY
+
+OriginKind = Literal["model", "dataclass", "class"]
+ORIGIN_KINDS: tuple[OriginKind, ...] = ("model", "dataclass", "class")
+
+_origin_counter = itertools.count()
+
+
+def field_names(n_fields: int) -> tuple[list[str], list[str]]:
+    """Split the fields into required and optional names"""
+    n_required = max(1, n_fields // 2)
+    return [f"required_{i}" for i in range(n_required)], [f"optional_{i}" for i in range(n_fields - n_required)]
+
+
+def make_model(name: str, n_fields: int) -> Type:
+    required, optional = field_names(n_fields)
+    return create_model(
+        name, **{f: (int, ...) for f in required}, **{f: (str, f"default_{f}") for f in optional}  # type: ignore
+    )
+
+
+def make_dataclass_origin(name: str, n_fields: int) -> Type:
+    required, optional = field_names(n_fields)
+    return make_dataclass(
+        name, [(f, int) for f in required] + [(f, str, field(default=f"default_{f}")) for f in optional]
+    )
+
+
+def make_plain_class(name: str, n_fields: int) -> Type:
+    required, optional = field_names(n_fields)
+    parameters = ", ".join([f"{f}: int" for f in required] + [f"{f}: str = 'default_{f}'" for f in optional])
+    body = "".join(f"    self.{f} = {f}\n" for f in (*required, *optional))
+    namespace: dict[str, Any] = {}
+    exec(f"def __init__(self, {parameters}):\n{body}", namespace)
+    return type(name, (), {"__init__": namespace["__init__"]})
+
+
+KIND_TO_FACTORY: dict[OriginKind, Callable[[str, int], Type]] = {
+    "model": make_model,
+    "dataclass": make_dataclass_origin,
+    "class": make_plain_class,
+}
+
+
+def make_origin(kind: OriginKind, n_fields: int) -> Type:
+    """
+    Every call creates a new, uniquely named origin, so per-origin caches never hit across calls.
+    Origins are published in this module, so that they pickle by reference.
+    """
+    name = f"Synthetic{kind.title()}{next(_origin_counter)}"
+    origin = KIND_TO_FACTORY[kind](name, n_fields)
+    origin.__module__ = __name__
+    globals()[name] = origin
+    return origin
+
+
+def make_origins(kind: OriginKind, n_fields: int, count: int) -> list[Type]:
+    return [make_origin(kind, n_fields) for _ in range(count)]
+
+
+def required_values(n_fields: int) -> dict[str, int]:
+    required, _ = field_names(n_fields)
+    return {f: i for i, f in enumerate(required)}
+
+
+def make_single(kind: OriginKind, n_fields: int, alias: str = "single") -> SingleSchema:
+    return SingleSchema(origin=make_origin(kind, n_fields), schema_alias=alias)
+
+
+def make_homolog(
+    kind: OriginKind, n_fields: int, n_instances: int, alias: str = "homolog", fast_constructor: bool = False
+) -> HomologSchema:
+    return HomologSchema(
+        single_schema=SingleSchema(origin=make_origin(kind, n_fields)),
+        instance_names=OrderedSet(f"instance_{i:06d}" for i in range(n_instances)),
+        schema_alias=alias,
+        fast_constructor=fast_constructor,
+    )
+
+
+def make_group(kind: OriginKind, n_fields: int, n_members: int, mapping_name: str = "group") -> GroupSchema:
+    return GroupSchema.from_originating_types(make_origins(kind, n_fields, n_members), mapping_name=mapping_name)
+
+
+def make_culture(kind: OriginKind, n_fields: int, n_sources: int, n_members: int, n_instances: int) -> CultureSchema:
+    """Sources cycle through single, homolog, and group schemas"""
+    source_schemas: list = []
+    for i in range(n_sources):
+        match i % 3:
+            case 0:
+                source_schemas.append(make_single(kind, n_fields, alias=f"single_{i}"))
+            case 1:
+                source_schemas.append(make_homolog(kind, n_fields, n_instances, alias=f"homolog_{i}"))
+            case 2:
+                source_schemas.append(make_group(kind, n_fields, n_members, mapping_name=f"group_{i}"))
+    return CultureSchema(source_schemas=OrderedSet(source_schemas))
+
+
+def define_single(schema: SingleSchema, n_fields: int) -> dict:
+    defined = schema.schema(with_defined=True)
+    defined[SCHEMA_DEFINED_MAPPING_KEY] = required_values(n_fields)
+    return defined
+
+
+def define_homolog(schema: HomologSchema, n_fields: int) -> dict:
+    """Common carries the required values, every other instance overrides one of them"""
+    defined = schema.schema()
+    defined["common"] = required_values(n_fields)
+    required, _ = field_names(n_fields)
+    for i, name in enumerate(schema.homolog_names()):
+        defined[name] = {required[0]: i} if i % 2 else {}
+    return defined
+
+
+def define_group(schema: GroupSchema, n_fields: int) -> dict:
+    defined = schema.schema()
+    defined["common"][SCHEMA_DEFINED_MAPPING_KEY] = required_values(n_fields)
+    return defined
+
+
+def define_culture(schema: CultureSchema, n_fields: int) -> dict:
+    defined = schema.schema()
+    for source_schema in schema.source_schemas:
+        name = source_schema.mapping_name
+        if isinstance(source_schema, SingleSchema):
+            defined[name][SCHEMA_DEFINED_MAPPING_KEY] = required_values(n_fields)
+        elif isinstance(source_schema, HomologSchema):
+            defined[name] = define_homolog(source_schema, n_fields)
+        else:
+            defined[name]["common"][SCHEMA_DEFINED_MAPPING_KEY] = required_values(n_fields)
+    return defined
@@ -1,2 +1,34 @@
-from .project import SchemanticProjectMixin, SchemanticProjectModelMixin
-from .schema import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .project import SchemanticProjectMixin, SchemanticProjectModelMixin
+    from .schema import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+
+# Attributes are imported on first access, so that `import schemantic` stays cheap
+_attribute_to_module = {
+    "SchemanticProjectMixin": ".project",
+    "SchemanticProjectModelMixin": ".project",
+    "CultureSchema": ".schema.main",
+    "GroupSchema": ".schema.main",
+    "HomologSchema": ".schema.main",
+    "SingleSchema": ".schema.main",
+}
+
+__all__ = list(_attribute_to_module)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _attribute_to_module[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted((*globals(), *__all__))
@@ -0,0 +1,173 @@
+"""
+Timing instrumentation of schemantic's processing phases.
+
+Phases:
+    extract: schematic extraction from the origin
+    render: `schema()`
+    load: reading a defined file
+    parse: `parse_schema()`, including load and merge
+    merge: layering common and specific configurations
+    instantiate: calling the origins with their parsed configuration
+
+Events of a culture nest the events of its source schemas. Without a registered tracer, every phase
+costs a single function call.
+
+Usage:
+    with tracing(PhaseStats()) as stats:
+        culture.parse_schema_to_instance("defined.yaml")
+    print(stats.report())
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Literal, NamedTuple, Optional, TypeVar
+
+Phase = Literal["extract", "render", "load", "parse", "merge", "instantiate"]
+
+
+class PhaseEvent(NamedTuple):
+    phase: Phase
+    mapping_name: Optional[str]
+    start: float
+    seconds: float
+
+
+Tracer = Callable[[PhaseEvent], None]
+TracerT = TypeVar("TracerT", bound=Tracer)
+MethodT = TypeVar("MethodT", bound=Callable[..., Any])
+
+# Replaced, never mutated, so that emitting events needs no lock
+_tracers: tuple[Tracer, ...] = ()
+_tracers_lock = threading.Lock()
+
+
+def add_tracer(tracer: Tracer) -> None:
+    global _tracers
+    with _tracers_lock:
+        _tracers = (*_tracers, tracer)
+
+
+def remove_tracer(tracer: Tracer) -> None:
+    global _tracers
+    with _tracers_lock:
+        _tracers = tuple(registered for registered in _tracers if registered is not tracer)
+
+
+@contextmanager
+def tracing(tracer: TracerT) -> Iterator[TracerT]:
+    add_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        remove_tracer(tracer)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class _TimedPhase:
+    __slots__ = ("phase", "mapping_name", "start")
+
+    def __init__(self, phase: Phase, mapping_name: Optional[str]) -> None:
+        self.phase = phase
+        self.mapping_name = mapping_name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        event = PhaseEvent(self.phase, self.mapping_name, self.start, time.perf_counter() - self.start)
+        for tracer in _tracers:
+            tracer(event)
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def trace_phase(phase: Phase, mapping_name: Optional[str] = None) -> _NullPhase | _TimedPhase:
+    return _TimedPhase(phase, mapping_name) if _tracers else _NULL_PHASE
+
+
+def traced(phase: Phase) -> Callable[[MethodT], MethodT]:
+    """
+    Trace a schema method as a phase, tagged with the mapping_name of the schema (None for a culture).
+    """
+
+    def decorator(method: MethodT) -> MethodT:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _tracers:
+                return method(self, *args, **kwargs)
+            with _TimedPhase(phase, getattr(self, "mapping_name", None)):
+                return method(self, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class PhaseStatistic(NamedTuple):
+    count: int
+    total: float
+    min: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+
+class PhaseStats:
+    """
+    Tracer that aggregates the events by phase and mapping name.
+    """
+
+    def __init__(self) -> None:
+        self._key_to_statistic: dict[tuple[Phase, Optional[str]], PhaseStatistic] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: PhaseEvent) -> None:
+        key = (event.phase, event.mapping_name)
+        with self._lock:
+            if previous := self._key_to_statistic.get(key):
+                self._key_to_statistic[key] = PhaseStatistic(
+                    previous.count + 1,
+                    previous.total + event.seconds,
+                    min(previous.min, event.seconds),
+                    max(previous.max, event.seconds),
+                )
+            else:
+                self._key_to_statistic[key] = PhaseStatistic(1, event.seconds, event.seconds, event.seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._key_to_statistic.clear()
+
+    def statistics(self) -> dict[tuple[Phase, Optional[str]], PhaseStatistic]:
+        with self._lock:
+            return dict(self._key_to_statistic)
+
+    def export(self) -> list[dict]:
+        """JSON-serializable export, slowest total first"""
+        return [
+            dict(phase=phase, mapping_name=mapping_name, mean=statistic.mean, **statistic._asdict())
+            for (phase, mapping_name), statistic in sorted(self.statistics().items(), key=lambda kv: -kv[1].total)
+        ]
+
+    def report(self) -> str:
+        lines = [f"{'phase':<12} {'mapping_name':<32} {'count':>7} {'total [ms]':>11} {'mean [ms]':>10}"]
+        for row in self.export():
+            lines.append(
+                f"{row['phase']:<12} {str(row['mapping_name']):<32} {row['count']:>7} "
+                f"{row['total'] * 1e3:>11.3f} {row['mean'] * 1e3:>10.3f}"
+            )
+        return "\n".join(lines)
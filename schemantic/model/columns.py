@@ -0,0 +1,162 @@
+"""
+Columnar view of configurations: one column per field over the member names.
+
+Columns of only ints, or only floats, are NumPy arrays when NumPy is installed, `array.array` otherwise; other
+columns, including mixed ints and floats, are lists, so that every value reads back with its own type. A field that
+only comes from the common layer is broadcast without copying, as a zero-stride NumPy view of a numeric value or a
+RepeatedColumn.
+"""
+
+import array
+import enum
+from collections.abc import Sequence
+from typing import Any, Iterable, Mapping, Optional
+
+from pydantic import BaseModel
+
+
+class _Unset(enum.Enum):
+    UNSET = "UNSET"
+
+    def __repr__(self) -> str:
+        return self.value
+
+
+# At the positions of members without a value for the field, neither in their own layer nor in common
+UNSET = _Unset.UNSET
+
+
+class RepeatedColumn(Sequence):
+    """The same value at every position, without storing it more than once"""
+
+    __slots__ = ("value", "length")
+
+    def __init__(self, value: Any, length: int) -> None:
+        self.value = value
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RepeatedColumn(self.value, len(range(*index.indices(self.length))))
+        if not -self.length <= index < self.length:
+            raise IndexError(index)
+        return self.value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RepeatedColumn) and (self.value, self.length) == (other.value, other.length)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.value!r}, {self.length})"
+
+
+def _numpy() -> Optional[Any]:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _is_number(value: Any, kinds: tuple[type, ...]) -> bool:
+    return isinstance(value, kinds) and not isinstance(value, bool)
+
+
+def broadcast_column(value: Any, length: int) -> Sequence:
+    numpy = _numpy()
+    if numpy is not None and _is_number(value, (int, float)):
+        return numpy.broadcast_to(numpy.asarray(value), (length,))
+    return RepeatedColumn(value, length)
+
+
+def is_broadcast(column: Sequence) -> bool:
+    if isinstance(column, RepeatedColumn):
+        return True
+    strides = getattr(column, "strides", None)
+    return bool(strides) and strides[0] == 0 and len(column) > 0
+
+
+def dense_column(values: list[Any]) -> Sequence:
+    numpy = _numpy()
+    if all(_is_number(value, (int,)) for value in values):
+        try:
+            return numpy.array(values, dtype=numpy.int64) if numpy else array.array("q", values)
+        except OverflowError:
+            return values
+    if all(_is_number(value, (float,)) for value in values):
+        return numpy.array(values, dtype=numpy.float64) if numpy else array.array("d", values)
+    # Including mixed ints and floats, which would read back as floats only
+    return values
+
+
+def column_values(column: Sequence) -> list[Any]:
+    """Python values of a column"""
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+class ColumnarConfig(BaseModel, arbitrary_types_allowed=True, defer_build=True):
+    """
+    names: list[str]
+        Members, in order; position i of every column belongs to names[i]
+    columns: dict[str, Sequence]
+        Field to its values over the names; UNSET where a member has no value, so that None is a value like any other
+    """
+
+    names: list[str]
+    columns: dict[str, Sequence]
+
+    def __getitem__(self, field: str) -> Sequence:
+        return self.columns[field]
+
+    def row(self, name: str) -> dict[str, Any]:
+        index = self.names.index(name)
+        return {field: column[index] for field, column in self.columns.items()}
+
+    @classmethod
+    def from_layers(
+        cls, common: Mapping[str, Any], names: Iterable[str], name_to_layer: Mapping[str, Mapping[str, Any]]
+    ) -> "ColumnarConfig":
+        """
+        Columns of the configurations of names, each its own layer on top of common, without merging them
+        """
+        names = list(names)
+        layers = [name_to_layer.get(name, {}) for name in names]
+
+        fields = dict.fromkeys(common)
+        for layer in layers:
+            fields.update(dict.fromkeys(layer))
+
+        columns = {}
+        for field in fields:
+            if not any(field in layer for layer in layers):
+                columns[field] = broadcast_column(common[field], len(names))
+            else:
+                default = common.get(field, UNSET)
+                columns[field] = dense_column([layer.get(field, default) for layer in layers])
+
+        return cls(names=names, columns=columns)
+
+    def to_layers(self) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """
+        Reverse of from_layers: broadcast columns become the common layer, the others member layers.
+        Members without a value, UNSET, are left out.
+        """
+        common = (
+            {field: column[0] for field, column in self.columns.items() if is_broadcast(column)} if self.names else {}
+        )
+        name_to_layer: dict[str, dict[str, Any]] = {name: {} for name in self.names}
+        for field, column in self.columns.items():
+            if field in common:
+                continue
+            for name, value in zip(self.names, column_values(column), strict=True):
+                if value is not UNSET:
+                    name_to_layer[name][field] = value
+
+        numpy = _numpy()
+        if numpy is not None:
+            common = {
+                field: value.item() if isinstance(value, numpy.generic) else value for field, value in common.items()
+            }
+        return common, name_to_layer
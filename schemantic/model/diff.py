@@ -0,0 +1,85 @@
+from typing import Any, Optional
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel, Field
+
+from schemantic.utils.misc import same_content
+
+
+class MemberDiff(BaseModel, defer_build=True):
+    """
+    Field-level difference between the effective configuration of a member in two defined schemas.
+    """
+
+    added_fields: dict[str, Any] = Field(default_factory=dict)
+    removed_fields: dict[str, Any] = Field(default_factory=dict)
+    changed_fields: dict[str, tuple[Any, Any]] = Field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added_fields or self.removed_fields or self.changed_fields)
+
+    @classmethod
+    def from_configs(cls, old: dict[str, Any], new: dict[str, Any]) -> "MemberDiff":
+        return cls(
+            added_fields={field: value for field, value in new.items() if field not in old},
+            removed_fields={field: value for field, value in old.items() if field not in new},
+            changed_fields={
+                field: (old[field], value) for field, value in new.items() if field in old and old[field] != value
+            },
+        )
+
+
+class DefinedDiff(BaseModel, defer_build=True):
+    """
+    Members that were added, removed, or whose effective configuration changed between two defined schemas.
+    Member names are the ones used by `parse_schema_to_instance`.
+    """
+
+    added: list[str] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    changed: dict[str, MemberDiff] = Field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def changed_names(self) -> OrderedSet[str]:
+        return OrderedSet((*self.added, *self.changed, *self.removed))
+
+    def update(self, other: "DefinedDiff") -> None:
+        self.added.extend(other.added)
+        self.removed.extend(other.removed)
+        self.changed.update(other.changed)
+
+
+def diff_layered_configs(
+    old_common: Optional[dict[str, Any]],
+    new_common: Optional[dict[str, Any]],
+    old_name_to_config: dict[str, dict[str, Any]],
+    new_name_to_config: dict[str, dict[str, Any]],
+) -> DefinedDiff:
+    """
+    Diff members whose effective configuration is their own layer on top of a shared common layer.
+
+    Unchanged layers are skipped by identity or equality; a member is only merged and compared
+    field by field when its own layer, or the common layer, changed.
+    """
+    old_common = old_common or {}
+    new_common = new_common or {}
+    common_changed = not same_content(old_common, new_common)
+
+    result = DefinedDiff()
+    for name, new_config in new_name_to_config.items():
+        if name not in old_name_to_config:
+            result.added.append(name)
+            continue
+
+        old_config = old_name_to_config[name]
+        if not common_changed and same_content(old_config, new_config):
+            continue
+
+        if member_diff := MemberDiff.from_configs({**old_common, **old_config}, {**new_common, **new_config}):
+            result.changed[name] = member_diff
+
+    result.removed.extend(name for name in old_name_to_config if name not in new_name_to_config)
+    return result
@@ -1,10 +1,13 @@
+import dataclasses
 import inspect
 import logging
 from types import UnionType
-from typing import Literal, Optional, Type, Union, get_type_hints
+from typing import AbstractSet, Any, Callable, Iterator, Literal, NamedTuple, Optional, Type, Union, get_type_hints
+from weakref import WeakKeyDictionary
 
 from ordered_set import OrderedSet
 from pydantic import BaseModel, Field, computed_field
+from pydantic.dataclasses import is_pydantic_dataclass
 
 from schemantic.utils.constant import SCHEMA_REQUIRED_MAPPING_KEY
 from schemantic.utils.misc import dict_sorted_by_dict_key
@@ -12,7 +15,7 @@ from schemantic.utils.misc import dict_sorted_by_dict_key
 logger = logging.getLogger(__file__)
 
 
-class FieldMetadata(BaseModel):
+class FieldMetadata(BaseModel, defer_build=True):
     type_hint: str
     owner_to_default: Optional[dict[Type, str]] = Field(default_factory=dict)
 
@@ -30,6 +33,15 @@ class FieldMetadata(BaseModel):
             return f"{self.type_hint}(default: {default_string})"
         return self.type_hint
 
+    def merge_tracker(self) -> "FieldMetadata":
+        """
+        Copy to merge other FieldMetadata into, as self may be shared through a cached schematic
+        """
+        return FieldMetadata.model_construct(
+            type_hint=self.type_hint,
+            owner_to_default=dict(self.owner_to_default) if self.owner_to_default else self.owner_to_default,
+        )
+
     def merge_owner_to_default_with_other(self, other: "FieldMetadata") -> None:
         assert self.type_hint == other.type_hint
 
@@ -39,7 +51,7 @@ class FieldMetadata(BaseModel):
                 If other has owner_to_default defined, we want to copy it.
                 self is currently the tracker of the respective field state
                 """
-                self.owner_to_default = other.owner_to_default
+                self.owner_to_default = dict(other.owner_to_default)
 
             return
         elif not other.owner_to_default:
@@ -65,7 +77,7 @@ class FieldMetadata(BaseModel):
 
 
 def model_field_alias_to_field_info(
-    model: Type[BaseModel], fields_to_exclude: Optional[set[str]] = None, include_private: bool = False
+    model: Type[BaseModel], fields_to_exclude: Optional[AbstractSet[str]] = None, include_private: bool = False
 ) -> dict[Literal["required", "optional"], dict[str, FieldMetadata]]:
     model_schema = model.model_json_schema()
 
@@ -115,37 +127,153 @@ def model_field_alias_to_field_info(
     return result
 
 
+class _ResolvedParameter(NamedTuple):
+    name: str
+    type_hint: Any  # inspect.Parameter.empty if unannotated
+    default: Any
+
+
+# Keyed by the __init__ function, so classes inheriting the same __init__ resolve it once
+_function_to_resolved_parameters: WeakKeyDictionary[Callable, tuple[_ResolvedParameter, ...]] = WeakKeyDictionary()
+
+
+def _type_string(type_hint: Any) -> str:
+    # The if-test supports both conventional Unions (a | b | c) aka UnionType and typing.Union.
+    if isinstance(type_hint, UnionType) or hasattr(type_hint, "__origin__") and type_hint.__origin__ is Union:
+        type_sequence = [type_arg.__name__ for type_arg in type_hint.__args__ if type_arg != type(None)]
+        return type_sequence[0] if len(type_sequence) == 1 else f"Any[{', '.join(type_sequence)}]"
+
+    return type_hint.__name__
+
+
+def _resolve_parameters(function: Callable) -> tuple[_ResolvedParameter, ...]:
+    type_hints = get_type_hints(function)
+    return tuple(
+        _ResolvedParameter(param_name, type_hints.get(param_name, inspect.Parameter.empty), param.default)
+        for param_name, param in inspect.signature(function).parameters.items()
+        if param_name != "self"
+    )
+
+
+def resolved_parameters(function: Callable) -> tuple[_ResolvedParameter, ...]:
+    """
+    Parameters of function with their resolved type hints; memoized per function object, as
+    inspect.signature and get_type_hints, which evaluates string annotations, dominate extraction.
+    """
+    try:
+        return _function_to_resolved_parameters[function]
+    except KeyError:
+        result = _function_to_resolved_parameters[function] = _resolve_parameters(function)
+        return result
+    except TypeError:
+        # Not weak-referenceable, e.g. object.__init__
+        return _resolve_parameters(function)
+
+
 def class_field_alias_to_type_string(
-    source_cls: Type, fields_to_exclude: Optional[set[str]] = None, include_private: bool = False
+    source_cls: Type, fields_to_exclude: Optional[AbstractSet[str]] = None, include_private: bool = False
 ) -> dict[Literal["required", "optional"], dict[str, FieldMetadata]]:
-    constructor_signature = inspect.signature(source_cls.__init__)
-
     result = {"required": {}, "optional": {}}
 
-    type_hints = get_type_hints(source_cls.__init__)
-    for param_name, param in constructor_signature.parameters.items():
-        if (
-            param_name == "self"
-            or (not include_private and param_name.startswith("_"))
-            or (fields_to_exclude and param_name in fields_to_exclude)
+    for param_name, type_hint, default in resolved_parameters(source_cls.__init__):
+        if (not include_private and param_name.startswith("_")) or (
+            fields_to_exclude and param_name in fields_to_exclude
         ):
             continue
 
-        type_hint = type_hints[param_name]
+        if type_hint is inspect.Parameter.empty:
+            raise KeyError(param_name)
+        field_type = _type_string(type_hint)
+
+        if default == inspect.Parameter.empty:
+            result["required"][param_name] = FieldMetadata(type_hint=field_type)
+        else:
+            result["optional"][param_name] = FieldMetadata(
+                type_hint=field_type, owner_to_default=None if default is None else {source_cls: default}
+            )
+
+    for group, field_to_info in result.items():
+        result[group] = dict_sorted_by_dict_key(field_to_info)
+
+    return result
 
-        # The if-test supports both conventional Unions (a | b | c) aka UnionType and typing.Union.
-        if isinstance(type_hint, UnionType) or hasattr(type_hint, "__origin__") and type_hint.__origin__ is Union:
-            type_sequence = [type_arg.__name__ for type_arg in type_hint.__args__ if type_arg != type(None)]
-            field_type = type_sequence[0] if len(type_sequence) == 1 else f"Any[{', '.join(type_sequence)}]"
 
+def _dataclass_parameters(source_cls: Type) -> Iterator[tuple[str, Any, Any]]:
+    """
+    (name, type hint, default) of every __init__ parameter; default is inspect.Parameter.empty if required,
+    and dataclasses.MISSING if produced by a default_factory
+    """
+    if is_pydantic_dataclass(source_cls):
+        for name, field_info in source_cls.__pydantic_fields__.items():
+            if field_info.init is False:
+                continue
+            if field_info.is_required():
+                default = inspect.Parameter.empty
+            else:
+                default = dataclasses.MISSING if field_info.default_factory is not None else field_info.default
+            yield name, field_info.annotation, default
+        return
+
+    type_hints = get_type_hints(source_cls)
+    regular_field_names = {field.name for field in dataclasses.fields(source_cls)}
+    for name, field in source_cls.__dataclass_fields__.items():
+        type_hint = type_hints.get(name, field.type)
+        if isinstance(type_hint, dataclasses.InitVar):
+            type_hint = type_hint.type
+        elif name not in regular_field_names or not field.init:
+            # ClassVar pseudo-fields, and fields excluded from __init__
+            continue
+
+        if field.default is not dataclasses.MISSING:
+            default = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            default = dataclasses.MISSING
         else:
-            field_type = type_hint.__name__
+            default = inspect.Parameter.empty
+        yield name, type_hint, default
 
-        if param.default == inspect.Parameter.empty:
-            result["required"][param_name] = FieldMetadata(type_hint=field_type)
+
+def is_dataclass_with_generated_init(source_cls: Type) -> bool:
+    """
+    Dataclasses, including pydantic dataclasses, whose __init__ is generated from their own fields, rather than
+    written in the class body
+    """
+    if not (
+        dataclasses.is_dataclass(source_cls)
+        and "__dataclass_fields__" in vars(source_cls)
+        and source_cls.__dataclass_params__.init
+    ):
+        return False
+
+    if is_pydantic_dataclass(source_cls):
+        # Pydantic replaces any __init__ of the class body with its own
+        return True
+
+    # The generated __init__ is compiled from source text, rather than read from a file
+    init_code = getattr(vars(source_cls).get("__init__"), "__code__", None)
+    return init_code is not None and init_code.co_filename == "<string>"
+
+
+def dataclass_field_alias_to_field_info(
+    source_cls: Type, fields_to_exclude: Optional[AbstractSet[str]] = None, include_private: bool = False
+) -> dict[Literal["required", "optional"], dict[str, FieldMetadata]]:
+    """
+    Reads the dataclass fields directly, rather than the signature of the generated __init__. Fields with
+    init=False are skipped, and defaults produced by a default_factory are not evaluated.
+    """
+    result = {"required": {}, "optional": {}}
+
+    for name, type_hint, default in _dataclass_parameters(source_cls):
+        if (not include_private and name.startswith("_")) or (fields_to_exclude and name in fields_to_exclude):
+            continue
+
+        field_type = _type_string(type_hint)
+        if default is inspect.Parameter.empty:
+            result["required"][name] = FieldMetadata(type_hint=field_type)
         else:
-            result["optional"][param_name] = FieldMetadata(
-                type_hint=field_type, owner_to_default=None if param.default is None else {source_cls: param.default}
+            result["optional"][name] = FieldMetadata(
+                type_hint=field_type,
+                owner_to_default=None if default is None or default is dataclasses.MISSING else {source_cls: default},
             )
 
     for group, field_to_info in result.items():
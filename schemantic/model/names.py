@@ -0,0 +1,174 @@
+"""
+Symbolic homolog instance names, expanded lazily, e.g. for fleets of `worker-00000` ... `worker-99999`.
+
+Usage:
+    NameRange(template="worker-{:05d}", stop=100_000)
+    NameProduct(template="{}-{}", labels=[["eu", "us"], ["primary", "replica"]])
+"""
+
+import itertools
+import re
+import string
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Any, Iterator, Literal
+
+from pydantic import BaseModel, model_validator
+
+# Decimal integers, optionally zero- or space-padded to a width, e.g. "", "d", "05d", "3"
+_DECIMAL_FORMAT_SPEC = re.compile(r"0?\d*d?")
+
+
+def _template_parts(template: str) -> list[tuple[str, str | None]]:
+    """(literal text, format spec or None after the last field) of every replacement field in the template"""
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name or conversion:
+            msg = f"Only positional replacement fields like {{}} or {{:05d}} are supported in {template!r}"
+            raise ValueError(msg)
+        parts.append((literal, format_spec if field_name is not None else None))
+    return parts
+
+
+class NameSpec(BaseModel, ABC, frozen=True, defer_build=True):
+    """
+    Names that are stored symbolically and expanded on iteration; membership is tested without expanding them
+    """
+
+    kind: str
+    template: str
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[str]:  # type: ignore[override]
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def _field_pattern(self, index: int, format_spec: str) -> str:
+        ...
+
+    @abstractmethod
+    def _contains_values(self, name: str, values: tuple[str, ...]) -> bool:
+        ...
+
+    @cached_property
+    def _pattern(self) -> re.Pattern:
+        pattern = []
+        for index, (literal, format_spec) in enumerate(_template_parts(self.template)):
+            pattern.append(re.escape(literal))
+            if format_spec is not None:
+                pattern.append(f"({self._field_pattern(index, format_spec)})")
+        return re.compile("".join(pattern))
+
+    def __contains__(self, name: Any) -> bool:
+        if not isinstance(name, str) or not (match := self._pattern.fullmatch(name)):
+            return False
+        return self._contains_values(name, match.groups())
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.model_dump(mode="json")
+
+
+class NameRange(NameSpec):
+    """
+    template.format(i) for i in range(start, stop, step); the template has a single, decimal integer replacement
+    field, which may pad to a width, e.g. "worker-{:05d}"
+    """
+
+    kind: Literal["range"] = "range"
+    template: str = "{}"
+    start: int = 0
+    stop: int
+    step: int = 1
+
+    @model_validator(mode="after")
+    def single_field(self) -> "NameRange":
+        format_specs = [format_spec for _, format_spec in _template_parts(self.template) if format_spec is not None]
+        if len(format_specs) != 1:
+            msg = f"A {NameRange.__name__} template needs exactly one replacement field, got {self.template!r}"
+            raise ValueError(msg)
+        if not _DECIMAL_FORMAT_SPEC.fullmatch(format_specs[0]):
+            msg = (
+                f"A {NameRange.__name__} template only supports decimal integer fields like {{:05d}}, "
+                f"got {self.template!r}"
+            )
+            raise ValueError(msg)
+        if self.step == 0:
+            msg = "step cannot be zero"
+            raise ValueError(msg)
+        return self
+
+    @cached_property
+    def _range(self) -> range:
+        return range(self.start, self.stop, self.step)
+
+    def __iter__(self) -> Iterator[str]:  # type: ignore[override]
+        return map(self.template.format, self._range)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def _field_pattern(self, index: int, format_spec: str) -> str:
+        return r" *[+-]?\d+"
+
+    def _contains_values(self, name: str, values: tuple[str, ...]) -> bool:
+        # Formatting back rejects e.g. missing zero-padding
+        value = int(values[0])
+        return value in self._range and self.template.format(value) == name
+
+
+class NameProduct(NameSpec):
+    """
+    template.format(*labels) for every combination of one label out of each label set, in order, e.g.
+    template "{}-{}" with labels [["eu", "us"], ["a", "b"]] gives eu-a, eu-b, us-a, us-b
+    """
+
+    kind: Literal["product"] = "product"
+    template: str
+    labels: tuple[tuple[str, ...], ...]
+
+    @model_validator(mode="after")
+    def field_per_label_set(self) -> "NameProduct":
+        format_specs = [format_spec for _, format_spec in _template_parts(self.template) if format_spec is not None]
+        if any(format_specs):
+            msg = f"A {NameProduct.__name__} template only supports plain {{}} replacement fields, got {self.template!r}"
+            raise ValueError(msg)
+        n_fields = len(format_specs)
+        if n_fields != len(self.labels):
+            msg = f"The template {self.template!r} has {n_fields} replacement fields for {len(self.labels)} label sets"
+            raise ValueError(msg)
+        return self
+
+    @cached_property
+    def _label_sets(self) -> list[frozenset[str]]:
+        return [frozenset(labels) for labels in self.labels]
+
+    def __iter__(self) -> Iterator[str]:  # type: ignore[override]
+        return (self.template.format(*labels) for labels in itertools.product(*self.labels))
+
+    def __len__(self) -> int:
+        result = 1
+        for labels in self.labels:
+            result *= len(labels)
+        return result
+
+    def _field_pattern(self, index: int, format_spec: str) -> str:
+        return "|".join(re.escape(label) for label in sorted(self.labels[index], key=len, reverse=True))
+
+    def _contains_values(self, name: str, values: tuple[str, ...]) -> bool:
+        return True
+
+
+KIND_TO_NAME_SPEC: dict[str, type[NameSpec]] = {"range": NameRange, "product": NameProduct}
+
+
+def name_spec_from_dict(data: dict[str, Any]) -> NameSpec:
+    try:
+        spec_class = KIND_TO_NAME_SPEC[data["kind"]]
+    except KeyError as e:
+        msg = f"Unknown instance names specification {data}; kind must be one of {list(KIND_TO_NAME_SPEC)}"
+        raise ValueError(msg) from e
+    return spec_class(**data)
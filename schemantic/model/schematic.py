@@ -1,9 +1,18 @@
+import threading
 from functools import cached_property
-from typing import Optional
+from typing import Any, Iterable, Mapping, Optional, Type
+from weakref import WeakSet
 
 from pydantic import BaseModel, computed_field, model_validator
 
-from schemantic.model.field_info import FieldMetadata
+from schemantic.model.field_info import (
+    FieldMetadata,
+    class_field_alias_to_type_string,
+    dataclass_field_alias_to_field_info,
+    is_dataclass_with_generated_init,
+    model_field_alias_to_field_info,
+)
+from schemantic.project import SchemanticProjectMixin
 from schemantic.utils.constant import (
     SCHEMA_DEFINED_MAPPING_KEY,
     SCHEMA_FIELD_INFO_MAPPING_KEY,
@@ -12,7 +21,7 @@ from schemantic.utils.constant import (
 )
 
 
-class Schematic(BaseModel):
+class Schematic(BaseModel, defer_build=True):
     class_name: str
 
     required: Optional[dict[str, FieldMetadata]] = None
@@ -89,3 +98,87 @@ class Schematic(BaseModel):
         result[SCHEMA_FIELD_INFO_MAPPING_KEY] = field_to_info
 
         return result
+
+
+class SchematicCache:
+    """
+    Process-wide cache of extracted schematics, keyed by origin.
+
+    An entry of a SchemanticProjectMixin origin is reused for as long as its resolved single schema kwargs are, i.e.
+    until `recompute_single_schema_kwargs` is called. Cached schematics are shared between every schema of the same
+    origin, so treat them, and their FieldMetadata, as read-only.
+
+    Entries are stored on their origin rather than in a WeakKeyDictionary: the FieldMetadata of a schematic hold the
+    origin, in owner_to_default, which would keep the key of a WeakKeyDictionary alive. On the origin, they only form
+    a cycle with it, that is collected along with it. Origins whose attributes cannot be set, i.e. builtin and
+    extension types, are held strongly.
+    """
+
+    def __init__(self) -> None:
+        self._entry_attribute = f"__schemantic_schematic_{id(self)}__"
+        self._origins_with_entry: WeakSet[Type] = WeakSet()
+        self._immutable_origin_to_entry: dict[Type, tuple[Optional[Mapping[str, Any]], Schematic]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            for origin in list(self._origins_with_entry):
+                delattr(origin, self._entry_attribute)
+            self._origins_with_entry.clear()
+            self._immutable_origin_to_entry.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _entry(self, origin: Type) -> Optional[tuple[Optional[Mapping[str, Any]], Schematic]]:
+        # Not inherited by subclasses
+        return vars(origin).get(self._entry_attribute) or self._immutable_origin_to_entry.get(origin)
+
+    def __contains__(self, origin: Type) -> bool:
+        return self._entry(origin) is not None
+
+    def extract(self, origin: Type) -> Schematic:
+        kwargs = origin.resolved_single_schema_kwargs() if issubclass(origin, SchemanticProjectMixin) else None
+        with self._lock:
+            entry = self._entry(origin)
+            if entry and entry[0] is kwargs:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            schematic = _extract_schematic(origin, kwargs or {})
+            try:
+                setattr(origin, self._entry_attribute, (kwargs, schematic))
+                self._origins_with_entry.add(origin)
+            except TypeError:
+                self._immutable_origin_to_entry[origin] = (kwargs, schematic)
+            return schematic
+
+    def extract_all(self, origins: Iterable[Type]) -> dict[Type, Schematic]:
+        """
+        Extract many origins under a single lock acquisition; origins sharing an __init__ resolve it once.
+        """
+        with self._lock:
+            return {origin: self.extract(origin) for origin in origins}
+
+
+def _extract_schematic(origin: Type, kwargs: Mapping[str, Any]) -> Schematic:
+    if issubclass(origin, BaseModel):
+        required_optional_to_field_to_info = model_field_alias_to_field_info(origin, **kwargs)
+    elif is_dataclass_with_generated_init(origin):
+        required_optional_to_field_to_info = dataclass_field_alias_to_field_info(origin, **kwargs)
+    else:
+        required_optional_to_field_to_info = class_field_alias_to_type_string(origin, **kwargs)
+    return Schematic(class_name=origin.__name__, **required_optional_to_field_to_info)
+
+
+schematic_cache = SchematicCache()
+
+
+def extract_schematic(origin: Type) -> Schematic:
+    return schematic_cache.extract(origin)
+
+
+def extract_schematics(origins: Iterable[Type]) -> dict[Type, Schematic]:
+    return schematic_cache.extract_all(origins)
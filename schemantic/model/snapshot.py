@@ -0,0 +1,64 @@
+"""
+Snapshot of live instances back into defined configurations: the inverse of `parse_schema_to_instance`.
+"""
+
+from typing import Any, Mapping, Type
+
+from pydantic import BaseModel
+
+from schemantic.model.schematic import Schematic
+
+_MISSING = object()
+
+
+def instance_to_config(instance: Any, schematic: Schematic) -> dict[str, Any]:
+    """
+    Constructor kwargs of the fields in schematic, read back from instance. Pydantic models are dumped in json mode,
+    by alias; other instances are read attribute by attribute, and fields not stored under their own name are left out.
+    """
+    field_to_info = schematic.field_to_info
+    if isinstance(instance, BaseModel):
+        dumped = instance.model_dump(mode="json", by_alias=True)
+        return {field: dumped[field] for field in field_to_info if field in dumped}
+
+    result = {}
+    for field in field_to_info:
+        value = getattr(instance, field, _MISSING)
+        if value is not _MISSING:
+            result[field] = value
+    return result
+
+
+def drop_defaults(config: dict[str, Any], schematic: Schematic, origin: Type) -> dict[str, Any]:
+    """
+    config without the values equal to the default of origin recorded in schematic
+    """
+    field_to_info = schematic.field_to_info
+    result = {}
+    for field, value in config.items():
+        field_info = field_to_info.get(field)
+        if field_info and field_info.owner_to_default and field_info.owner_to_default.get(origin, _MISSING) == value:
+            continue
+        result[field] = value
+    return result
+
+
+def factor_common(name_to_config: Mapping[str, dict[str, Any]]) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Split the configurations into the values every one of them shares, and what remains per name.
+    Nothing is shared between fewer than two configurations.
+    """
+    if len(name_to_config) < 2:
+        return {}, dict(name_to_config)
+
+    configs = iter(name_to_config.values())
+    common = dict(next(configs))
+    for config in configs:
+        common = {field: value for field, value in common.items() if field in config and config[field] == value}
+        if not common:
+            break
+
+    return common, {
+        name: {field: value for field, value in config.items() if field not in common}
+        for name, config in name_to_config.items()
+    }
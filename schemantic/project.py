@@ -1,11 +1,28 @@
-from typing import Any, ClassVar, Type
+import threading
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping, Type
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, computed_field
 
+from schemantic.registry import register_origin
+
+# Resolved, immutable single_schema_kwargs per class; weak so that dynamically created classes can be collected
+_class_to_resolved_single_schema_kwargs: WeakKeyDictionary[type, Mapping[str, Any]] = WeakKeyDictionary()
+_resolved_single_schema_kwargs_lock = threading.Lock()
+
 
 class SchemanticProjectMixin:
     include_private: ClassVar[bool] = False
 
+    def __init_subclass__(cls, register: bool = True, **kwargs) -> None:
+        """
+        Subclasses join the origin registry, see schemantic.registry; opt out with `class A(..., register=False)`
+        """
+        super().__init_subclass__(**kwargs)
+        if register:
+            register_origin(cls)
+
     @classmethod
     @property
     def fields_to_exclude_from_single_schema(cls) -> set[str]:
@@ -33,11 +50,44 @@ class SchemanticProjectMixin:
             fields_to_exclude=cls.fields_to_exclude_from_single_schema,
         )
 
+    @classmethod
+    def resolved_single_schema_kwargs(cls) -> Mapping[str, Any]:
+        """
+        single_schema_kwargs, resolved once per class through the super() chain and cached as an immutable mapping
+        with fields_to_exclude as a frozenset. Overrides of the class-properties above keep working as before, but
+        are only evaluated on first use; call recompute_single_schema_kwargs after changing them at runtime.
+        """
+        try:
+            return _class_to_resolved_single_schema_kwargs[cls]
+        except KeyError:
+            return cls.recompute_single_schema_kwargs()
+
+    @classmethod
+    def recompute_single_schema_kwargs(cls) -> Mapping[str, Any]:
+        """
+        Re-resolve single_schema_kwargs for this class; subclasses, which inherit its overrides, re-resolve on their
+        next use.
+        """
+        kwargs = dict(cls.single_schema_kwargs)
+        if kwargs.get("fields_to_exclude") is not None:
+            kwargs["fields_to_exclude"] = frozenset(kwargs["fields_to_exclude"])
+        resolved = MappingProxyType(kwargs)
+
+        with _resolved_single_schema_kwargs_lock:
+            subclasses = cls.__subclasses__()
+            while subclasses:
+                subclass = subclasses.pop()
+                _class_to_resolved_single_schema_kwargs.pop(subclass, None)
+                subclasses.extend(subclass.__subclasses__())
+            _class_to_resolved_single_schema_kwargs[cls] = resolved
+
+        return resolved
+
 
 SchemanticProjectType = Type[SchemanticProjectMixin]
 
 
-class SchemanticProjectModelMixin(BaseModel, SchemanticProjectMixin):
+class SchemanticProjectModelMixin(BaseModel, SchemanticProjectMixin, register=False):
     @classmethod  # type: ignore[misc]
     @computed_field(return_type=set[str])
     @property
@@ -0,0 +1,127 @@
+"""
+Registry of origins, which subclasses of SchemanticProjectMixin and SchemanticProjectModelMixin join at class creation.
+Other classes can join with `register_origin`, which also works as a class decorator.
+
+Homolog name_getters can be registered by name with `register_name_getter`, so that schemas holding them can be
+pickled even if the name_getter itself cannot; see `schemantic.schema.pickling`.
+
+Usage:
+    warmup()  # At service start, extract the schematics of every registered origin in the background
+    group = GroupSchema.from_registry(base=MyProjectBase)
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from schemantic.model.schematic import Schematic
+
+logger = logging.getLogger(__file__)
+
+OriginT = TypeVar("OriginT", bound=type)
+NameGetterT = TypeVar("NameGetterT", bound=Callable)
+
+# Insertion-ordered, and weak so that dynamically created classes can be collected
+_origin_to_none: WeakKeyDictionary[type, None] = WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def register_origin(origin: OriginT) -> OriginT:
+    with _registry_lock:
+        _origin_to_none[origin] = None
+    return origin
+
+
+def unregister_origin(origin: Type) -> None:
+    with _registry_lock:
+        _origin_to_none.pop(origin, None)
+
+
+def registered_origins(base: Optional[Type] = None) -> list[Type]:
+    """
+    Registered origins in registration order, optionally only the subclasses of base.
+    """
+    with _registry_lock:
+        origins = list(_origin_to_none)
+    return origins if base is None else [origin for origin in origins if issubclass(origin, base)]
+
+
+_name_to_name_getter: dict[str, Callable] = {}
+_name_getter_id_to_name: dict[int, str] = {}
+
+
+def register_name_getter(name_getter: NameGetterT, name: Optional[str] = None) -> NameGetterT:
+    """
+    Register a name_getter under name, which defaults to its module and qualified name. The registration must also
+    run in every process that unpickles schemas holding it, e.g. at import time of the module defining it.
+    """
+    name = name or f"{name_getter.__module__}.{name_getter.__qualname__}"
+    with _registry_lock:
+        if (registered := _name_to_name_getter.get(name)) is not None and registered is not name_getter:
+            _name_getter_id_to_name.pop(id(registered), None)
+        _name_to_name_getter[name] = name_getter
+        _name_getter_id_to_name[id(name_getter)] = name
+    return name_getter
+
+
+def name_getter_name(name_getter: Callable) -> Optional[str]:
+    with _registry_lock:
+        name = _name_getter_id_to_name.get(id(name_getter))
+        return name if name is not None and _name_to_name_getter[name] is name_getter else None
+
+
+def registered_name_getter(name: str) -> Callable:
+    try:
+        return _name_to_name_getter[name]
+    except KeyError:
+        msg = f"No name_getter is registered as {name!r} in this process"
+        raise AttributeError(msg) from None
+
+
+def _extract_all(origins: Iterable[Type]) -> dict[Type, "Schematic"]:
+    from schemantic.model.schematic import extract_schematic
+
+    result = {}
+    for origin in origins:
+        try:
+            result[origin] = extract_schematic(origin)
+        except Exception:
+            # E.g. mixins without fields of their own; they fail the same way once actually used
+            logger.warning(f"Could not extract the schematic of {origin.__qualname__}", exc_info=True)
+    return result
+
+
+def warmup(origins: Optional[Iterable[Type]] = None, background: bool = True) -> Future[dict[Type, "Schematic"]]:
+    """
+    Extract and cache the schematics of origins, so that the first schema of each origin does not pay for it.
+
+    Parameters
+    ----------
+    origins: Optional[Iterable[Type]]
+        Defaults to every registered origin
+    background: bool
+        Extract in a daemon thread and return immediately
+
+    Returns
+    -------
+    Future[dict[Type, Schematic]]
+        Resolves to the origins whose schematic was extracted; failures are logged and skipped
+    """
+    origins = registered_origins() if origins is None else list(origins)
+    future: Future[dict[Type, "Schematic"]] = Future()
+
+    def run() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(_extract_all(origins))
+        except BaseException as e:
+            future.set_exception(e)
+
+    if background:
+        threading.Thread(target=run, name="schemantic-warmup", daemon=True).start()
+    else:
+        run()
+    return future
@@ -1 +1,31 @@
-from .main import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .main import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+
+# Attributes are imported on first access, so that e.g. `schemantic.schema.abstract` can be used on its own
+_attribute_to_module = {
+    "CultureSchema": ".main",
+    "GroupSchema": ".main",
+    "HomologSchema": ".main",
+    "SingleSchema": ".main",
+}
+
+__all__ = list(_attribute_to_module)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _attribute_to_module[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted((*globals(), *__all__))
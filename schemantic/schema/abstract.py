@@ -1,21 +1,48 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from copy import copy
 from pathlib import Path
-from typing import Any, ClassVar, Optional
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Mapping, Optional
 
-from pydantic import BaseModel, FilePath, computed_field, validate_call
+from ordered_set import OrderedSet
+from pydantic import BaseModel, FilePath, computed_field
 
+from schemantic.instrument import trace_phase
+from schemantic.schema.pickling import restore_schema
 from schemantic.utils.constant import (
     SCHEMA_DEFINED_MAPPING_KEY,
     SCHEMA_OPTIONAL_MAPPING_KEY,
     SCHEMA_REQUIRED_MAPPING_KEY,
 )
-from schemantic.utils.typing import DefinedSchema
+from schemantic.utils.extends import load_defined_file
+from schemantic.utils.file import dump_schema_file
+from schemantic.utils.index import write_index
+from schemantic.utils.misc import lazy_validate_call
+from schemantic.utils.typing import DefinedSchema, NameToOriginConfig
 
+if TYPE_CHECKING:
+    from schemantic.model.diff import DefinedDiff
+    from schemantic.schema.memory import MemoryReport
+    from schemantic.schema.shared import SharedParsed
+    from schemantic.schema.watch import SchemaWatcher
 
-class BaseSchema(BaseModel, ABC, arbitrary_types_allowed=True):
+
+class BaseSchema(BaseModel, ABC, arbitrary_types_allowed=True, defer_build=True):
     prohibited_keys: ClassVar[set[str]] = set()
 
+    def __reduce__(self):
+        return restore_schema, (type(self), self._reduced_state())
+
+    def _reduced_state(self) -> dict[str, Any]:
+        """
+        Declared fields only; see `schemantic.schema.pickling`
+        """
+        return {name: self.__dict__[name] for name in type(self).model_fields if name in self.__dict__}
+
+    @classmethod
+    def _from_reduced_state(cls, state: dict[str, Any]) -> "BaseSchema":
+        return cls.model_construct(**state)
+
     @abstractmethod
     def schema(self, *args, **kwargs):
         ...
@@ -28,42 +55,109 @@ class BaseSchema(BaseModel, ABC, arbitrary_types_allowed=True):
     def parse_schema_to_instance(self, defined_schema: DefinedSchema) -> dict[str, Any]:
         ...
 
-    @validate_call
-    def dump(self, dump_path: Path, **schema_kwargs) -> None:
-        schema = self.schema(**schema_kwargs)
+    def parse_schema_to_instance_concurrently(
+        self, defined_schema: DefinedSchema, executor: Optional[Executor] = None, max_workers: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        `parse_schema_to_instance`, with the members constructed concurrently on executor, a thread pool of
+        max_workers by default. Every member is attempted; failures are raised together as an
+        `InstantiationErrorGroup` keyed by member path. See `schemantic.schema.concurrent`.
+        """
+        from schemantic.schema.concurrent import instantiate_concurrently
 
-        match dump_path.suffix:
-            case ".toml":
-                from rtoml import dump
+        return instantiate_concurrently(self, defined_schema, executor, max_workers)
 
-                dump(schema, dump_path)
+    @abstractmethod
+    def diff_defined(self, old_defined_schema: DefinedSchema, new_defined_schema: DefinedSchema) -> "DefinedDiff":
+        ...
 
-            case ".yaml" | ".yml":
-                from ruamel.yaml import YAML
+    @abstractmethod
+    def defined_from_instances(self, instances: Mapping[str, Any], dump_path: Optional[Path] = None) -> dict[str, Any]:
+        """
+        Inverse of `parse_schema_to_instance`: the minimal defined schema that parses back to the configuration of
+        instances, keyed by the same names. Values equal to the defaults in the schematic are dropped, and, for
+        homologs and groups, values shared by every member are moved to common. With dump_path, also dump it there.
+        """
+        ...
 
-                YAML().dump(schema, dump_path)
+    @abstractmethod
+    def parse_schema_with_origin(self, defined_schema: DefinedSchema) -> NameToOriginConfig:
+        """
+        Resolve the effective constructor kwargs of every member, keyed by the same names as
+        `parse_schema_to_instance`, together with the origin that consumes them.
+        """
+        ...
 
-            case _:
-                msg = f"{dump_path.suffix} is unsupported"
-                raise NotImplementedError(msg)
+    @lazy_validate_call
+    def dump(self, dump_path: Path, *, with_index: bool = False, **schema_kwargs) -> None:
+        """
+        Dump the schema to a toml, yaml, or json file. Compression is inferred from a trailing
+        `.gz`, `.xz`, or `.bz2` suffix, e.g. `schema.yaml.gz`. With with_index, also write the byte offset index
+        of the file next to it, see `schemantic.utils.index`.
+        """
+        dump_schema_file(self.schema(**schema_kwargs), dump_path)
+        if with_index:
+            write_index(dump_path)
 
     @staticmethod
-    @validate_call
+    @lazy_validate_call
     def load(schema_path: FilePath) -> dict:
-        match schema_path.suffix:
-            case ".toml":
-                from rtoml import load
-
-                return load(schema_path)
+        """
+        Load a defined schema file. The file may layer itself on top of other defined files by listing them
+        under the `extends` key; those base files are resolved once per process and shared.
+        """
+        return load_defined_file(schema_path)
 
-            case ".yaml" | ".yml":
-                from ruamel.yaml import YAML
-
-                return YAML().load(schema_path)
-
-            case _:
-                msg = f"{schema_path.suffix} is unsupported"
-                raise NotImplementedError(msg)
+    def watch(
+        self,
+        defined_path: Path,
+        callback: Optional[Callable[[OrderedSet[str]], None]] = None,
+        interval: float = 1.0,
+        start: bool = True,
+    ) -> "SchemaWatcher":
+        """
+        Hot reload a defined file by polling it via stat; see `SchemaWatcher`.
+
+        Parameters
+        ----------
+        defined_path: Path
+            The defined file to watch
+        callback: Optional[Callable[[OrderedSet[str]], None]]
+            Called with the names of the added, changed, and removed members after each reload
+        interval: float
+            Seconds between polls
+        start: bool
+            Start polling in a background thread; otherwise call `SchemaWatcher.poll` yourself
+
+        Returns
+        -------
+        SchemaWatcher, holding the current `configs` and `instances`
+        """
+        from schemantic.schema.watch import SchemaWatcher
+
+        watcher = SchemaWatcher(self, defined_path, callbacks=[callback] if callback else None, interval=interval)
+        return watcher.start() if start else watcher
+
+    def memory_report(
+        self, defined_schema: Optional[DefinedSchema] = None, instances: Optional[Mapping[str, Any]] = None
+    ) -> "MemoryReport":
+        """
+        Break down the memory retained by this schema, and optionally by a defined schema, its parsed
+        configurations, and instances, by member and by category; see `schemantic.schema.memory.memory_report`.
+        Equal parsed configurations that are allocated separately are listed as duplicates that could be shared.
+        """
+        from schemantic.schema.memory import memory_report
+
+        return memory_report(self, defined_schema, instances)
+
+    def publish(self, defined_schema: DefinedSchema, path: Optional[Path] = None) -> "SharedParsed":
+        """
+        Parse once and publish every member's origin and configuration to a read-only, mmap-backed segment, which
+        worker processes open with `schemantic.schema.shared.attach` instead of parsing the defined files again.
+        """
+        from schemantic.schema.shared import publish
+
+        return publish(self, defined_schema, path)
 
     @classmethod  # type: ignore[misc]
     @computed_field(return_type=set[str])
@@ -73,13 +167,14 @@ class BaseSchema(BaseModel, ABC, arbitrary_types_allowed=True):
         result.update((SCHEMA_REQUIRED_MAPPING_KEY, SCHEMA_OPTIONAL_MAPPING_KEY))
         return result
 
-    @validate_call
+    @lazy_validate_call
     def _make_sure_defined_schema_is_loaded(self, defined_schema: DefinedSchema) -> dict[str, Any]:
         if isinstance(defined_schema, Path):
-            defined_schema = self.load(defined_schema)
+            with trace_phase("load", getattr(self, "mapping_name", None)):
+                defined_schema = self.load(defined_schema)
         return defined_schema
 
-    @validate_call
+    @lazy_validate_call
     def _get_configuration_from_mapping(self, source: dict, *, stored_in_defined: bool) -> dict[str, Any]:
         try:
             result = source[self.mapping_name]
@@ -112,15 +207,31 @@ class NotCultureSchema(BaseSchema, ABC):
     ):
         ...
 
+    @abstractmethod
+    def parse_schema_with_origin(
+        self,
+        defined_schema: DefinedSchema,
+        *,
+        _inferior_config_kwargs: Optional[dict[str, Any]] = None,
+    ) -> NameToOriginConfig:
+        ...
+
 
 class SingleHomologousSchema(NotCultureSchema, ABC):
     schema_alias: Optional[str] = None
 
+    def __class_getitem__(cls, item: Any) -> type:
+        """
+        `SingleSchema[T]` and `HomologSchema[T]` are for static typing only: at runtime they are the class itself,
+        rather than a pydantic model class, with its own validator, built for every origin
+        """
+        return cls
+
     @property
     @abstractmethod
     def mapping_name(self) -> str:
         ...
 
 
-class HomologousGroupMixin(BaseModel, ABC):
+class HomologousGroupMixin(BaseModel, ABC, defer_build=True):
     pre_definitions: dict[str, dict[str, Any]] | None = None
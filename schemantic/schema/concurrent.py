@@ -0,0 +1,145 @@
+"""
+Concurrent, fail-soft instantiation of the members of a schema.
+
+Members are constructed on an executor, a ThreadPoolExecutor by default, e.g. for origins that do I/O in their
+constructor; with a ProcessPoolExecutor, origins must be importable, and their configurations and instances
+picklable. Every member is attempted: the failures are raised together, keyed by member path, once all members
+are done. Results keep the order of `parse_schema_to_instance`.
+
+Member paths are the member name, prefixed by the mapping name of the homolog or group it belongs to, e.g.
+`my_homolog/copycat`; a single schema is identified by its mapping name alone.
+"""
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Type
+
+from schemantic.instrument import trace_phase
+from schemantic.utils.misc import ContentPool, update_assert_disjoint
+from schemantic.utils.typing import DefinedSchema
+
+if TYPE_CHECKING:
+    from schemantic.schema.abstract import BaseSchema, NotCultureSchema
+
+
+class _Member(NamedTuple):
+    name: str
+    origin: Type
+    config: dict[str, Any]
+
+
+class InstantiationErrorGroup(Exception):
+    """
+    Members that failed to instantiate.
+
+    path_to_error: dict[str, Exception]
+        Member path to the exception raised while instantiating it, in member order
+    instances: dict[str, Any]
+        The members that were instantiated, keyed as by `parse_schema_to_instance`
+    """
+
+    def __init__(self, path_to_error: dict[str, Exception], instances: dict[str, Any]) -> None:
+        self.path_to_error = path_to_error
+        self.instances = instances
+        lines = (f"  {path}: {type(error).__name__}: {error}" for path, error in path_to_error.items())
+        super().__init__(f"{len(path_to_error)} member(s) failed to instantiate:\n" + "\n".join(lines))
+
+    @property
+    def exceptions(self) -> list[Exception]:
+        return list(self.path_to_error.values())
+
+
+def _instantiate(origin: Type, config: dict[str, Any]) -> Any:
+    return origin(**config)
+
+
+def _source_members(source: "NotCultureSchema", defined_schema: DefinedSchema) -> dict[str, _Member]:
+    from schemantic.schema.main import SingleSchema
+
+    return {
+        name if isinstance(source, SingleSchema) else f"{source.mapping_name}/{name}": _Member(name, origin, config)
+        for name, (origin, config) in source.parse_schema_with_origin(defined_schema).items()
+    }
+
+
+def member_paths(schema: "BaseSchema", defined_schema: DefinedSchema) -> dict[str, tuple["NotCultureSchema", _Member]]:
+    """
+    Member path to the source schema of the member, and the member's name, origin, and configuration
+    """
+    from schemantic.schema.main import CultureSchema
+
+    if not isinstance(schema, CultureSchema):
+        return {path: (schema, member) for path, member in _source_members(schema, defined_schema).items()}
+
+    defined_schema = schema._make_sure_defined_schema_is_loaded(defined_schema)
+    result = {}
+    name_to_source: dict[str, str] = {}
+    for source in schema.source_schemas:
+        members = _source_members(source, defined_schema[source.mapping_name])
+        update_assert_disjoint(
+            name_to_source,
+            {member.name: source.mapping_name for member in members.values()},
+            f"{source.mapping_name} collides with the existing parsimony.",
+        )
+        result.update((path, (source, member)) for path, member in members.items())
+    return result
+
+
+def instantiate_concurrently(
+    schema: "BaseSchema",
+    defined_schema: DefinedSchema,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Instantiate every member of schema on executor.
+
+    Parameters
+    ----------
+    schema: BaseSchema
+    defined_schema: DefinedSchema
+    executor: Optional[Executor]
+        A ThreadPoolExecutor with max_workers, created and shut down for this call, by default
+    max_workers: Optional[int]
+        Of the default executor; ignored if executor is given
+
+    Returns
+    -------
+    dict[str, Any], as `parse_schema_to_instance`
+
+    Raises
+    ------
+    InstantiationErrorGroup, once every member was attempted, if any failed
+    """
+    path_to_source_member = member_paths(schema, defined_schema)
+
+    own_executor = executor is None
+    executor = executor or ThreadPoolExecutor(max_workers=max_workers)
+    instances: dict[str, Any] = {}
+    path_to_error: dict[str, Exception] = {}
+    try:
+        with trace_phase("instantiate", getattr(schema, "mapping_name", None)):
+            # Members of the same origin with equal configurations share their instance, see
+            # HomologSchema.share_frozen_instances
+            future_pool: ContentPool[Future] = ContentPool()
+            path_to_future: dict[str, Future] = {}
+            for path, (source, member) in path_to_source_member.items():
+                # Copied, as read-only views of deduplicated configurations do not pickle for process pools
+                submit = partial(executor.submit, _instantiate, member.origin, dict(member.config))
+                if getattr(source, "share_frozen_instances", False):
+                    path_to_future[path] = future_pool.setdefault((member.origin, member.config), submit)
+                else:
+                    path_to_future[path] = submit()
+
+            for path, future in path_to_future.items():
+                try:
+                    instances[path_to_source_member[path][1].name] = future.result()
+                except Exception as error:
+                    path_to_error[path] = error
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    if path_to_error:
+        raise InstantiationErrorGroup(path_to_error, instances)
+    return instances
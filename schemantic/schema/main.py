@@ -1,24 +1,49 @@
+import time
+from collections import Counter
 from collections.abc import Mapping, Set
-from functools import cached_property
-from typing import Any, Callable, Generic, Iterable, Optional, Type, TypeVar
+from concurrent.futures import Executor
+from functools import cached_property, partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Generic, Iterable, Iterator, NamedTuple, Optional, Type, TypeVar
 
 from ordered_set import OrderedSet
-from pydantic import BaseModel, computed_field, field_validator, model_validator, validate_call
-
-from schemantic.model.field_info import FieldMetadata, class_field_alias_to_type_string, model_field_alias_to_field_info
-from schemantic.model.schematic import Schematic
-from schemantic.project import SchemanticProjectMixin
+from pydantic import PrivateAttr, computed_field, field_validator, model_validator
+
+from schemantic.instrument import trace_phase, traced
+from schemantic.model.columns import ColumnarConfig
+from schemantic.model.diff import DefinedDiff, diff_layered_configs
+from schemantic.model.field_info import FieldMetadata
+from schemantic.model.names import NameSpec, name_spec_from_dict
+from schemantic.model.schematic import Schematic, extract_schematic
+from schemantic.model.snapshot import drop_defaults, factor_common, instance_to_config
+from schemantic.registry import registered_origins
 from schemantic.schema.abstract import BaseSchema, HomologousGroupMixin, NotCultureSchema, SingleHomologousSchema
+from schemantic.schema.pickling import NameGetterReference, is_carrying_schematics, reduce_name_getter
 from schemantic.utils.constant import (
     SCHEMA_DEFINED_MAPPING_KEY,
     SCHEMA_FIELD_INFO_MAPPING_KEY,
+    SCHEMA_INSTANCE_NAMES_KEY,
     SCHEMA_OPTIONAL_MAPPING_KEY,
     SCHEMA_REQUIRED_MAPPING_KEY,
+    SCHEMA_SHARDS_KEY,
+)
+from schemantic.utils.constructor import layered_constructor
+from schemantic.utils.file import dump_schema_file
+from schemantic.utils.index import defined_index, load_member, load_top_level, write_index
+from schemantic.utils.misc import (
+    ContentPool,
+    FrozenOrderedSet,
+    is_frozen_origin,
+    lazy_validate_call,
+    same_content,
+    update_assert_disjoint,
 )
-from schemantic.utils.misc import update_assert_disjoint
+from schemantic.utils.shard import ShardBy, dump_sharded_file, load_shards
 from schemantic.utils.typing import (
     DefinedSchema,
     NameToFieldMetadata,
+    NameToOriginConfig,
     NameToStrFieldMetadata,
     SchemaCommonMap,
     SchemaGroupMemberMap,
@@ -51,22 +76,28 @@ class SingleSchema(SingleHomologousSchema, Generic[T]):
     def mapping_name(self) -> str:
         return self.schema_alias or self.origin.__name__
 
+    def _reduced_state(self) -> dict[str, Any]:
+        result = super()._reduced_state()
+        if is_carrying_schematics() and "schematic" in self.__dict__:
+            result["schematic"] = self.__dict__["schematic"]
+        return result
+
+    @classmethod
+    def _from_reduced_state(cls, state: dict[str, Any]) -> "SingleSchema":
+        schematic = state.pop("schematic", None)
+        result = cls.model_construct(**state)
+        if schematic is not None:
+            result.__dict__["schematic"] = schematic
+        return result
+
     @computed_field(return_type=Schematic)  # type: ignore[misc]
     @cached_property
+    @traced("extract")
     def schematic(self) -> Schematic:
-        kwargs = {}
-        if issubclass(self.origin, SchemanticProjectMixin):
-            kwargs.update(self.origin.single_schema_kwargs)
-
-        required_optional_to_field_to_info = (
-            model_field_alias_to_field_info(self.origin, **kwargs)
-            if issubclass(self.origin, BaseModel)
-            else class_field_alias_to_type_string(self.origin, **kwargs)
-        )
-
-        return Schematic(class_name=self.origin.__name__, **required_optional_to_field_to_info)
+        return extract_schematic(self.origin)
 
-    @validate_call
+    @lazy_validate_call
+    @traced("render")
     def schema(
         self, with_defined: bool = False, **schematic_dict_kwargs
     ) -> dict[str, str | dict | list[str] | dict[str, str]]:
@@ -87,7 +118,8 @@ class SingleSchema(SingleHomologousSchema, Generic[T]):
 
         return result
 
-    @validate_call
+    @lazy_validate_call
+    @traced("parse")
     def parse_schema(
         self,
         defined_schema: DefinedSchema,
@@ -99,9 +131,10 @@ class SingleSchema(SingleHomologousSchema, Generic[T]):
         config_from_file = self._get_configuration_from_mapping(defined_schema, stored_in_defined=True)
         if not _inferior_config_kwargs:
             return config_from_file
-        return {**_inferior_config_kwargs, **config_from_file}
+        with trace_phase("merge", self.mapping_name):
+            return {**_inferior_config_kwargs, **config_from_file}
 
-    @validate_call
+    @lazy_validate_call
     def parse_schema_to_instance(
         self,
         defined_schema: DefinedSchema,
@@ -120,7 +153,67 @@ class SingleSchema(SingleHomologousSchema, Generic[T]):
         -------
 
         """
-        return {self.mapping_name: self.origin(**self.parse_schema(defined_schema))}
+        name_to_origin_config = self.parse_schema_with_origin(
+            defined_schema, _inferior_config_kwargs=_inferior_config_kwargs
+        )
+        with trace_phase("instantiate", self.mapping_name):
+            return {name: origin(**instance_kwargs) for name, (origin, instance_kwargs) in name_to_origin_config.items()}
+
+    @lazy_validate_call
+    def parse_schema_with_origin(
+        self,
+        defined_schema: DefinedSchema,
+        *,
+        _inferior_config_kwargs: Optional[dict[str, Any]] = None,
+    ) -> NameToOriginConfig:
+        return {
+            self.mapping_name: (
+                self.origin,
+                self.parse_schema(defined_schema, _inferior_config_kwargs=_inferior_config_kwargs),
+            )
+        }
+
+    @lazy_validate_call
+    def diff_defined(self, old_defined_schema: DefinedSchema, new_defined_schema: DefinedSchema) -> DefinedDiff:
+        old_config, new_config = (
+            self._get_configuration_from_mapping(
+                self._make_sure_defined_schema_is_loaded(defined_schema), stored_in_defined=True
+            )
+            for defined_schema in (old_defined_schema, new_defined_schema)
+        )
+        return diff_layered_configs(None, None, {self.mapping_name: old_config}, {self.mapping_name: new_config})
+
+    def defined_from_instances(self, instances: Mapping[str, Any], dump_path: Optional[Path] = None) -> dict[str, Any]:
+        config = instance_to_config(instances[self.mapping_name], self.schematic)
+        result = dict(class_name=self.origin.__name__)
+        result[SCHEMA_DEFINED_MAPPING_KEY] = drop_defaults(config, self.schematic, self.origin)
+        if dump_path:
+            dump_schema_file(result, dump_path)
+        return result
+
+
+class NameCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    uncacheable: int
+    size: int
+
+
+class DedupStats(NamedTuple):
+    members: int
+    unique: int
+
+    @property
+    def ratio(self) -> float:
+        """Members per distinct object; 1.0 means nothing is shared"""
+        return self.members / self.unique if self.unique else 1.0
+
+    @classmethod
+    def of(cls, name_to_value: Mapping[str, Any]) -> "DedupStats":
+        """
+        Count the distinct objects among the values of e.g. `parse_schema` or `parse_schema_to_instance`
+        """
+        return cls(members=len(name_to_value), unique=len({id(value) for value in name_to_value.values()}))
 
 
 class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
@@ -131,18 +224,51 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
 
     single_schema: SingleSchema
         The single schema to use a reference for the single origin
-    instances names: OrderedSet[str]
-        The name of each instance of the single schema
+    instances names: OrderedSet[str] | NameSpec
+        The name of each instance of the single schema, or a NameRange / NameProduct that stores them symbolically;
+        those are dumped as such under the instance_names key and expanded lazily on parsing
     name_getter: Optional[Callable[[...], OrderedSet[str]]]
         Function used to define names when `schema` is called.
         Specifically useful when passing the schema from a library.
+    fast_constructor: bool
+        Instantiate through a constructor generated for the origin, which takes the common and instance
+        configurations as they are instead of merging them first; see `schemantic.utils.constructor`.
+        Origins whose constructor takes *args or **kwargs, e.g. pydantic models, are instantiated as usual.
+    name_getter_cache_ttl: Optional[float]
+        Seconds to reuse the names collected for the same (hashable) name_getter_kwargs; `float("inf")` reuses them
+        until `refresh_names`. Names are collected anew on every call if None. At most `name_cache_max_size`
+        name_getter_kwargs are cached; expired and least recently collected ones are evicted first.
+    dedup: bool
+        Instances whose merged configurations are identical share a single, read-only (MappingProxyType), parsed
+        configuration; see `DedupStats`
+    share_frozen_instances: bool
+        Implies dedup; instances with identical configurations also share a single instance of the frozen origin
     """
 
     single_schema: SingleSchema[T]
-    instance_names: Optional[OrderedSet[str]] = None
+    instance_names: Optional[OrderedSet[str] | NameSpec] = None
     name_getter: Optional[Callable[[...], OrderedSet[str]]] = None
-
-    prohibited_keys = {"class_name", "common", SCHEMA_DEFINED_MAPPING_KEY, SCHEMA_FIELD_INFO_MAPPING_KEY}
+    fast_constructor: bool = False
+    name_getter_cache_ttl: Optional[float] = None
+    dedup: bool = False
+    share_frozen_instances: bool = False
+
+    _name_getter_kwargs_to_names: dict[frozenset, tuple[float, FrozenOrderedSet[str]]] = PrivateAttr(
+        default_factory=dict
+    )
+    _name_cache_counter: Counter = PrivateAttr(default_factory=Counter)
+    name_cache_max_size: ClassVar[int] = 128
+    # Cached names are combined from these, and dropped when either is replaced
+    _names_cached_from: ClassVar[frozenset[str]] = frozenset(("instance_names", "name_getter"))
+
+    prohibited_keys = {
+        "class_name",
+        "common",
+        SCHEMA_DEFINED_MAPPING_KEY,
+        SCHEMA_FIELD_INFO_MAPPING_KEY,
+        SCHEMA_INSTANCE_NAMES_KEY,
+        SCHEMA_SHARDS_KEY,
+    }
 
     def __hash__(self):
         return hash(self.single_schema)
@@ -171,6 +297,24 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
 
         return model
 
+    @model_validator(mode="after")
+    def frozen_origin_to_share_instances(self) -> "HomologSchema":
+        if self.share_frozen_instances and not is_frozen_origin(self.origin):
+            msg = f"Instances of {self.origin.__name__} can only be shared if it is frozen"
+            raise ValueError(msg)
+        return self
+
+    def _reduced_state(self) -> dict[str, Any]:
+        result = super()._reduced_state()
+        result["name_getter"] = reduce_name_getter(result.get("name_getter"))
+        return result
+
+    @classmethod
+    def _from_reduced_state(cls, state: dict[str, Any]) -> "HomologSchema":
+        if isinstance(state.get("name_getter"), NameGetterReference):
+            state["name_getter"] = state["name_getter"].resolve()
+        return cls.model_construct(**state)
+
     @computed_field(return_type=Type[T])  # type: ignore[misc]
     @property
     def origin(self) -> Type[T]:
@@ -181,8 +325,8 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
     def mapping_name(self) -> str:
         return self.schema_alias or self.single_schema.mapping_name
 
-    @validate_call
-    def homolog_names(self, name_getter_kwargs: Optional[Mapping[str, Any]] = None) -> OrderedSet[str]:
+    @lazy_validate_call
+    def homolog_names(self, name_getter_kwargs: Optional[Mapping[str, Any]] = None) -> OrderedSet[str] | NameSpec:
         """
         Collect all names by combining instance names and the callback from the name_getter
 
@@ -193,23 +337,95 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
 
         Returns
         -------
-        str, names of each single_schema instance
+        str, names of each single_schema instance; a read-only FrozenOrderedSet if cached, see name_getter_cache_ttl
         """
+        if not self.name_getter or not name_getter_kwargs or self.name_getter_cache_ttl is None:
+            return self._collect_homolog_names(name_getter_kwargs)
+
+        try:
+            key = frozenset(name_getter_kwargs.items())
+            hash(key)
+        except TypeError:
+            self._name_cache_counter["uncacheable"] += 1
+            return self._collect_homolog_names(name_getter_kwargs)
+
+        now = time.monotonic()
+        cached = self._name_getter_kwargs_to_names.get(key)
+        if cached and now - cached[0] < self.name_getter_cache_ttl:
+            self._name_cache_counter["hits"] += 1
+            return cached[1]
+
+        self._name_cache_counter["misses"] += 1
+        # Handed out to every caller until it expires
+        result = FrozenOrderedSet(self._collect_homolog_names(name_getter_kwargs))
+        self._evict_names(now)
+        self._name_getter_kwargs_to_names[key] = (now, result)
+        return result
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._names_cached_from:
+            self._name_getter_kwargs_to_names.clear()
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "HomologSchema":
+        # Private attributes are copied shallowly, and the update is written past __setattr__
+        result = super().model_copy(update=update, deep=deep)
+        result._name_getter_kwargs_to_names = {}
+        return result
+
+    def _evict_names(self, now: float) -> None:
+        """
+        Drop the expired names, then the least recently collected ones, to make room for one more entry
+        """
+        name_cache = self._name_getter_kwargs_to_names
+        ttl = self.name_getter_cache_ttl
+        expired = [key for key, (collected_at, _) in name_cache.items() if now - collected_at >= ttl]
+        for key in expired:
+            del name_cache[key]
+        # Entries are inserted as collected, hence oldest first
+        while len(name_cache) >= self.name_cache_max_size:
+            del name_cache[next(iter(name_cache))]
+
+    def refresh_names(self, name_getter_kwargs: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Drop the cached names of name_getter_kwargs, or of all name_getter_kwargs if None
+        """
+        if name_getter_kwargs is None:
+            self._name_getter_kwargs_to_names.clear()
+        else:
+            self._name_getter_kwargs_to_names.pop(frozenset(name_getter_kwargs.items()), None)
+
+    def name_cache_stats(self) -> NameCacheStats:
+        return NameCacheStats(
+            hits=self._name_cache_counter["hits"],
+            misses=self._name_cache_counter["misses"],
+            uncacheable=self._name_cache_counter["uncacheable"],
+            size=len(self._name_getter_kwargs_to_names),
+        )
+
+    def _collect_homolog_names(self, name_getter_kwargs: Optional[Mapping[str, Any]]) -> OrderedSet[str] | NameSpec:
         result = (
             self.instance_names
             if not self.name_getter or not name_getter_kwargs
             else OrderedSet((*self.name_getter(**name_getter_kwargs), *self.instance_names))
         )
-        if self._keys_to_not_parse and any(name in self._keys_to_not_parse for name in result):
+        keys_to_not_parse = self._keys_to_not_parse
+        if isinstance(result, NameSpec):
+            # Checked symbolically, without expanding the names
+            if any(key in result for key in keys_to_not_parse):
+                msg = f"Names generated by {result} overlap with the names that cannot be used: {keys_to_not_parse}"
+                raise AttributeError(msg)
+        elif keys_to_not_parse and any(name in keys_to_not_parse for name in result):
             msg = (
-                f"The names {self._keys_to_not_parse.intersection(result)} are not allowed. "
-                f"Set of names that cannot be used: {self._keys_to_not_parse}"
+                f"The names {keys_to_not_parse.intersection(result)} are not allowed. "
+                f"Set of names that cannot be used: {keys_to_not_parse}"
             )
             raise AttributeError(msg)
 
         return result
 
-    @validate_call
+    @lazy_validate_call
+    @traced("render")
     def schema(
         self, name_getter_kwargs: Optional[dict[str, Any]] = None, with_common: bool = True
     ) -> dict[str, str | dict | list[str] | NameToFieldMetadata]:
@@ -217,14 +433,107 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
         if with_common:
             result["common"] = {}
 
-        for name in self.homolog_names(name_getter_kwargs):
-            result[name] = self.pre_definitions[name] if self.pre_definitions and name in self.pre_definitions else {}
+        names = self.homolog_names(name_getter_kwargs)
+        if isinstance(names, NameSpec):
+            result[SCHEMA_INSTANCE_NAMES_KEY] = names.to_dict()
+            if self.pre_definitions:
+                result.update((name, config) for name, config in self.pre_definitions.items() if name in names)
+        else:
+            for name in names:
+                result[name] = (
+                    self.pre_definitions[name] if self.pre_definitions and name in self.pre_definitions else {}
+                )
 
         result.update(self.single_schema.schematic.schema_dict_field_info_extracted(with_class_name=False))
 
         return result
 
-    @validate_call
+    @lazy_validate_call
+    def dump(
+        self,
+        dump_path: Path,
+        *,
+        shard_count: Optional[int] = None,
+        shard_by: ShardBy = "count",
+        with_index: bool = False,
+        **schema_kwargs,
+    ) -> None:
+        """
+        Dump the schema; with shard_count, the instances are spread over that many shard files next to dump_path,
+        which holds everything else; see `schemantic.utils.shard`. Hash sharding allows loading the shard of a
+        single name on its own.
+        """
+        if not shard_count:
+            return super().dump(dump_path, with_index=with_index, **schema_kwargs)
+
+        schema = self.schema(**schema_kwargs)
+        keys_to_not_parse = self._keys_to_not_parse
+        dump_sharded_file(
+            {key: value for key, value in schema.items() if key in keys_to_not_parse},
+            {name: config for name, config in schema.items() if name not in keys_to_not_parse},
+            dump_path,
+            shard_count,
+            shard_by,
+        )
+        if with_index:
+            write_index(dump_path)
+
+    def load_sharded(
+        self,
+        defined_path: Path,
+        names: Optional[Iterable[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> dict[str, Any]:
+        """
+        Load a defined file, merging its shards, if any, which are read concurrently.
+
+        Parameters
+        ----------
+        defined_path: Path
+        names: Optional[Iterable[str]]
+            Only keep the configurations of these names, e.g. to parse a few instances of a large homolog;
+            for hash sharded files, only their shards are read
+        executor: Optional[Executor]
+            Reads the shards, see `schemantic.utils.shard.load_shards`
+
+        Returns
+        -------
+        dict[str, Any], the defined schema
+        """
+        if names is None:
+            result = self.load(defined_path)
+            return load_shards(defined_path, result, None, executor) if SCHEMA_SHARDS_KEY in result else result
+
+        names = OrderedSet(names)
+        keys_to_not_parse = self._keys_to_not_parse
+        if (index := defined_index(defined_path)) is not None:
+            # Only decode the regions of the names, see `schemantic.utils.index`
+            result = load_top_level(
+                defined_path, [key for key in index.spans if key in keys_to_not_parse or key in names]
+            )
+        else:
+            result = self.load(defined_path)
+
+        if SCHEMA_SHARDS_KEY in result:
+            result = load_shards(defined_path, result, names, executor)
+        return self._keep_names(result, names)
+
+    def _keep_names(self, defined_schema: dict[str, Any], names: OrderedSet[str]) -> dict[str, Any]:
+        """
+        Only the configurations of names, with names under the instance_names key expanded
+        """
+        keys_to_not_parse = self._keys_to_not_parse
+        result = {key: value for key, value in defined_schema.items() if key in keys_to_not_parse or key in names}
+        if SCHEMA_INSTANCE_NAMES_KEY in result:
+            names_spec = name_spec_from_dict(result.pop(SCHEMA_INSTANCE_NAMES_KEY))
+            for name in names:
+                if name in names_spec:
+                    result.setdefault(name, {})
+
+        return result
+
+    @lazy_validate_call
+    @traced("parse")
     def parse_schema(
         self,
         defined_schema: DefinedSchema,
@@ -235,24 +544,30 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
 
         config = self._get_configuration_from_mapping(defined_schema, stored_in_defined=False)
         result = {}
-        for name in config:
-            if name in self._keys_to_not_parse:
-                continue
-
-            pre_specific_config = {**config["common"], **config[name]}
-
-            result[name] = (
-                {**_inferior_config_kwargs, **pre_specific_config} if _inferior_config_kwargs else pre_specific_config
-            )
+        config_pool: Optional[ContentPool[Mapping[str, Any]]] = (
+            ContentPool() if self.dedup or self.share_frozen_instances else None
+        )
+        with trace_phase("merge", self.mapping_name):
+            for name, instance_config in self._name_to_instance_config(config):
+                pre_specific_config = {**config["common"], **instance_config}
+
+                result[name] = (
+                    {**_inferior_config_kwargs, **pre_specific_config}
+                    if _inferior_config_kwargs
+                    else pre_specific_config
+                )
+                if config_pool is not None:
+                    # Shared under several names, hence read-only
+                    result[name] = config_pool.setdefault(result[name], partial(MappingProxyType, result[name]))
 
         return result
 
-    @validate_call
+    @lazy_validate_call
     def parse_schema_to_instance(
-            self,
-            defined_schema: DefinedSchema,
-            *,
-            _inferior_config_kwargs: Optional[dict[str, Any]] = None,
+        self,
+        defined_schema: DefinedSchema,
+        *,
+        _inferior_config_kwargs: Optional[dict[str, Any]] = None,
     ) -> dict[str, T]:
         """
         Note that SingleSchema uses its sole mapping_name as name here; dict with a single key-value pair
@@ -266,15 +581,145 @@ class HomologSchema(HomologousGroupMixin, SingleHomologousSchema, Generic[T]):
         -------
 
         """
+        if self.fast_constructor and (construct := layered_constructor(self.origin, 3)):
+            defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
+            config = self._get_configuration_from_mapping(defined_schema, stored_in_defined=False)
+            inferior_config, common_config = _inferior_config_kwargs or {}, config["common"]
+            with trace_phase("instantiate", self.mapping_name):
+                if not self.share_frozen_instances:
+                    return {
+                        name: construct(inferior_config, common_config, instance_config)
+                        for name, instance_config in self._name_to_instance_config(config)
+                    }
+
+                result = {}
+                instance_pool: ContentPool[T] = ContentPool()
+                for name, instance_config in self._name_to_instance_config(config):
+                    result[name] = instance_pool.setdefault(
+                        {**inferior_config, **common_config, **instance_config},
+                        partial(construct, inferior_config, common_config, instance_config),
+                    )
+                return result
+
+        name_to_origin_config = self.parse_schema_with_origin(
+            defined_schema, _inferior_config_kwargs=_inferior_config_kwargs
+        )
+        with trace_phase("instantiate", self.mapping_name):
+            if not self.share_frozen_instances:
+                return {
+                    name: origin(**instance_kwargs) for name, (origin, instance_kwargs) in name_to_origin_config.items()
+                }
+
+            instance_pool: ContentPool[T] = ContentPool()
+            return {
+                name: instance_pool.setdefault(instance_kwargs, partial(origin, **instance_kwargs))
+                for name, (origin, instance_kwargs) in name_to_origin_config.items()
+            }
+
+    @lazy_validate_call
+    def parse_schema_with_origin(
+        self,
+        defined_schema: DefinedSchema,
+        *,
+        _inferior_config_kwargs: Optional[dict[str, Any]] = None,
+    ) -> NameToOriginConfig:
         return {
-            name: self.origin(**instance_kwargs) for name, instance_kwargs in self.parse_schema(defined_schema).items()
+            name: (self.origin, instance_kwargs)
+            for name, instance_kwargs in self.parse_schema(
+                defined_schema, _inferior_config_kwargs=_inferior_config_kwargs
+            ).items()
         }
 
+    @lazy_validate_call
+    def diff_defined(self, old_defined_schema: DefinedSchema, new_defined_schema: DefinedSchema) -> DefinedDiff:
+        """
+        Members added, removed, or with a changed effective configuration between two versions of a defined schema.
+        A change to common is reported on every member it affects.
+        """
+        old_config, new_config = (
+            self._get_configuration_from_mapping(
+                self._make_sure_defined_schema_is_loaded(defined_schema), stored_in_defined=False
+            )
+            for defined_schema in (old_defined_schema, new_defined_schema)
+        )
+        return diff_layered_configs(
+            old_config.get("common"),
+            new_config.get("common"),
+            dict(self._name_to_instance_config(old_config)),
+            dict(self._name_to_instance_config(new_config)),
+        )
+
+    @lazy_validate_call
+    def to_columns(self, defined_schema: DefinedSchema) -> ColumnarConfig:
+        """
+        One column per field over the instance names, see `schemantic.model.columns`. Fields that are only set in
+        common are broadcast without copying.
+        """
+        defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
+        config = self._get_configuration_from_mapping(defined_schema, stored_in_defined=False)
+        name_to_instance_config = dict(self._name_to_instance_config(config))
+        return ColumnarConfig.from_layers(config["common"], name_to_instance_config, name_to_instance_config)
+
+    def defined_from_columns(self, columnar_config: ColumnarConfig, dump_path: Optional[Path] = None) -> dict[str, Any]:
+        """
+        Reverse of to_columns: broadcast columns go to common, and the other values to the instances.
+
+        Parameters
+        ----------
+        columnar_config: ColumnarConfig
+        dump_path: Optional[Path]
+            Also dump the defined schema here
+
+        Returns
+        -------
+        dict[str, Any], the defined schema
+        """
+        common, name_to_instance_config = columnar_config.to_layers()
+        result = dict(class_name=self.origin.__name__, common=common, **name_to_instance_config)
+        if dump_path:
+            dump_schema_file(result, dump_path)
+        return result
+
+    def defined_from_instances(self, instances: Mapping[str, Any], dump_path: Optional[Path] = None) -> dict[str, Any]:
+        schematic = self.single_schema.schematic
+        common, name_to_instance_config = factor_common(
+            {
+                name: drop_defaults(instance_to_config(instance, schematic), schematic, self.origin)
+                for name, instance in instances.items()
+            }
+        )
+        result = dict(class_name=self.origin.__name__, common=common, **name_to_instance_config)
+        if dump_path:
+            dump_schema_file(result, dump_path)
+        return result
+
+    @lazy_validate_call
+    def _make_sure_defined_schema_is_loaded(self, defined_schema: DefinedSchema) -> dict[str, Any]:
+        if isinstance(defined_schema, Path):
+            with trace_phase("load", self.mapping_name):
+                return self.load_sharded(defined_schema)
+        return defined_schema
+
+    def _name_to_instance_config(self, config: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Instance configurations of a defined homolog; names under the instance_names key are expanded lazily
+        and default to an empty configuration
+        """
+        keys_to_not_parse = self._keys_to_not_parse
+        names = name_spec_from_dict(config[SCHEMA_INSTANCE_NAMES_KEY]) if SCHEMA_INSTANCE_NAMES_KEY in config else ()
+        empty_config: dict[str, Any] = {}
+        for name in names:
+            yield name, config.get(name, empty_config)
+
+        for name, instance_config in config.items():
+            if name not in keys_to_not_parse and name not in names:
+                yield name, instance_config
+
     @classmethod
     def from_originating_type(
         cls,
         origin: Type[T],
-        instance_names: Optional[OrderedSet[str]] = None,
+        instance_names: Optional[OrderedSet[str] | NameSpec] = None,
         name_getter: Optional[Callable[[...], OrderedSet[str]]] = None,
     ) -> "HomologSchema":
         return cls(single_schema=SingleSchema(origin=origin), instance_names=instance_names, name_getter=name_getter)
@@ -290,12 +735,49 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
 
     prohibited_keys = {"common", SCHEMA_FIELD_INFO_MAPPING_KEY}
 
+    # Indexes of the members, cached until single_schemas is replaced; it is kept as a FrozenOrderedSet, as the
+    # indexes would go stale if it were changed in place
+    _member_indexes: ClassVar[tuple[str, ...]] = (
+        "schema_mapping_name_to_instance_schema",
+        "member_label_to_origin",
+        "origin_to_instance_schemas",
+    )
+    _hash: Optional[int] = PrivateAttr(default=None)
+
     def __hash__(self):
-        return hash(frozenset(self.single_schemas))
+        if self._hash is None:
+            self._hash = hash(frozenset(self.single_schemas))
+        return self._hash
+
+    def _invalidate_member_caches(self) -> None:
+        self._hash = None
+        for member_index in self._member_indexes:
+            self.__dict__.pop(member_index, None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "single_schemas":
+            value = FrozenOrderedSet(value)
+        super().__setattr__(name, value)
+        if name == "single_schemas":
+            self._invalidate_member_caches()
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "GroupSchema":
+        # The update is written to the copy's __dict__ directly, past __setattr__ and validation
+        replaces_members = bool(update) and "single_schemas" in update
+        if replaces_members:
+            update = {**update, "single_schemas": FrozenOrderedSet(update["single_schemas"])}
+        result = super().model_copy(update=update, deep=deep)
+        if replaces_members:
+            result._invalidate_member_caches()
+        return result
 
     def __eq__(self, other: "GroupSchema") -> bool:
         return self.single_schemas == other.single_schemas
 
+    @field_validator("single_schemas")
+    def single_schemas_frozen(cls, value):
+        return FrozenOrderedSet(value)
+
     @field_validator("single_schemas")
     def single_schemas_do_not_map_from_prohibited_keys(cls, value):
         if cls.prohibited_keys:
@@ -320,10 +802,17 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
         return value
 
     @computed_field(return_type=dict[str, SingleSchema])  # type: ignore[misc]
-    @property
+    @cached_property
     def schema_mapping_name_to_instance_schema(self) -> dict[str, SingleSchema]:
         return {schema.mapping_name: schema for schema in self.single_schemas}
 
+    @cached_property
+    def origin_to_instance_schemas(self) -> dict[Type, list[SingleSchema]]:
+        result: dict[Type, list[SingleSchema]] = {}
+        for schema in self.single_schemas:
+            result.setdefault(schema.origin, []).append(schema)
+        return result
+
     @computed_field(return_type=dict[str, Type])
     @cached_property
     def member_label_to_origin(self) -> dict[str, Type]:
@@ -339,7 +828,8 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
         if isinstance(self.single_schemas, Set):
             return {model_schema.origin.__name__: model_schema.origin for alias, model_schema in self.single_schemas}
 
-    @validate_call
+    @lazy_validate_call
+    @traced("render")
     def schema_with_field_metadata(
         self,
         with_defined: bool = True,
@@ -381,7 +871,7 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
                         if field in common_field_to_info:
                             common_field_to_info[field].merge_owner_to_default_with_other(other_info)
                         else:
-                            common_field_to_info[field] = other_info
+                            common_field_to_info[field] = other_info.merge_tracker()
 
         result = {}
 
@@ -415,7 +905,7 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
 
         return result
 
-    @validate_call
+    @lazy_validate_call
     def schema(
         self,
         with_defined: bool = True,
@@ -432,7 +922,8 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
         }
         return result
 
-    @validate_call
+    @lazy_validate_call
+    @traced("parse")
     def parse_schema(
         self,
         defined_schema: DefinedSchema,
@@ -442,34 +933,146 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
         defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
 
         config = self._get_configuration_from_mapping(defined_schema, stored_in_defined=False)
+        keys_to_not_parse = self._keys_to_not_parse
         result = {}
-        for name, model_schema in self.schema_mapping_name_to_instance_schema.items():
-            if name in self._keys_to_not_parse:
-                continue
+        with trace_phase("merge", self.mapping_name):
+            for name, model_schema in self.schema_mapping_name_to_instance_schema.items():
+                if name in keys_to_not_parse:
+                    continue
 
-            specific_config = {}
-            if _inferior_config_kwargs:
-                specific_config.update(_inferior_config_kwargs)
-            if "common" in config:
-                specific_config.update(config["common"][SCHEMA_DEFINED_MAPPING_KEY])
-            specific_config.update(config[name][SCHEMA_DEFINED_MAPPING_KEY])
+                specific_config = {}
+                if _inferior_config_kwargs:
+                    specific_config.update(_inferior_config_kwargs)
+                if "common" in config:
+                    specific_config.update(config["common"][SCHEMA_DEFINED_MAPPING_KEY])
+                specific_config.update(config[name][SCHEMA_DEFINED_MAPPING_KEY])
 
-            result[name] = specific_config
+                result[name] = specific_config
 
         return result
 
-    @validate_call
+    @lazy_validate_call
     def parse_schema_to_instance(
         self,
         defined_schema: DefinedSchema,
         *,
         _inferior_config_kwargs: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
+        name_to_origin_config = self.parse_schema_with_origin(
+            defined_schema, _inferior_config_kwargs=_inferior_config_kwargs
+        )
+        with trace_phase("instantiate", self.mapping_name):
+            return {name: origin(**instance_kwargs) for name, (origin, instance_kwargs) in name_to_origin_config.items()}
+
+    @lazy_validate_call
+    def parse_schema_with_origin(
+        self,
+        defined_schema: DefinedSchema,
+        *,
+        _inferior_config_kwargs: Optional[dict[str, Any]] = None,
+    ) -> NameToOriginConfig:
         return {
-            name: self.member_label_to_origin[name](**instance_kwargs)
-            for name, instance_kwargs in self.parse_schema(defined_schema).items()
+            name: (self.member_label_to_origin[name], instance_kwargs)
+            for name, instance_kwargs in self.parse_schema(
+                defined_schema, _inferior_config_kwargs=_inferior_config_kwargs
+            ).items()
         }
 
+    @lazy_validate_call
+    def diff_defined(self, old_defined_schema: DefinedSchema, new_defined_schema: DefinedSchema) -> DefinedDiff:
+        """
+        Members added, removed, or with a changed effective configuration between two versions of a defined schema.
+        A change to common is reported on every member it affects.
+        """
+        old_config, new_config = (
+            self._get_configuration_from_mapping(
+                self._make_sure_defined_schema_is_loaded(defined_schema), stored_in_defined=False
+            )
+            for defined_schema in (old_defined_schema, new_defined_schema)
+        )
+        return diff_layered_configs(
+            old_config["common"][SCHEMA_DEFINED_MAPPING_KEY] if "common" in old_config else None,
+            new_config["common"][SCHEMA_DEFINED_MAPPING_KEY] if "common" in new_config else None,
+            {
+                name: old_config[name][SCHEMA_DEFINED_MAPPING_KEY]
+                for name in self.schema_mapping_name_to_instance_schema
+                if name in old_config
+            },
+            {
+                name: new_config[name][SCHEMA_DEFINED_MAPPING_KEY]
+                for name in self.schema_mapping_name_to_instance_schema
+                if name in new_config
+            },
+        )
+
+    @lazy_validate_call
+    def to_columns(self, defined_schema: DefinedSchema) -> dict[str, ColumnarConfig]:
+        """
+        Per origin name, one column per field over the members of that origin; see `HomologSchema.to_columns`
+        """
+        defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
+        config = self._get_configuration_from_mapping(defined_schema, stored_in_defined=False)
+        common = config["common"][SCHEMA_DEFINED_MAPPING_KEY] if "common" in config else {}
+
+        origin_name_to_member_names: dict[str, list[str]] = {}
+        for name, single_schema in self.schema_mapping_name_to_instance_schema.items():
+            origin_name_to_member_names.setdefault(single_schema.origin.__name__, []).append(name)
+
+        name_to_member_config = {
+            name: config[name][SCHEMA_DEFINED_MAPPING_KEY]
+            for names in origin_name_to_member_names.values()
+            for name in names
+            if name in config
+        }
+        return {
+            origin_name: ColumnarConfig.from_layers(common, names, name_to_member_config)
+            for origin_name, names in origin_name_to_member_names.items()
+        }
+
+    def defined_from_columns(
+        self, origin_name_to_columns: Mapping[str, ColumnarConfig], dump_path: Optional[Path] = None
+    ) -> dict[str, Any]:
+        """
+        Reverse of to_columns; the values every member shares, across origins, go to common
+        """
+        name_to_member_config = {}
+        for columnar_config in origin_name_to_columns.values():
+            common, name_to_origin_member_config = columnar_config.to_layers()
+            for name, member_config in name_to_origin_member_config.items():
+                name_to_member_config[name] = {**common, **member_config}
+
+        common, name_to_member_config = factor_common(name_to_member_config)
+        result: dict[str, Any] = {"common": {SCHEMA_DEFINED_MAPPING_KEY: common}}
+        for name, member_config in name_to_member_config.items():
+            result[name] = {SCHEMA_DEFINED_MAPPING_KEY: member_config}
+        if dump_path:
+            dump_schema_file(result, dump_path)
+        return result
+
+    def defined_from_instances(self, instances: Mapping[str, Any], dump_path: Optional[Path] = None) -> dict[str, Any]:
+        name_to_instance_schema = self.schema_mapping_name_to_instance_schema
+        name_to_member_config = {}
+        for name, instance in instances.items():
+            if name not in name_to_instance_schema:
+                msg = f"{name} is not a member of {self.mapping_name}"
+                raise ValueError(msg)
+
+            single_schema = name_to_instance_schema[name]
+            name_to_member_config[name] = drop_defaults(
+                instance_to_config(instance, single_schema.schematic), single_schema.schematic, single_schema.origin
+            )
+
+        common, name_to_member_config = factor_common(name_to_member_config)
+        result: dict[str, Any] = {"common": {SCHEMA_DEFINED_MAPPING_KEY: common}}
+        for name, member_config in name_to_member_config.items():
+            result[name] = {
+                "class_name": name_to_instance_schema[name].origin.__name__,
+                SCHEMA_DEFINED_MAPPING_KEY: member_config,
+            }
+        if dump_path:
+            dump_schema_file(result, dump_path)
+        return result
+
     @classmethod
     def from_originating_types(cls, origins: Iterable[Type] | Mapping[str, Type], **kwargs) -> "GroupSchema":
         return cls(
@@ -481,11 +1084,19 @@ class GroupSchema(HomologousGroupMixin, NotCultureSchema):
             **kwargs,
         )
 
+    @classmethod
+    def from_registry(cls, base: Optional[Type] = None, **kwargs) -> "GroupSchema":
+        """
+        Group every registered origin, optionally only the subclasses of base; see schemantic.registry
+        """
+        return cls.from_originating_types(registered_origins(base), **kwargs)
+
 
 class CultureSchema(BaseSchema):
     source_schemas: OrderedSet[NotCultureSchema]
 
-    @validate_call
+    @lazy_validate_call
+    @traced("render")
     def schema(
         self,
         with_global_common: bool = True,
@@ -511,7 +1122,7 @@ class CultureSchema(BaseSchema):
                 if new_field in fields:
                     fields[new_field].merge_owner_to_default_with_other(new_field_info)
                 else:
-                    fields[new_field] = new_field_info
+                    fields[new_field] = new_field_info.merge_tracker()
 
         result = {}
         fields: dict[str, FieldMetadata] = {}
@@ -564,7 +1175,8 @@ class CultureSchema(BaseSchema):
 
         return result
 
-    @validate_call
+    @lazy_validate_call
+    @traced("parse")
     def parse_schema(self, defined_schema: DefinedSchema, keep_mapping_names: bool = True) -> dict[str, dict[str, Any]]:
         defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
         result = {}
@@ -583,7 +1195,52 @@ class CultureSchema(BaseSchema):
 
         return result
 
-    @validate_call
+    def load_source(
+        self, defined_path: Path, mapping_name: str, names: Optional[Iterable[str]] = None
+    ) -> dict[str, Any]:
+        """
+        Load the subtree of a single source schema from a defined file, decoding only its region if the file is
+        indexed; see `schemantic.utils.index`.
+
+        Parameters
+        ----------
+        defined_path: Path
+        mapping_name: str
+            Of the source schema
+        names: Optional[Iterable[str]]
+            Only keep the configurations of these instances of a homolog source
+
+        Returns
+        -------
+        dict[str, Any], to parse with the source schema
+        """
+        with trace_phase("load", mapping_name):
+            if names is None:
+                return load_member(defined_path, mapping_name)
+
+            source = next((source for source in self.source_schemas if source.mapping_name == mapping_name), None)
+            if not isinstance(source, HomologSchema):
+                msg = f"names only apply to homolog sources, not to {mapping_name}"
+                raise ValueError(msg)
+
+            names = OrderedSet(names)
+            return source._keep_names(
+                load_member(defined_path, mapping_name, nested_keys=(*source._keys_to_not_parse, *names)), names
+            )
+
+    def parse_source_to_instance(
+        self, defined_path: Path, mapping_name: str, names: Optional[Iterable[str]] = None
+    ) -> dict[str, Any]:
+        """
+        Instances of a single source schema, loaded with `load_source`
+        """
+        source = next((source for source in self.source_schemas if source.mapping_name == mapping_name), None)
+        if source is None:
+            msg = f"{mapping_name} is not a source schema"
+            raise ValueError(msg)
+        return source.parse_schema_to_instance(self.load_source(defined_path, mapping_name, names))
+
+    @lazy_validate_call
     def parse_schema_to_instance(self, defined_schema: DefinedSchema) -> dict[str, Any]:
         defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
 
@@ -596,3 +1253,68 @@ class CultureSchema(BaseSchema):
             )
 
         return result
+
+    @lazy_validate_call
+    def parse_schema_with_origin(self, defined_schema: DefinedSchema) -> NameToOriginConfig:
+        defined_schema = self._make_sure_defined_schema_is_loaded(defined_schema)
+
+        result = {}
+        for model_schema in self.source_schemas:
+            update_assert_disjoint(
+                result,
+                model_schema.parse_schema_with_origin(defined_schema[model_schema.mapping_name]),
+                f"{model_schema.mapping_name} collides with the existing parsimony.",
+            )
+
+        return result
+
+    @lazy_validate_call
+    def diff_defined(self, old_defined_schema: DefinedSchema, new_defined_schema: DefinedSchema) -> DefinedDiff:
+        """
+        Members added, removed, or with a changed effective configuration between two versions of a defined schema.
+        Source schemas whose subtree is unchanged are skipped without being parsed.
+        """
+        old_defined_schema = self._make_sure_defined_schema_is_loaded(old_defined_schema)
+        new_defined_schema = self._make_sure_defined_schema_is_loaded(new_defined_schema)
+
+        result = DefinedDiff()
+        for model_schema in self.source_schemas:
+            old_config = old_defined_schema.get(model_schema.mapping_name)
+            new_config = new_defined_schema.get(model_schema.mapping_name)
+
+            if old_config is not None and new_config is not None:
+                if not same_content(old_config, new_config):
+                    result.update(model_schema.diff_defined(old_config, new_config))
+            elif new_config is not None:
+                result.added.extend(model_schema.parse_schema_with_origin(new_config))
+            elif old_config is not None:
+                result.removed.extend(model_schema.parse_schema_with_origin(old_config))
+
+        return result
+
+    def defined_from_instances(self, instances: Mapping[str, Any], dump_path: Optional[Path] = None) -> dict[str, Any]:
+        result = {}
+        remaining = dict(instances)
+        for model_schema in self.source_schemas:
+            if isinstance(model_schema, SingleSchema):
+                names: Iterable[str] = (model_schema.mapping_name,)
+            elif isinstance(model_schema, HomologSchema):
+                homolog_names = model_schema.homolog_names()
+                names = [name for name in remaining if name in homolog_names]
+            elif isinstance(model_schema, GroupSchema):
+                names = model_schema.schema_mapping_name_to_instance_schema
+            else:
+                msg = f"{model_schema.__class__} is not supported"
+                raise NotImplementedError(msg)
+
+            source_instances = {name: remaining.pop(name) for name in names if name in remaining}
+            if source_instances:
+                result[model_schema.mapping_name] = model_schema.defined_from_instances(source_instances)
+
+        if remaining:
+            msg = f"{', '.join(remaining)} are not members of any source schema"
+            raise ValueError(msg)
+
+        if dump_path:
+            dump_schema_file(result, dump_path)
+        return result
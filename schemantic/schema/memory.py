@@ -0,0 +1,161 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from pydantic import BaseModel, Field
+
+from schemantic.utils.memory import deep_sizeof, deep_sizeof_all
+from schemantic.utils.misc import content_digest
+from schemantic.utils.typing import DefinedSchema
+
+if TYPE_CHECKING:
+    from schemantic.schema.abstract import BaseSchema
+    from schemantic.schema.main import SingleSchema
+
+
+class DuplicateStructure(BaseModel, defer_build=True):
+    """
+    Equal, but separately allocated, structures that could be shared.
+    """
+
+    category: str
+    members: list[str]
+    bytes_each: int
+
+    @property
+    def wasted_bytes(self) -> int:
+        return self.bytes_each * (len(self.members) - 1)
+
+
+class MemoryReport(BaseModel, defer_build=True):
+    """
+    Retained memory in bytes, broken down by category and by member. Objects shared between members or categories
+    are attributed once, to the first one counted, in the order: field_metadata, schematic, schema (the schema
+    objects themselves, e.g. names and pre_definitions), defined, parsed_config, instance.
+    """
+
+    by_category: dict[str, int] = Field(default_factory=dict)
+    by_member: dict[str, int] = Field(default_factory=dict)
+    duplicates: list[DuplicateStructure] = Field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_category.values())
+
+    @property
+    def wasted_bytes(self) -> int:
+        return sum(duplicate.wasted_bytes for duplicate in self.duplicates)
+
+    def format(self, top: int = 20) -> str:
+        lines = [f"total: {self.total} B, sharable: {self.wasted_bytes} B", "by category:"]
+        lines.extend(f"  {category:<16} {size:>12} B" for category, size in self.by_category.items())
+        lines.append("by member:")
+        lines.extend(
+            f"  {member:<32} {size:>12} B"
+            for member, size in sorted(self.by_member.items(), key=lambda kv: -kv[1])[:top]
+        )
+        if self.duplicates:
+            lines.append("duplicates:")
+            lines.extend(
+                f"  {duplicate.category:<16} x{len(duplicate.members):<6} {duplicate.wasted_bytes:>12} B sharable "
+                f"({', '.join(duplicate.members[:3])}{', ...' if len(duplicate.members) > 3 else ''})"
+                for duplicate in sorted(self.duplicates, key=lambda d: -d.wasted_bytes)[:top]
+            )
+        return "\n".join(lines)
+
+
+def _single_schemas(schema: "BaseSchema") -> list["SingleSchema"]:
+    from schemantic.schema.main import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+
+    if isinstance(schema, SingleSchema):
+        return [schema]
+    if isinstance(schema, HomologSchema):
+        return [schema.single_schema]
+    if isinstance(schema, GroupSchema):
+        return list(schema.single_schemas)
+    if isinstance(schema, CultureSchema):
+        return [single for source in schema.source_schemas for single in _single_schemas(source)]
+
+    msg = f"{schema.__class__} is not supported"
+    raise NotImplementedError(msg)
+
+
+def _duplicates(category: str, name_to_structure: dict[str, Any]) -> list[DuplicateStructure]:
+    digest_to_names: dict[str, list[str]] = defaultdict(list)
+    digest_to_ids: dict[str, set[int]] = defaultdict(set)
+    for name, structure in name_to_structure.items():
+        digest = content_digest(structure)
+        digest_to_names[digest].append(name)
+        digest_to_ids[digest].add(id(structure))
+
+    result = []
+    for digest, names in digest_to_names.items():
+        if len(digest_to_ids[digest]) > 1:
+            result.append(
+                DuplicateStructure(
+                    category=category, members=names, bytes_each=deep_sizeof(name_to_structure[names[0]], set())
+                )
+            )
+    return result
+
+
+def memory_report(
+    schema: "BaseSchema",
+    defined_schema: Optional[DefinedSchema] = None,
+    instances: Optional[Mapping[str, Any]] = None,
+) -> MemoryReport:
+    """
+    Estimate retained memory with sys.getsizeof, walking every referenced object once.
+
+    Parameters
+    ----------
+    schema: BaseSchema
+    defined_schema: Optional[DefinedSchema]
+        Also account for the defined document and the configurations parsed from it
+    instances: Optional[Mapping[str, Any]]
+        Also account for instances, e.g. the result of `parse_schema_to_instance`
+
+    Returns
+    -------
+    MemoryReport
+    """
+    report = MemoryReport()
+    by_category: dict[str, int] = defaultdict(int)
+    by_member: dict[str, int] = defaultdict(int)
+    seen: set[int] = set()
+
+    single_schemas = _single_schemas(schema)
+    for single in single_schemas:
+        # Only schematics that were already extracted are retained
+        if schematic := single.__dict__.get("schematic"):
+            size = deep_sizeof_all(schematic.field_to_info.values(), seen)
+            by_category["field_metadata"] += size
+            by_member[single.mapping_name] += size
+
+            size = deep_sizeof(schematic, seen)
+            by_category["schematic"] += size
+            by_member[single.mapping_name] += size
+
+    by_category["schema"] += deep_sizeof(schema, seen)
+
+    if defined_schema is not None:
+        defined_schema = schema._make_sure_defined_schema_is_loaded(defined_schema)
+        by_category["defined"] += deep_sizeof(defined_schema, seen)
+
+        name_to_config = {
+            name: config for name, (_origin, config) in schema.parse_schema_with_origin(defined_schema).items()
+        }
+        for name, config in name_to_config.items():
+            size = deep_sizeof(config, seen)
+            by_category["parsed_config"] += size
+            by_member[name] += size
+        report.duplicates.extend(_duplicates("parsed_config", name_to_config))
+
+    if instances:
+        for name, instance in instances.items():
+            size = deep_sizeof(instance, seen)
+            by_category["instance"] += size
+            by_member[name] += size
+
+    report.by_category = dict(by_category)
+    report.by_member = dict(by_member)
+    return report
@@ -0,0 +1,73 @@
+"""
+Compact pickling of schemas, e.g. to ship them to ProcessPoolExecutor workers.
+
+Schemas pickle only their declared fields and are restored without re-validation; origins are pickled by import path,
+like any class. Cached schematics are left behind, to be extracted again in the worker, unless pickled within
+`carrying_schematics()`. A name_getter that cannot be pickled by reference, e.g. a lambda, travels by the name it was
+registered under with `schemantic.registry.register_name_getter`.
+
+Usage:
+    register_name_getter(lambda **kwargs: OrderedSet(...), name="fleet")
+    with carrying_schematics():
+        payload = pickle.dumps(culture)
+"""
+
+import pickle
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional, Type
+
+from schemantic.registry import name_getter_name, registered_name_getter
+
+if TYPE_CHECKING:
+    from schemantic.schema.abstract import BaseSchema
+
+_carry_schematics: ContextVar[bool] = ContextVar("carry_schematics", default=False)
+
+
+@contextmanager
+def carrying_schematics() -> Iterator[None]:
+    """
+    Schemas pickled within also carry the schematics that were already extracted
+    """
+    token = _carry_schematics.set(True)
+    try:
+        yield
+    finally:
+        _carry_schematics.reset(token)
+
+
+def is_carrying_schematics() -> bool:
+    return _carry_schematics.get()
+
+
+def dumps(schema: "BaseSchema", with_schematics: bool = False, protocol: Optional[int] = None) -> bytes:
+    if not with_schematics:
+        return pickle.dumps(schema, protocol=protocol)
+    with carrying_schematics():
+        return pickle.dumps(schema, protocol=protocol)
+
+
+class NameGetterReference(NamedTuple):
+    name: str
+
+    def resolve(self) -> Any:
+        return registered_name_getter(self.name)
+
+
+def reduce_name_getter(name_getter: Any) -> Any:
+    if name_getter is None:
+        return None
+    if name := name_getter_name(name_getter):
+        return NameGetterReference(name)
+    if "<" in getattr(name_getter, "__qualname__", ""):
+        msg = (
+            f"The name_getter {name_getter.__qualname__} cannot be pickled by reference; "
+            f"register it with schemantic.registry.register_name_getter"
+        )
+        raise pickle.PicklingError(msg)
+    return name_getter
+
+
+def restore_schema(cls: Type["BaseSchema"], state: dict[str, Any]) -> "BaseSchema":
+    return cls._from_reduced_state(state)
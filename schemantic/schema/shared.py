@@ -0,0 +1,151 @@
+"""
+Distribution of parsed configurations to worker processes through a read-only, mmap-backed segment.
+
+The parent parses once and publishes every member's origin and merged configuration; workers attach to the segment
+and decode a member only when it is first looked up, without reading the defined files. Segments are files under
+/dev/shm where available, so that they live in memory, and are replaced atomically on publish.
+
+Layout: magic, the length of the index, the index (member name to offset and length in the payload, pickled), and
+the payload, one pickled (origin, config) per member. Origins are pickled by import path, like any class.
+
+Usage:
+    # parent, before forking
+    segment = culture.publish("defined.yaml")
+    # worker
+    with attach(segment.path) as parsed:
+        instance = parsed.instantiate("copycat")
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import uuid
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Type
+
+from schemantic.utils.typing import DefinedSchema
+
+if TYPE_CHECKING:
+    from schemantic.schema.abstract import BaseSchema
+
+_MAGIC = b"SCHMSHM1"
+_INDEX_LENGTH = struct.Struct("<Q")
+_HEADER_SIZE = len(_MAGIC) + _INDEX_LENGTH.size
+
+_SHARED_MEMORY_DIRECTORY = Path("/dev/shm")
+
+
+def default_segment_path() -> Path:
+    directory = _SHARED_MEMORY_DIRECTORY if _SHARED_MEMORY_DIRECTORY.is_dir() else Path(tempfile.gettempdir())
+    return directory / f"schemantic-{uuid.uuid4().hex}"
+
+
+class SharedParsed(Mapping):
+    """
+    Member name to parsed configuration, decoded from the segment on first access; read-only, down to the
+    configurations.
+    Names are the ones used by `parse_schema_to_instance`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._buffer[: len(_MAGIC)] != _MAGIC:
+            self._buffer.close()
+            msg = f"{self.path} is not a published schemantic segment"
+            raise ValueError(msg)
+
+        (index_length,) = _INDEX_LENGTH.unpack_from(self._buffer, len(_MAGIC))
+        self._payload_start = _HEADER_SIZE + index_length
+        self._name_to_span: dict[str, tuple[int, int]] = pickle.loads(self._buffer[_HEADER_SIZE : self._payload_start])
+        self._name_to_origin_config: dict[str, tuple[Type, Mapping[str, Any]]] = {}
+
+    def origin_config(self, name: str) -> tuple[Type, Mapping[str, Any]]:
+        try:
+            return self._name_to_origin_config[name]
+        except KeyError:
+            offset, length = self._name_to_span[name]
+            start = self._payload_start + offset
+            origin, config = pickle.loads(self._buffer[start : start + length])
+            # Cached, and handed out to every caller
+            result = self._name_to_origin_config[name] = (origin, MappingProxyType(config))
+            return result
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        return self.origin_config(name)[1]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._name_to_span)
+
+    def __len__(self) -> int:
+        return len(self._name_to_span)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._name_to_span
+
+    def instantiate(self, name: str) -> Any:
+        origin, config = self.origin_config(name)
+        return origin(**config)
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def unlink(self) -> None:
+        """Remove the segment; processes that are attached keep their mapping"""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "SharedParsed":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def attach(path: Path) -> SharedParsed:
+    return SharedParsed(path)
+
+
+def publish(schema: "BaseSchema", defined_schema: DefinedSchema, path: Optional[Path] = None) -> SharedParsed:
+    """
+    Parse defined_schema with schema, and publish the result as a segment at path.
+
+    Parameters
+    ----------
+    schema: BaseSchema
+    defined_schema: DefinedSchema
+    path: Optional[Path]
+        Where to publish, replacing any previous segment; a new file under /dev/shm by default
+
+    Returns
+    -------
+    SharedParsed, attached to the published segment; call `unlink` once the workers no longer need to attach
+    """
+    path = Path(path) if path else default_segment_path()
+
+    name_to_span = {}
+    payloads = []
+    offset = 0
+    for name, (origin, config) in schema.parse_schema_with_origin(defined_schema).items():
+        # Deduplicated configurations are read-only views, which do not pickle
+        payload = pickle.dumps((origin, dict(config)), protocol=pickle.HIGHEST_PROTOCOL)
+        name_to_span[name] = (offset, len(payload))
+        payloads.append(payload)
+        offset += len(payload)
+    index = pickle.dumps(name_to_span, protocol=pickle.HIGHEST_PROTOCOL)
+
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(_INDEX_LENGTH.pack(len(index)))
+        file.write(index)
+        file.writelines(payloads)
+    os.replace(temporary_path, path)
+
+    return SharedParsed(path)
@@ -0,0 +1,153 @@
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from ordered_set import OrderedSet
+
+from schemantic.utils.extends import FileStamp, file_stamp, resolve_defined_file
+from schemantic.utils.typing import NameToOriginConfig
+
+if TYPE_CHECKING:
+    from schemantic.schema.abstract import BaseSchema
+
+logger = logging.getLogger(__file__)
+
+WatchCallback = Callable[[OrderedSet[str]], None]
+
+
+class SchemaWatcher:
+    """
+    Polls a defined file, and the files it extends, via stat. When any of them changes, the file is re-parsed and
+    only the members whose effective configuration changed, including through the common layer, are
+    re-instantiated. Callbacks receive the names of the added, changed, and removed members.
+
+    schema: BaseSchema
+        The schema used to parse the defined file
+    defined_path: Path
+        The defined file to watch
+    instantiate: bool
+        Keep `instances` up to date; otherwise only `configs` are tracked
+    """
+
+    def __init__(
+        self,
+        schema: "BaseSchema",
+        defined_path: Path,
+        callbacks: Optional[list[WatchCallback]] = None,
+        interval: float = 1.0,
+        instantiate: bool = True,
+    ) -> None:
+        self.schema = schema
+        self.defined_path = defined_path
+        self.callbacks: list[WatchCallback] = list(callbacks) if callbacks else []
+        self.interval = interval
+        self.instantiate = instantiate
+
+        self.configs: NameToOriginConfig = {}
+        self.instances: dict[str, Any] = {}
+
+        self._document: Optional[dict[str, Any]] = None
+        self._dependency_to_stamp: dict[Path, FileStamp] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._reload()
+
+    def __enter__(self) -> "SchemaWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def add_callback(self, callback: WatchCallback) -> None:
+        self.callbacks.append(callback)
+
+    def changed_on_disk(self) -> bool:
+        for dependency, stamp in self._dependency_to_stamp.items():
+            try:
+                if file_stamp(dependency) != stamp:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def poll(self) -> OrderedSet[str]:
+        """
+        Check the watched files once; re-parse and notify the callbacks if any of them changed.
+
+        Returns
+        -------
+        OrderedSet[str], names of the members that were added, changed, or removed
+
+        Raises
+        ------
+        The error of a failed reload, once; `instances` and `configs` are left as they were
+        """
+        if not self.changed_on_disk():
+            return OrderedSet()
+
+        changed_names = self._reload()
+        if changed_names:
+            for callback in self.callbacks:
+                callback(changed_names)
+        return changed_names
+
+    def start(self) -> "SchemaWatcher":
+        if self._thread and self._thread.is_alive():
+            return self
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{type(self).__name__}({self.defined_path})")
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                # A file caught mid-write should not kill the watcher; the next poll will retry.
+                logger.exception(f"Failed to reload {self.defined_path}")
+
+    def _reload(self) -> OrderedSet[str]:
+        """
+        Members are re-instantiated into a copy of `instances`, which is only swapped in, along with the configs and
+        the document, once every constructor succeeded. On failure, the watched files are still marked as seen, so
+        that the reload is only retried, against the last successful document, once they change again.
+        """
+        resolved = resolve_defined_file(self.defined_path)
+        try:
+            configs = self.schema.parse_schema_with_origin(resolved.document)
+
+            changed_names = (
+                self.schema.diff_defined(self._document, resolved.document).changed_names
+                if self._document is not None
+                else OrderedSet(configs)
+            )
+
+            instances = self.instances
+            if self.instantiate:
+                instances = dict(self.instances)
+                for name in changed_names:
+                    if name in configs:
+                        origin, instance_kwargs = configs[name]
+                        instances[name] = origin(**instance_kwargs)
+                    else:
+                        del instances[name]
+        except Exception:
+            self._dependency_to_stamp = resolved.dependency_to_stamp
+            raise
+
+        self.instances = instances
+        self.configs = configs
+        self._document = resolved.document
+        self._dependency_to_stamp = resolved.dependency_to_stamp
+        return changed_names
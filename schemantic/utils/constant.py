@@ -3,3 +3,7 @@ SCHEMA_REQUIRED_MAPPING_KEY: str = "required"
 SCHEMA_OPTIONAL_MAPPING_KEY: str = "optional"
 
 SCHEMA_FIELD_INFO_MAPPING_KEY = "field_to_info"
+SCHEMA_INSTANCE_NAMES_KEY = "instance_names"
+SCHEMA_SHARDS_KEY = "shards"
+
+SCHEMA_EXTENDS_KEY = "extends"
@@ -0,0 +1,79 @@
+import inspect
+import threading
+from typing import Any, Callable, Mapping, Optional, Type
+from weakref import WeakKeyDictionary
+
+LayeredConstructor = Callable[..., Any]
+
+_SUPPORTED_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+_origin_to_layer_count_to_constructor: WeakKeyDictionary[Type, dict[int, Optional[LayeredConstructor]]] = (
+    WeakKeyDictionary()
+)
+_constructor_lock = threading.Lock()
+
+
+def _merged_call(origin: Type, layers: tuple[Mapping[str, Any], ...]) -> Any:
+    kwargs: dict[str, Any] = {}
+    for layer in layers:
+        kwargs.update(layer)
+    return origin(**kwargs)
+
+
+def generate_layered_constructor(origin: Type, layer_count: int) -> Optional[LayeredConstructor]:
+    """
+    Generate `construct(layer_0, ..., layer_n)`, equivalent to `origin(**{**layer_0, ..., **layer_n})`, that looks
+    every parameter of `origin.__init__` up in the layers, highest first, and passes it on directly; no merged
+    kwargs are built. Layers with unknown keys, or lacking a required parameter, fall back to the merged call so that
+    origin raises as usual.
+
+    None if the signature cannot be bound statically, i.e. it takes *args, **kwargs, or positional-only parameters;
+    which notably excludes pydantic models.
+    """
+    try:
+        parameters = list(inspect.signature(origin.__init__).parameters.values())[1:]
+    except (TypeError, ValueError):
+        return None
+    if any(parameter.kind not in _SUPPORTED_KINDS for parameter in parameters):
+        return None
+
+    layers = [f"layer_{i}" for i in range(layer_count)]
+    namespace: dict[str, Any] = dict(
+        _origin=origin,
+        _merged_call=_merged_call,
+        _names=frozenset(parameter.name for parameter in parameters),
+    )
+    lines = [
+        f"def construct({', '.join(layers)}):",
+        f"    if not ({' and '.join(f'_names.issuperset({layer})' for layer in layers)}):",
+        f"        return _merged_call(_origin, ({', '.join(layers)},))",
+    ]
+    arguments = []
+    for i, parameter in enumerate(parameters):
+        key = repr(parameter.name)
+        for j, layer in enumerate(reversed(layers)):
+            lines.append(f"    {'if' if j == 0 else 'elif'} {key} in {layer}: v{i} = {layer}[{key}]")
+        if parameter.default is inspect.Parameter.empty:
+            lines.append(f"    else: return _merged_call(_origin, ({', '.join(layers)},))")
+        else:
+            namespace[f"_default_{i}"] = parameter.default
+            lines.append(f"    else: v{i} = _default_{i}")
+
+        arguments.append(
+            f"v{i}" if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD else f"{parameter.name}=v{i}"
+        )
+    lines.append(f"    return _origin({', '.join(arguments)})")
+
+    exec(compile("\n".join(lines), f"<schemantic constructor of {origin.__qualname__}>", "exec"), namespace)
+    return namespace["construct"]
+
+
+def layered_constructor(origin: Type, layer_count: int) -> Optional[LayeredConstructor]:
+    """
+    Cached generate_layered_constructor
+    """
+    with _constructor_lock:
+        layer_count_to_constructor = _origin_to_layer_count_to_constructor.setdefault(origin, {})
+        if layer_count not in layer_count_to_constructor:
+            layer_count_to_constructor[layer_count] = generate_layered_constructor(origin, layer_count)
+        return layer_count_to_constructor[layer_count]
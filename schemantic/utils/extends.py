@@ -0,0 +1,106 @@
+import threading
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from schemantic.utils.constant import SCHEMA_EXTENDS_KEY
+from schemantic.utils.file import load_schema_file
+
+FileStamp = tuple[int, int]
+
+
+def file_stamp(path: Path) -> FileStamp:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def deep_merge(base: dict[str, Any], layer: dict[str, Any]) -> dict[str, Any]:
+    """
+    Layer one defined document on top of another; mappings are merged recursively, everything else is replaced.
+    Subtrees of base that layer does not touch are shared, not copied.
+    """
+    result = dict(base)
+    for key, value in layer.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+class _ResolvedFile(NamedTuple):
+    document: dict[str, Any]
+    dependency_to_stamp: dict[Path, FileStamp]
+
+
+class DefinedFileCache:
+    """
+    Process-wide cache of resolved base files, i.e. files reached through an `extends` directive.
+
+    A base file shared by many defined files is loaded and resolved once; the entry is reused for as long as
+    neither it nor any of its own bases changed on disk. Documents are deep-copied on the way out, so that the
+    documents that extend them, and the callers of `load_defined_file`, never alias a cached subtree.
+    """
+
+    def __init__(self) -> None:
+        self._path_to_resolved: dict[Path, _ResolvedFile] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._path_to_resolved.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resolve(self, path: Path, _resolving: tuple[Path, ...] = ()) -> _ResolvedFile:
+        with self._lock:
+            cached = self._path_to_resolved.get(path)
+            if cached and all(
+                dependency.exists() and file_stamp(dependency) == stamp
+                for dependency, stamp in cached.dependency_to_stamp.items()
+            ):
+                self.hits += 1
+                return _ResolvedFile(deepcopy(cached.document), cached.dependency_to_stamp)
+
+            self.misses += 1
+            resolved = resolve_defined_file(path, cache=self, _resolving=_resolving)
+            self._path_to_resolved[path] = resolved
+            return _ResolvedFile(deepcopy(resolved.document), resolved.dependency_to_stamp)
+
+
+defined_file_cache = DefinedFileCache()
+
+
+def resolve_defined_file(
+    path: Path, cache: Optional[DefinedFileCache] = None, _resolving: tuple[Path, ...] = ()
+) -> _ResolvedFile:
+    """
+    Load a defined file and layer it on top of the files listed under its `extends` key, in order.
+    Paths in `extends` are relative to the extending file.
+    """
+    cache = cache or defined_file_cache
+    path = path.resolve()
+    if path in _resolving:
+        msg = f"Cyclic {SCHEMA_EXTENDS_KEY} directive: {' -> '.join(map(str, (*_resolving, path)))}"
+        raise ValueError(msg)
+
+    dependency_to_stamp = {path: file_stamp(path)}
+    document = load_schema_file(path)
+    if not isinstance(document, dict) or SCHEMA_EXTENDS_KEY not in document:
+        return _ResolvedFile(document, dependency_to_stamp)
+
+    document = dict(document)
+    bases = document.pop(SCHEMA_EXTENDS_KEY)
+    result: dict[str, Any] = {}
+    for base in [bases] if isinstance(bases, str) else bases:
+        resolved_base = cache.resolve((path.parent / base).resolve(), _resolving=(*_resolving, path))
+        dependency_to_stamp.update(resolved_base.dependency_to_stamp)
+        result = deep_merge(result, resolved_base.document)
+
+    return _ResolvedFile(deep_merge(result, document), dependency_to_stamp)
+
+
+def load_defined_file(path: Path) -> dict[str, Any]:
+    return resolve_defined_file(path).document
@@ -0,0 +1,98 @@
+import bz2
+import gzip
+import json
+import lzma
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Optional
+
+COMPRESSION_SUFFIX_TO_OPENER: dict[str, Callable[..., IO]] = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+}
+
+
+def split_schema_suffix(schema_path: Path) -> tuple[str, Optional[str]]:
+    """
+    Split the suffix of a schema file into its serialization format and its compression codec.
+
+    Example: ``schema.yaml.gz`` -> (".yaml", ".gz"); ``schema.toml`` -> (".toml", None)
+    """
+    if schema_path.suffix in COMPRESSION_SUFFIX_TO_OPENER:
+        return Path(schema_path.stem).suffix, schema_path.suffix
+    return schema_path.suffix, None
+
+
+@contextmanager
+def open_schema_file(schema_path: Path, mode: str) -> Iterator[IO[str]]:
+    """
+    Open a schema file as a text stream, (de)compressing on the fly when the path has a compression suffix.
+    The codec streams are consumed by the parsers directly; no decompressed copy of the file is made beforehand.
+    """
+    _, compression = split_schema_suffix(schema_path)
+    opener = COMPRESSION_SUFFIX_TO_OPENER[compression] if compression else open
+    with opener(schema_path, f"{mode}t", encoding="utf-8") as stream:
+        yield stream
+
+
+def _dump_toml(schema: dict, stream: IO[str]) -> None:
+    from rtoml import dump
+
+    dump(schema, stream)
+
+
+def _dump_yaml(schema: dict, stream: IO[str]) -> None:
+    from ruamel.yaml import YAML
+
+    YAML().dump(schema, stream)
+
+
+def _dump_json(schema: dict, stream: IO[str]) -> None:
+    json.dump(schema, stream, indent=2)
+
+
+def _load_toml(stream: IO[str]) -> dict:
+    from rtoml import load
+
+    return load(stream)
+
+
+def _load_yaml(stream: IO[str]) -> dict:
+    from ruamel.yaml import YAML
+
+    return YAML().load(stream)
+
+
+def dump_schema_file(schema: dict[str, Any], dump_path: Path) -> None:
+    schema_format, _ = split_schema_suffix(dump_path)
+    match schema_format:
+        case ".toml":
+            dump = _dump_toml
+        case ".yaml" | ".yml":
+            dump = _dump_yaml
+        case ".json":
+            dump = _dump_json
+        case _:
+            msg = f"{schema_format or dump_path.suffix} is unsupported"
+            raise NotImplementedError(msg)
+
+    with open_schema_file(dump_path, "w") as stream:
+        dump(schema, stream)
+
+
+def load_schema_file(schema_path: Path) -> dict:
+    schema_format, _ = split_schema_suffix(schema_path)
+    match schema_format:
+        case ".toml":
+            load = _load_toml
+        case ".yaml" | ".yml":
+            load = _load_yaml
+        case ".json":
+            load = json.load
+        case _:
+            msg = f"{schema_format or schema_path.suffix} is unsupported"
+            raise NotImplementedError(msg)
+
+    with open_schema_file(schema_path, "r") as stream:
+        return load(stream)
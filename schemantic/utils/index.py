@@ -0,0 +1,292 @@
+"""
+Byte offset index of defined files, for loading a single top-level mapping without parsing the whole document.
+
+The index of `schema.json` is cached next to it, as `schema.json.index`, and is rebuilt whenever the file changes
+on disk. For JSON, it records the span of every top-level value and of every value nested one level below, e.g. the
+instances of a homolog within a culture; for YAML, the span of every top-level `key: value` block. Compressed files,
+TOML, and files with an `extends` key are not indexed; loading from them falls back to parsing the whole document.
+"""
+
+import io
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+from schemantic.utils.constant import SCHEMA_EXTENDS_KEY
+from schemantic.utils.extends import FileStamp, file_stamp, load_defined_file
+from schemantic.utils.file import split_schema_suffix
+
+Span = tuple[int, int]
+
+INDEX_SUFFIX = ".index"
+
+_JSON_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_JSON_SCALAR_END = re.compile(rb"[,}\]\s]")
+_JSON_WHITESPACE = b" \t\r\n"
+
+
+class DefinedIndex(BaseModel, defer_build=True):
+    """
+    stamp: FileStamp
+        Of the indexed file when the index was built
+    format: Literal["json", "yaml"]
+    spans: dict[str, Span]
+        Top-level key to its [start, end) byte span; the value for JSON, the whole `key: value` block for YAML
+    nested_spans: dict[str, dict[str, Span]]
+        Top-level key to the spans of the values of its own mapping; JSON only
+    """
+
+    stamp: FileStamp
+    format: Literal["json", "yaml"]
+    spans: dict[str, Span]
+    nested_spans: dict[str, dict[str, Span]] = Field(default_factory=dict)
+
+
+def index_path(defined_path: Path) -> Path:
+    return defined_path.with_name(f"{defined_path.name}{INDEX_SUFFIX}")
+
+
+def _skip_whitespace(data: bytes, i: int) -> int:
+    while data[i] in _JSON_WHITESPACE:
+        i += 1
+    return i
+
+
+def _json_string_end(data: bytes, i: int) -> int:
+    """End of the string opening at i, after its closing quote"""
+    j = i + 1
+    while True:
+        j = data.index(b'"', j)
+        backslash_count = 0
+        while data[j - 1 - backslash_count] == ord("\\"):
+            backslash_count += 1
+        if backslash_count % 2 == 0:
+            return j + 1
+        j += 1
+
+
+def _json_value_end(data: bytes, i: int) -> int:
+    if data[i] == ord('"'):
+        return _json_string_end(data, i)
+
+    if data[i] in b"{[":
+        depth = 0
+        j = i
+        while True:
+            match = _JSON_STRUCTURAL.search(data, j)
+            if match is None:
+                msg = f"Unterminated JSON value at byte {i}"
+                raise ValueError(msg)
+            if data[match.start()] == ord('"'):
+                j = _json_string_end(data, match.start())
+                continue
+            depth += 1 if data[match.start()] in b"{[" else -1
+            j = match.end()
+            if depth == 0:
+                return j
+
+    match = _JSON_SCALAR_END.search(data, i)
+    return match.start() if match else len(data)
+
+
+def _json_object_members(data: bytes, i: int) -> Iterator[tuple[str, Span]]:
+    """Key and value span of every member of the JSON object opening at i, without decoding the values"""
+    i = _skip_whitespace(data, i + 1)
+    if data[i] == ord("}"):
+        return
+    while True:
+        key_end = _json_string_end(data, i)
+        key = json.loads(data[i:key_end])
+        start = _skip_whitespace(data, _skip_whitespace(data, key_end) + 1)
+        end = _json_value_end(data, start)
+        yield key, (start, end)
+
+        i = _skip_whitespace(data, end)
+        if data[i] == ord("}"):
+            return
+        i = _skip_whitespace(data, i + 1)
+
+
+def _json_spans(data: bytes) -> tuple[dict[str, Span], dict[str, dict[str, Span]]]:
+    spans = dict(_json_object_members(data, _skip_whitespace(data, 0)))
+    nested_spans = {
+        key: dict(_json_object_members(data, start)) for key, (start, _end) in spans.items() if data[start] == ord("{")
+    }
+    return spans, nested_spans
+
+
+def _yaml_block(data: bytes) -> Any:
+    from ruamel.yaml import YAML
+
+    return YAML().load(io.BytesIO(data))
+
+
+def _yaml_spans(data: bytes) -> Optional[dict[str, Span]]:
+    """
+    Spans of the top-level blocks of a block mapping, each starting at an unindented line; None for any other layout,
+    or if the blocks do not load to the same document on their own, e.g. because of anchors shared between blocks
+    """
+    starts = []
+    offset = 0
+    for line in data.splitlines(keepends=True):
+        if line[:1] not in b" \t#\r\n":
+            if line.startswith((b"---", b"...", b"%", b"{", b"[", b"?")):
+                return None
+            if line[:1] == b"-":
+                # Block sequences may be unindented under their key
+                if not starts:
+                    return None
+            else:
+                starts.append(offset)
+        offset += len(line)
+
+    from ruamel.yaml import YAMLError
+
+    spans: dict[str, Span] = {}
+    document: dict[Any, Any] = {}
+    try:
+        for start, end in zip(starts, (*starts[1:], len(data)), strict=True):
+            block = _yaml_block(data[start:end])
+            if not isinstance(block, dict) or len(block) != 1:
+                return None
+            ((key, value),) = block.items()
+            if not isinstance(key, str) or key in spans:
+                return None
+            spans[key] = (start, end)
+            document[key] = value
+
+        if document != _yaml_block(data):
+            return None
+    except YAMLError:
+        return None
+    return spans
+
+
+def build_index(defined_path: Path) -> Optional[DefinedIndex]:
+    """
+    Index of defined_path, or None if it cannot be indexed
+    """
+    schema_format, compression = split_schema_suffix(defined_path)
+    if compression or schema_format not in (".json", ".yaml", ".yml"):
+        return None
+
+    stamp = file_stamp(defined_path)
+    data = defined_path.read_bytes()
+    try:
+        if schema_format == ".json":
+            spans, nested_spans = _json_spans(data)
+            result = DefinedIndex(stamp=stamp, format="json", spans=spans, nested_spans=nested_spans)
+        else:
+            spans = _yaml_spans(data)
+            if spans is None:
+                return None
+            result = DefinedIndex(stamp=stamp, format="yaml", spans=spans)
+    except (ValueError, IndexError):
+        # Malformed; loading the whole document reports the error
+        return None
+
+    return None if SCHEMA_EXTENDS_KEY in result.spans else result
+
+
+def write_index(defined_path: Path) -> Optional[DefinedIndex]:
+    """
+    Build the index of defined_path and cache it next to it; the index is only kept in memory if that fails
+    """
+    result = build_index(defined_path)
+    _path_to_stamp_index[defined_path.resolve()] = (file_stamp(defined_path), result)
+    if result is not None:
+        try:
+            index_path(defined_path).write_text(result.model_dump_json())
+        except OSError:
+            pass
+    return result
+
+
+# Also remembers files that cannot be indexed, so that they are not scanned again until they change
+_path_to_stamp_index: dict[Path, tuple[FileStamp, Optional[DefinedIndex]]] = {}
+
+
+def defined_index(defined_path: Path) -> Optional[DefinedIndex]:
+    """
+    Up to date index of defined_path, from memory, from its cached index file, or built and cached on first use
+    """
+    stamp = file_stamp(defined_path)
+    resolved_path = defined_path.resolve()
+
+    cached_stamp, cached = _path_to_stamp_index.get(resolved_path, (None, None))
+    if cached_stamp == stamp:
+        return cached
+
+    try:
+        cached = DefinedIndex.model_validate_json(index_path(defined_path).read_bytes())
+    except (OSError, ValidationError):
+        cached = None
+    if cached is not None and cached.stamp == stamp:
+        _path_to_stamp_index[resolved_path] = (stamp, cached)
+        return cached
+
+    return write_index(defined_path)
+
+
+def _read_span(defined_path: Path, span: Span) -> bytes:
+    start, end = span
+    with open(defined_path, "rb") as file:
+        file.seek(start)
+        return file.read(end - start)
+
+
+def _decode(index: DefinedIndex, key: str, data: bytes) -> Any:
+    if index.format == "json":
+        return json.loads(data)
+    return _yaml_block(data)[key]
+
+
+def load_top_level(defined_path: Path, keys: Iterable[str]) -> dict[str, Any]:
+    """
+    The values of the top-level keys of a defined file that are present, decoding only their regions if indexed
+    """
+    index = defined_index(defined_path)
+    if index is None:
+        document = load_defined_file(defined_path)
+        return {key: document[key] for key in keys if key in document}
+
+    return {key: _decode(index, key, _read_span(defined_path, index.spans[key])) for key in keys if key in index.spans}
+
+
+def load_member(defined_path: Path, key: str, nested_keys: Optional[Iterable[str]] = None) -> Any:
+    """
+    The value of a top-level key of a defined file, decoding only its region if indexed.
+
+    Parameters
+    ----------
+    defined_path: Path
+    key: str
+    nested_keys: Optional[Iterable[str]]
+        Only keep these keys of the value, if present, e.g. a few instances of a homolog within a culture;
+        for JSON, only their regions are decoded
+
+    Returns
+    -------
+    Any, the value
+    """
+    index = defined_index(defined_path)
+    if index is not None and nested_keys is not None and key in index.nested_spans:
+        nested_spans = index.nested_spans[key]
+        return {
+            nested_key: json.loads(_read_span(defined_path, nested_spans[nested_key]))
+            for nested_key in nested_keys
+            if nested_key in nested_spans
+        }
+
+    try:
+        result = load_top_level(defined_path, (key,))[key]
+    except KeyError:
+        msg = f"{key} is not defined in {defined_path}"
+        raise KeyError(msg) from None
+
+    if nested_keys is not None:
+        result = {nested_key: result[nested_key] for nested_key in nested_keys if nested_key in result}
+    return result
@@ -0,0 +1,43 @@
+import sys
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Iterable, Iterator
+
+_NOT_TRAVERSED = (type, FunctionType, BuiltinFunctionType, MethodType, ModuleType)
+
+
+def _referents(obj: Any) -> Iterator[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    else:
+        if hasattr(obj, "__dict__"):
+            yield vars(obj)
+        for cls in type(obj).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                    yield getattr(obj, slot)
+
+
+def deep_sizeof(obj: Any, seen: set[int]) -> int:
+    """
+    Size of obj and everything it references that is not in seen, which is updated in-place.
+    Passing the same seen set to successive calls attributes shared objects to the first caller only.
+    Classes, functions, and modules are not counted.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _NOT_TRAVERSED):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        stack.extend(_referents(current))
+    return size
+
+
+def deep_sizeof_all(objects: Iterable[Any], seen: set[int]) -> int:
+    return sum(deep_sizeof(obj, seen) for obj in objects)
@@ -1,4 +1,13 @@
-from typing import Any, Hashable, Optional
+import dataclasses
+import functools
+import hashlib
+import json
+from typing import Any, Callable, Generic, Hashable, Iterable, Mapping, Optional, Type, TypeVar
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel, validate_call
+
+V = TypeVar("V")
 
 
 def update_assert_disjoint(dict_a: dict, dict_b: dict, error_msg_add: Optional[str] = None) -> None:
@@ -23,3 +32,122 @@ def sorted_by_dict_key(source: dict[Hashable, Any]) -> list[tuple[Hashable, Any]
 
 def dict_sorted_by_dict_key(source: dict) -> dict:
     return dict(sorted_by_dict_key(source))
+
+
+def _json_default(source: Any) -> Any:
+    # Read-only views, e.g. of deduplicated configurations, digest like the dicts they wrap
+    return dict(source) if isinstance(source, Mapping) else repr(source)
+
+
+def content_digest(source: Any) -> str:
+    """
+    Stable digest of a defined (JSON-like) structure; equal content gives an equal digest across processes.
+    Mappings whose keys do not sort, e.g. of mixed types, are digested in insertion order.
+
+    Unequal content may give the same digest too, e.g. tuples and lists, or int and str keys; see ContentPool to
+    share values by content.
+    """
+    try:
+        encoded = json.dumps(source, sort_keys=True, default=_json_default, separators=(",", ":"))
+    except TypeError:
+        encoded = json.dumps(source, default=_json_default, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def same_content(a: Any, b: Any) -> bool:
+    """
+    Whether two defined structures are equal; cheaper than comparing their digests, which serialize both
+    """
+    return a is b or a == b
+
+
+class ContentPool(Generic[V]):
+    """
+    Values shared by content: the value made for the first content, that is found equal to a later one, by digest
+    and then by equality, is reused for it
+    """
+
+    def __init__(self) -> None:
+        self._digest_to_entries: dict[str, list[tuple[Any, V]]] = {}
+
+    def setdefault(self, content: Any, make: Callable[[], V]) -> V:
+        """
+        The value of the content equal to content, or make() if there is none yet
+        """
+        entries = self._digest_to_entries.setdefault(content_digest(content), [])
+        for pooled_content, value in entries:
+            # Digests collide for some unequal content
+            if same_content(pooled_content, content):
+                return value
+
+        value = make()
+        entries.append((content, value))
+        return value
+
+
+class FrozenOrderedSet(OrderedSet):
+    """
+    OrderedSet that rejects changes once built, for members that indexes and hashes are derived from;
+    assign a new one instead
+    """
+
+    def __init__(self, initial: Optional[Iterable] = None) -> None:
+        self._frozen = False
+        super().__init__(initial)
+        self._frozen = True
+
+    def _assert_mutable(self) -> None:
+        if getattr(self, "_frozen", False):
+            msg = f"{type(self).__name__} cannot be changed in place"
+            raise TypeError(msg)
+
+    def add(self, key: Any) -> int:
+        self._assert_mutable()
+        return super().add(key)
+
+    append = add
+
+    def update(self, sequence: Iterable) -> int:
+        self._assert_mutable()
+        return super().update(sequence)
+
+    def pop(self, index: int = -1) -> Any:
+        self._assert_mutable()
+        return super().pop(index)
+
+    def discard(self, key: Any) -> None:
+        self._assert_mutable()
+        super().discard(key)
+
+    def clear(self) -> None:
+        self._assert_mutable()
+        super().clear()
+
+    def _update_items(self, items: list) -> None:
+        self._assert_mutable()
+        super()._update_items(items)
+
+
+def lazy_validate_call(func: Callable) -> Callable:
+    """
+    `pydantic.validate_call` that builds its validator on the first call instead of at import time.
+    """
+    validated: Optional[Callable] = None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal validated
+        if validated is None:
+            validated = validate_call(func)
+        return validated(*args, **kwargs)
+
+    return wrapper
+
+
+def is_frozen_origin(origin: Type) -> bool:
+    """Frozen pydantic models and dataclasses"""
+    if isinstance(origin, type) and issubclass(origin, BaseModel):
+        return bool(origin.model_config.get("frozen"))
+    if dataclasses.is_dataclass(origin):
+        return origin.__dataclass_params__.frozen
+    return False
@@ -0,0 +1,111 @@
+"""
+Sharded defined files: a header with everything but the instance configurations, which are spread over shard files
+next to it. The header lists the shards, relative to itself, under the shards key:
+
+    shards:
+      by: hash
+      files: [homolog.shard-0000.yaml, homolog.shard-0001.yaml]
+
+Hash sharding places a name in shard `crc32(name) % len(files)`, so the shard of a single name can be loaded on
+its own; count sharding splits the names into consecutive, equally sized shards.
+"""
+
+import zlib
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Literal, Optional
+
+from schemantic.utils.constant import SCHEMA_SHARDS_KEY
+from schemantic.utils.file import dump_schema_file, load_schema_file, split_schema_suffix
+
+ShardBy = Literal["count", "hash"]
+
+
+def shard_index(name: str, shard_count: int) -> int:
+    return zlib.crc32(name.encode()) % shard_count
+
+
+def shard_path(header_path: Path, index: int) -> Path:
+    """Example: ``homolog.yaml.gz``, 3 -> ``homolog.shard-0003.yaml.gz``"""
+    schema_format, compression = split_schema_suffix(header_path)
+    suffixes = f"{schema_format}{compression or ''}"
+    return header_path.with_name(f"{header_path.name[: -len(suffixes)]}.shard-{index:04d}{suffixes}")
+
+
+def split_into_shards(name_to_config: dict[str, Any], shard_count: int, shard_by: ShardBy) -> list[dict[str, Any]]:
+    shards: list[dict[str, Any]] = [{} for _ in range(shard_count)]
+    if shard_by == "hash":
+        for name, config in name_to_config.items():
+            shards[shard_index(name, shard_count)][name] = config
+    elif shard_by == "count":
+        shard_size = -(-len(name_to_config) // shard_count) or 1
+        for i, (name, config) in enumerate(name_to_config.items()):
+            shards[i // shard_size][name] = config
+    else:
+        msg = f"Unknown shard_by {shard_by!r}; use count or hash"
+        raise ValueError(msg)
+    return shards
+
+
+def dump_sharded_file(
+    header: dict[str, Any], name_to_config: dict[str, Any], header_path: Path, shard_count: int, shard_by: ShardBy
+) -> list[Path]:
+    """
+    Write header, extended by the shards key, to header_path, and name_to_config over shard_count shard files.
+
+    Returns
+    -------
+    list[Path], the shard files
+    """
+    if shard_count < 1:
+        msg = f"shard_count must be positive, got {shard_count}"
+        raise ValueError(msg)
+
+    paths = [shard_path(header_path, i) for i in range(shard_count)]
+    for path, shard in zip(paths, split_into_shards(name_to_config, shard_count, shard_by), strict=True):
+        dump_schema_file(shard, path)
+    dump_schema_file({**header, SCHEMA_SHARDS_KEY: dict(by=shard_by, files=[path.name for path in paths])}, header_path)
+    return paths
+
+
+def load_shards(
+    header_path: Path,
+    header: dict[str, Any],
+    names: Optional[Iterable[str]] = None,
+    executor: Optional[Executor] = None,
+) -> dict[str, Any]:
+    """
+    Load the shards listed in the header, concurrently, and merge them into the header in place of the shards key.
+
+    Parameters
+    ----------
+    header_path: Path
+        Shard files are relative to it
+    header: dict[str, Any]
+        The loaded header
+    names: Optional[Iterable[str]]
+        Only load the configurations of these names; for hash sharding, only their shards are read
+    executor: Optional[Executor]
+        Loads the shard files; a ThreadPoolExecutor by default. A ProcessPoolExecutor also parallelizes parsing.
+    """
+    shards = header[SCHEMA_SHARDS_KEY]
+    files = [header_path.parent / file for file in shards["files"]]
+    names = None if names is None else list(names)
+    if names is not None and shards["by"] == "hash":
+        files = [files[i] for i in sorted({shard_index(name, len(files)) for name in names})]
+
+    if executor is None and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as thread_pool:
+            loaded = list(thread_pool.map(load_schema_file, files))
+    elif executor is None:
+        loaded = [load_schema_file(file) for file in files]
+    else:
+        loaded = list(executor.map(load_schema_file, files))
+
+    result = {key: value for key, value in header.items() if key != SCHEMA_SHARDS_KEY}
+    for shard in loaded:
+        if names is None:
+            result.update(shard)
+        else:
+            result.update((name, shard[name]) for name in names if name in shard)
+    return result
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Type
 
 from pydantic import FilePath
 
@@ -11,3 +11,5 @@ SchemaGroupMemberMap = dict[str, str | dict | list[str]]
 
 NameToFieldMetadata = dict[str, FieldMetadata]
 NameToStrFieldMetadata = dict[str, str]
+
+NameToOriginConfig = dict[str, tuple[Type, dict[str, Any]]]
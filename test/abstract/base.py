@@ -28,12 +28,12 @@ class AbstractSchemaTester(ABC):
     def test_schema(self):
         self.assertEqual(self.schema_instance.schema(), self.expected_schema)
 
-    @parameterized.expand([".toml", ".yaml"])
+    @parameterized.expand([".toml", ".yaml", ".json", ".yaml.gz", ".toml.xz", ".json.bz2"])
     def test_dump(self, suffix: str):
         with tempfile.NamedTemporaryFile(mode="w+", delete=True, suffix=suffix) as tf:
             self.schema_instance.dump(Path(tf.name))
 
-    @parameterized.expand([".toml", ".yaml"])
+    @parameterized.expand([".toml", ".yaml", ".json", ".yaml.gz", ".toml.xz", ".json.bz2"])
     def test_dump_parse(self, suffix: str):
         with tempfile.NamedTemporaryFile(mode="w+", delete=True, suffix=suffix) as tf:
             schema_path = Path(tf.name)
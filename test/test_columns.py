@@ -0,0 +1,136 @@
+import array
+import tempfile
+import unittest
+from pathlib import Path
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel
+
+from schemantic.model.columns import (
+    UNSET,
+    ColumnarConfig,
+    RepeatedColumn,
+    column_values,
+    dense_column,
+    is_broadcast,
+)
+from schemantic.schema.main import GroupSchema, HomologSchema, SingleSchema
+from schemantic.utils.file import load_schema_file
+
+
+class Point(BaseModel):
+    x: int
+    y: float = 0.0
+    label: str = "point"
+
+
+class Tag(BaseModel):
+    label: str
+    weight: int = 1
+
+
+class TestDenseColumn(unittest.TestCase):
+    def test_numeric_columns_are_arrays(self):
+        self.assertIsNot(type(dense_column([1, 2, 3])), list)
+        self.assertEqual(column_values(dense_column([1, 2, 3])), [1, 2, 3])
+        self.assertIsNot(type(dense_column([1.5, 2.5])), list)
+        self.assertEqual(column_values(dense_column([1.5, 2.5])), [1.5, 2.5])
+
+    def test_other_columns_are_lists(self):
+        for values in ([True, False], ["a", "b"], [1, None], [2**70, 1], [1, 2.5]):
+            with self.subTest(values=values):
+                self.assertEqual(dense_column(values), values)
+
+    def test_repeated_column(self):
+        column = RepeatedColumn("a", 3)
+        self.assertTrue(is_broadcast(column))
+        self.assertEqual(list(column), ["a", "a", "a"])
+        self.assertEqual(column[1:], RepeatedColumn("a", 2))
+        with self.assertRaises(IndexError):
+            column[3]
+
+
+class TestLayers(unittest.TestCase):
+    def test_mixed_int_float_round_trip(self):
+        layers = {"m_0": {"a": 3}, "m_1": {"a": 2.5}}
+        _common, name_to_layer = ColumnarConfig.from_layers({}, layers, layers).to_layers()
+
+        self.assertEqual(name_to_layer, layers)
+        self.assertIs(type(name_to_layer["m_0"]["a"]), int)
+
+    def test_explicit_none_kept(self):
+        columnar = ColumnarConfig.from_layers({"a": 1}, ["m_0", "m_1"], {"m_0": {"b": None}, "m_1": {"a": 2}})
+
+        self.assertEqual(columnar["b"], [None, UNSET])
+        self.assertEqual(columnar.to_layers(), ({}, {"m_0": {"a": 1, "b": None}, "m_1": {"a": 2}}))
+
+
+class TestHomologColumns(unittest.TestCase):
+    names = OrderedSet(f"point_{i}" for i in range(4))
+    defined = {
+        "class_name": "Point",
+        "common": {"y": 1.5, "label": "shared"},
+        **{f"point_{i}": {"x": i} for i in range(4)},
+        "point_3": {"x": 3, "y": 2.5},
+    }
+
+    def setUp(self) -> None:
+        self.schema = HomologSchema(single_schema=SingleSchema(origin=Point), instance_names=self.names)
+
+    def test_to_columns(self):
+        columnar = self.schema.to_columns(self.defined)
+
+        self.assertEqual(columnar.names, list(self.names))
+        self.assertEqual(column_values(columnar["x"]), [0, 1, 2, 3])
+        self.assertEqual(column_values(columnar["y"]), [1.5, 1.5, 1.5, 2.5])
+        self.assertTrue(is_broadcast(columnar["label"]))
+        self.assertFalse(is_broadcast(columnar["x"]))
+        self.assertEqual(columnar.row("point_3"), {"y": 2.5, "label": "shared", "x": 3})
+
+    def test_round_trip(self):
+        columnar = self.schema.to_columns(self.defined)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "defined.yaml"
+            defined = self.schema.defined_from_columns(columnar, dump_path=path)
+            self.assertEqual(load_schema_file(path), defined)
+
+        self.assertEqual(defined["common"], {"label": "shared"})
+        self.assertEqual(self.schema.parse_schema(defined), self.schema.parse_schema(self.defined))
+
+    def test_columns_without_numpy(self):
+        columnar = ColumnarConfig(
+            names=["point_0", "point_1"],
+            columns={"x": array.array("q", [4, 5]), "label": RepeatedColumn("repeated", 2)},
+        )
+        defined = self.schema.defined_from_columns(columnar)
+        self.assertEqual(defined["common"], {"label": "repeated"})
+        self.assertEqual(self.schema.parse_schema_to_instance(defined)["point_1"], Point(x=5, label="repeated"))
+
+
+class TestGroupColumns(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = GroupSchema.from_originating_types(origins=OrderedSet((Point, Tag)), mapping_name="group")
+        self.defined = {
+            "common": {"defined": {"label": "shared"}},
+            **{
+                name: {"defined": config}
+                for name, config in zip(
+                    self.schema.schema_mapping_name_to_instance_schema, ({"x": 1}, {"weight": 3}), strict=True
+                )
+            },
+        }
+
+    def test_columns_by_origin(self):
+        origin_name_to_columns = self.schema.to_columns(self.defined)
+
+        self.assertEqual(set(origin_name_to_columns), {"Point", "Tag"})
+        self.assertEqual(column_values(origin_name_to_columns["Point"]["x"]), [1])
+        self.assertEqual(column_values(origin_name_to_columns["Tag"]["weight"]), [3])
+        self.assertTrue(is_broadcast(origin_name_to_columns["Tag"]["label"]))
+
+    def test_round_trip(self):
+        defined = self.schema.defined_from_columns(self.schema.to_columns(self.defined))
+
+        self.assertEqual(defined["common"], {"defined": {"label": "shared"}})
+        self.assertEqual(defined["Point"], {"defined": {"x": 1}})
+        self.assertEqual(self.schema.parse_schema(defined), self.schema.parse_schema(self.defined))
@@ -0,0 +1,140 @@
+import multiprocessing
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from test.schema.bare import model_culture_schema
+from test.schema.base import OtherTestModel, TestModel
+from typing import Any
+from unittest import mock
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel, ValidationError
+
+from schemantic.schema.concurrent import InstantiationErrorGroup
+from schemantic.schema.main import GroupSchema, HomologSchema, SingleSchema
+
+defined = {
+    "single_test": {"defined": {"must_be": 1}},
+    "homolog_test": {"common": {"must_be": 2}, "test_1": {"we": "a"}, "test_2": {}},
+    "group_test": {
+        "common": {"defined": {"we": "b"}},
+        "TestModel": {"defined": {"must_be": 3}},
+        "OtherTestModel": {"defined": {}},
+    },
+}
+
+
+class Connection:
+    barrier: threading.Barrier
+
+    def __init__(self, delay: float, fail: str = ""):
+        if fail:
+            raise ConnectionError(fail)
+        self.barrier.wait(timeout=5)
+        time.sleep(delay)
+        self.delay = delay
+
+
+class FrozenModel(BaseModel, frozen=True):
+    a: str
+
+
+@dataclass(frozen=True)
+class FrozenDataclass:
+    a: Any
+
+
+class TestConcurrentInstantiation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.homolog = HomologSchema(
+            single_schema=SingleSchema(origin=Connection),
+            instance_names=OrderedSet(("slow", "fast", "broken", "faster")),
+        )
+
+    def test_same_result_as_serial(self):
+        self.assertEqual(
+            model_culture_schema.parse_schema_to_instance_concurrently(defined),
+            model_culture_schema.parse_schema_to_instance(defined),
+        )
+
+    def test_concurrent_and_ordered(self):
+        Connection.barrier = threading.Barrier(3)
+        instances = self.homolog.parse_schema_to_instance_concurrently(
+            {"common": {}, "slow": {"delay": 0.05}, "fast": {"delay": 0.0}, "faster": {"delay": 0.0}}, max_workers=3
+        )
+        self.assertEqual(list(instances), ["slow", "fast", "faster"])
+        self.assertEqual(instances["slow"].delay, 0.05)
+
+    def test_failures_aggregated(self):
+        Connection.barrier = threading.Barrier(1)
+        with self.assertRaises(InstantiationErrorGroup) as context:
+            self.homolog.parse_schema_to_instance_concurrently(
+                {
+                    "common": {"delay": 0.0},
+                    "slow": {"fail": "refused"},
+                    "fast": {},
+                    "broken": {"fail": "timeout"},
+                    "faster": {},
+                }
+            )
+
+        errors = context.exception
+        self.assertEqual(list(errors.path_to_error), ["Connection/slow", "Connection/broken"])
+        self.assertEqual(str(errors.path_to_error["Connection/broken"]), "timeout")
+        self.assertEqual(list(errors.instances), ["fast", "faster"])
+        self.assertIn("Connection/slow: ConnectionError: refused", str(errors))
+
+    def test_culture_member_paths(self):
+        broken = {
+            **defined,
+            "single_test": {"defined": {}},
+            "group_test": {**defined["group_test"], "TestModel": {"defined": {}}},
+        }
+        with self.assertRaises(InstantiationErrorGroup) as context:
+            model_culture_schema.parse_schema_to_instance_concurrently(broken)
+
+        self.assertEqual(list(context.exception.path_to_error), ["single_test", "group_test/TestModel"])
+        self.assertTrue(all(isinstance(error, ValidationError) for error in context.exception.exceptions))
+        self.assertEqual(context.exception.instances["OtherTestModel"], OtherTestModel(we="b"))
+
+    def test_process_pool(self):
+        group = GroupSchema.from_originating_types(
+            origins=OrderedSet((TestModel, OtherTestModel)), mapping_name="group"
+        )
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as executor:
+            instances = group.parse_schema_to_instance_concurrently(defined["group_test"], executor=executor)
+
+        self.assertEqual(
+            instances, {"TestModel": TestModel(must_be=3, we="b"), "OtherTestModel": OtherTestModel(we="b")}
+        )
+
+    def test_shared_frozen_instances(self):
+        homolog = HomologSchema(
+            single_schema=SingleSchema(origin=FrozenModel),
+            instance_names=OrderedSet(("x", "y", "z")),
+            share_frozen_instances=True,
+        )
+        instances = homolog.parse_schema_to_instance_concurrently(
+            {"common": {"a": "a"}, "x": {}, "y": {}, "z": {"a": "z"}}
+        )
+        self.assertIs(instances["x"], instances["y"])
+        self.assertEqual(instances["z"], FrozenModel(a="z"))
+
+    def test_shared_by_content_not_identity(self):
+        homolog = HomologSchema(
+            single_schema=SingleSchema(origin=FrozenDataclass),
+            instance_names=OrderedSet(("tuple", "list", "also_tuple")),
+            share_frozen_instances=True,
+        )
+        instances = homolog.parse_schema_to_instance_concurrently(
+            {"common": {}, "tuple": {"a": (1, 2)}, "list": {"a": [1, 2]}, "also_tuple": {"a": (1, 2)}}
+        )
+        self.assertIs(instances["tuple"], instances["also_tuple"])
+        self.assertEqual(instances["list"], FrozenDataclass(a=[1, 2]))
+
+        # Equal configurations that are distinct objects
+        with mock.patch.object(HomologSchema, "parse_schema", return_value={"tuple": {"a": "a"}, "list": {"a": "a"}}):
+            instances = homolog.parse_schema_to_instance_concurrently({})
+        self.assertIs(instances["tuple"], instances["list"])
@@ -0,0 +1,79 @@
+import unittest
+from dataclasses import dataclass, field
+from test.schema.base import TestClass, TestDataclass, TestModel
+
+from ordered_set import OrderedSet
+
+from schemantic.schema.main import HomologSchema, SingleSchema
+from schemantic.utils.constructor import generate_layered_constructor, layered_constructor
+
+
+class KeywordOnly:
+    def __init__(self, a: int, *, b: str = "b"):
+        self.a = a
+        self.b = b
+
+
+@dataclass
+class WithFactory:
+    a: int
+    tags: list = field(default_factory=list)
+
+
+class TestLayeredConstructor(unittest.TestCase):
+    def test_highest_layer_wins(self):
+        construct = generate_layered_constructor(KeywordOnly, 3)
+        instance = construct({"a": 1, "b": "low"}, {"b": "middle"}, {"a": 3})
+        self.assertEqual((instance.a, instance.b), (3, "middle"))
+
+    def test_defaults(self):
+        self.assertEqual(generate_layered_constructor(KeywordOnly, 2)({}, {"a": 1}).b, "b")
+
+        construct = generate_layered_constructor(WithFactory, 2)
+        first, second = construct({"a": 1}, {}), construct({"a": 2}, {})
+        self.assertEqual(first.tags, [])
+        self.assertIsNot(first.tags, second.tags)
+
+    def test_falls_back_to_merged_call(self):
+        construct = generate_layered_constructor(KeywordOnly, 2)
+        for layers in (({"a": 1}, {"unknown": 1}), ({}, {"b": "b"})):
+            with self.subTest(layers=layers), self.assertRaises(TypeError):
+                construct(*layers)
+
+    def test_unsupported_signatures(self):
+        self.assertIsNone(generate_layered_constructor(TestModel, 2))
+
+        class VarKeyword:
+            def __init__(self, a: int, **kwargs):
+                pass
+
+        self.assertIsNone(generate_layered_constructor(VarKeyword, 2))
+
+    def test_cached(self):
+        self.assertIs(layered_constructor(KeywordOnly, 3), layered_constructor(KeywordOnly, 3))
+
+
+class TestHomologFastConstructor(unittest.TestCase):
+    def test_parity(self):
+        defined = {
+            "common": {"must_be": 1, "we": "common"},
+            "first": {"age": 2},
+            "second": {"we": "second"},
+        }
+        for origin in (TestClass, TestDataclass, TestModel):
+            with self.subTest(origin=origin.__name__):
+                schemas = [
+                    HomologSchema(
+                        single_schema=SingleSchema(origin=origin),
+                        instance_names=OrderedSet(("first", "second")),
+                        fast_constructor=fast_constructor,
+                    )
+                    for fast_constructor in (False, True)
+                ]
+                slow, fast = (
+                    schema.parse_schema_to_instance(defined, _inferior_config_kwargs={"new_age": 3})
+                    for schema in schemas
+                )
+                self.assertEqual(list(slow), list(fast))
+                for name in slow:
+                    self.assertEqual(vars(slow[name]), vars(fast[name]))
@@ -0,0 +1,93 @@
+import unittest
+from dataclasses import dataclass
+from test.schema.base import TestClass
+from types import MappingProxyType
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel, ValidationError
+
+from schemantic.schema.main import DedupStats, HomologSchema, SingleSchema
+from schemantic.utils.misc import content_digest
+
+
+class FrozenModel(BaseModel, frozen=True):
+    a: int
+    b: str = "b"
+
+
+@dataclass(frozen=True)
+class FrozenDataclass:
+    a: int
+    b: str = "b"
+
+
+class TestDedup(unittest.TestCase):
+    names = OrderedSet(f"instance_{i}" for i in range(6))
+    defined = {
+        "common": {"a": 1},
+        **{f"instance_{i}": {"b": "odd" if i % 2 else "even"} for i in range(5)},
+        "instance_5": {"b": "even", "a": 1},
+    }
+
+    def homolog(self, origin=FrozenModel, **kwargs) -> HomologSchema:
+        return HomologSchema(single_schema=SingleSchema(origin=origin), instance_names=self.names, **kwargs)
+
+    def test_configs_shared(self):
+        plain = self.homolog().parse_schema(self.defined)
+        deduplicated = self.homolog(dedup=True).parse_schema(self.defined)
+
+        self.assertEqual(plain, {name: dict(config) for name, config in deduplicated.items()})
+        self.assertEqual(DedupStats.of(plain), DedupStats(6, 6))
+        self.assertEqual(DedupStats.of(deduplicated), DedupStats(6, 2))
+        self.assertEqual(DedupStats.of(deduplicated).ratio, 3.0)
+        self.assertIs(deduplicated["instance_0"], deduplicated["instance_2"])
+
+    def test_configs_merged_from_different_layers_shared(self):
+        schema = HomologSchema(
+            single_schema=SingleSchema(origin=FrozenModel), instance_names=OrderedSet(["x", "z"]), dedup=True
+        )
+        deduplicated = schema.parse_schema({"common": {"a": 1}, "x": {}, "z": {"a": 1}})
+
+        self.assertIs(deduplicated["x"], deduplicated["z"])
+        self.assertEqual(deduplicated["x"], {"a": 1})
+        with self.assertRaises(TypeError):
+            deduplicated["x"]["a"] = 2
+
+    def test_colliding_digests_not_shared(self):
+        defined = {"common": {"a": 1}, "tuple": {"b": (1, 2)}, "list": {"b": [1, 2]}, "also_tuple": {"b": (1, 2)}}
+        self.assertEqual(content_digest({"b": (1, 2)}), content_digest({"b": [1, 2]}))
+
+        for fast_constructor in (False, True):
+            with self.subTest(fast_constructor=fast_constructor):
+                schema = HomologSchema(
+                    single_schema=SingleSchema(origin=FrozenDataclass),
+                    instance_names=OrderedSet(["tuple", "list", "also_tuple"]),
+                    share_frozen_instances=True,
+                    fast_constructor=fast_constructor,
+                )
+                configs = schema.parse_schema(defined)
+                self.assertEqual(configs["list"]["b"], [1, 2])
+                self.assertIs(configs["tuple"], configs["also_tuple"])
+
+                instances = schema.parse_schema_to_instance(defined)
+                self.assertEqual(instances["tuple"].b, (1, 2))
+                self.assertEqual(instances["list"].b, [1, 2])
+                self.assertIs(instances["tuple"], instances["also_tuple"])
+
+    def test_content_digest(self):
+        self.assertEqual(content_digest({"a": 1, 2: "b"}), content_digest({"a": 1, 2: "b"}))
+        self.assertEqual(content_digest({"a": MappingProxyType({"b": 1})}), content_digest({"a": {"b": 1}}))
+
+    def test_frozen_instances_shared(self):
+        for origin in (FrozenModel, FrozenDataclass):
+            for fast_constructor in (False, True):
+                with self.subTest(origin=origin.__name__, fast_constructor=fast_constructor):
+                    schema = self.homolog(origin, share_frozen_instances=True, fast_constructor=fast_constructor)
+                    instances = schema.parse_schema_to_instance(self.defined)
+                    self.assertIs(instances["instance_0"], instances["instance_4"])
+                    self.assertIsNot(instances["instance_0"], instances["instance_1"])
+                    self.assertEqual(instances["instance_1"], origin(a=1, b="odd"))
+
+    def test_sharing_instances_requires_frozen_origin(self):
+        with self.assertRaises(ValidationError):
+            self.homolog(TestClass, share_frozen_instances=True)
@@ -0,0 +1,79 @@
+import unittest
+from copy import deepcopy
+from test.schema.bare import model_culture_schema, model_group_schema, model_homolog_schema
+
+from schemantic.model.diff import MemberDiff
+from schemantic.utils.constant import SCHEMA_DEFINED_MAPPING_KEY
+
+
+class TestHomologDiff(unittest.TestCase):
+    def setUp(self):
+        self.old = model_homolog_schema.schema()
+        self.old.update(common={"must_be": 1}, test_1={"we": "a"}, test_2={})
+        self.new = deepcopy(self.old)
+
+    def test_unchanged(self):
+        self.assertFalse(model_homolog_schema.diff_defined(self.old, self.new))
+
+    def test_member_change(self):
+        self.new["test_1"] = {"we": "b", "age": 3}
+        diff = model_homolog_schema.diff_defined(self.old, self.new)
+
+        self.assertEqual(list(diff.changed), ["test_1"])
+        self.assertEqual(diff.changed["test_1"], MemberDiff(added_fields={"age": 3}, changed_fields={"we": ("a", "b")}))
+
+    def test_mixed_type_keys(self):
+        self.old["test_1"] = {"we": {1: "a", "b": "c"}}
+        self.new["test_1"] = {"we": {1: "a", "b": "c"}}
+        self.assertFalse(model_homolog_schema.diff_defined(self.old, self.new))
+
+        self.new["test_1"] = {"we": {1: "a", "b": "d"}}
+        self.assertEqual(list(model_homolog_schema.diff_defined(self.old, self.new).changed), ["test_1"])
+
+    def test_common_change_propagates(self):
+        self.new["common"] = {"must_be": 2}
+        diff = model_homolog_schema.diff_defined(self.old, self.new)
+
+        self.assertEqual(set(diff.changed), {"test_1", "test_2"})
+        self.assertEqual(diff.changed["test_2"].changed_fields, {"must_be": (1, 2)})
+
+    def test_common_change_shadowed_by_member(self):
+        self.old["test_1"]["must_be"] = 5
+        self.new["test_1"]["must_be"] = 5
+        self.new["common"] = {"must_be": 2}
+
+        self.assertEqual(list(model_homolog_schema.diff_defined(self.old, self.new).changed), ["test_2"])
+
+    def test_added_removed(self):
+        del self.new["test_2"]
+        self.new["test_3"] = {}
+        diff = model_homolog_schema.diff_defined(self.old, self.new)
+
+        self.assertEqual(diff.added, ["test_3"])
+        self.assertEqual(diff.removed, ["test_2"])
+        self.assertEqual(list(diff.changed_names), ["test_3", "test_2"])
+
+
+class TestGroupDiff(unittest.TestCase):
+    def test_common_change_propagates(self):
+        old = model_group_schema.schema()
+        new = deepcopy(old)
+        new["common"][SCHEMA_DEFINED_MAPPING_KEY]["we"] = "new"
+        new["TestModel"][SCHEMA_DEFINED_MAPPING_KEY]["must_be"] = 3
+
+        diff = model_group_schema.diff_defined(old, new)
+        self.assertEqual(diff.changed["TestModel"].added_fields, {"we": "new", "must_be": 3})
+        self.assertEqual(diff.changed["OtherTestModel"].added_fields, {"we": "new"})
+
+
+class TestCultureDiff(unittest.TestCase):
+    def test_changes_across_sources(self):
+        old = model_culture_schema.schema()
+        old["homolog_test"]["common"]["must_be"] = 1
+        new = deepcopy(old)
+        new["single_test"][SCHEMA_DEFINED_MAPPING_KEY]["must_be"] = 2
+        new["homolog_test"]["test_2"]["must_be"] = 2
+
+        diff = model_culture_schema.diff_defined(old, new)
+        self.assertEqual(list(diff.changed), ["single_test", "test_2"])
+        self.assertFalse(diff.added or diff.removed)
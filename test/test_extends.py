@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+from test.schema.bare import model_homolog_schema
+
+from schemantic import HomologSchema
+from schemantic.utils.constant import SCHEMA_EXTENDS_KEY
+from schemantic.utils.extends import defined_file_cache, load_defined_file
+from schemantic.utils.file import dump_schema_file
+
+
+class TestExtends(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        defined_file_cache.clear()
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _dump(self, name: str, document: dict) -> Path:
+        path = self.directory / name
+        dump_schema_file(document, path)
+        return path
+
+    def test_layered_parse(self):
+        base = model_homolog_schema.schema()
+        base["common"] = {"must_be": 1, "we": "base"}
+        self._dump("base.yaml", base)
+        tenant = self._dump(
+            "tenant.json", {SCHEMA_EXTENDS_KEY: "base.yaml", "common": {"we": "tenant"}, "test_2": {"must_be": 2}}
+        )
+
+        self.assertEqual(
+            model_homolog_schema.parse_schema(tenant),
+            {"test_1": {"must_be": 1, "we": "tenant"}, "test_2": {"must_be": 2, "we": "tenant"}},
+        )
+
+    def test_base_resolved_once(self):
+        self._dump("base.yaml", {"common": {"must_be": 1}})
+        self._dump("middle.yaml", {SCHEMA_EXTENDS_KEY: ["base.yaml"], "test_1": {}})
+        tenants = [
+            self._dump(f"tenant_{i}.yaml", {SCHEMA_EXTENDS_KEY: "middle.yaml", "test_2": {"must_be": i}})
+            for i in range(20)
+        ]
+
+        for tenant in tenants:
+            HomologSchema.load(tenant)
+
+        self.assertEqual(defined_file_cache.misses, 2)
+        self.assertEqual(defined_file_cache.hits, len(tenants) - 1)
+
+    def test_cached_base_not_aliased(self):
+        self._dump("base.yaml", {"common": {"must_be": 1, "nested": {"we": "base"}}})
+        tenant = self._dump("tenant.yaml", {SCHEMA_EXTENDS_KEY: "base.yaml", "test_1": {}})
+
+        document = load_defined_file(tenant)
+        document["common"]["nested"]["we"] = "mutated"
+        document["common"]["must_be"] = 2
+
+        self.assertEqual(load_defined_file(tenant)["common"], {"must_be": 1, "nested": {"we": "base"}})
+        self.assertEqual(defined_file_cache.hits, 1)
+
+    def test_base_change_invalidates(self):
+        base = self._dump("base.yaml", {"common": {"must_be": 1}})
+        tenant = self._dump("tenant.yaml", {SCHEMA_EXTENDS_KEY: "base.yaml"})
+        self.assertEqual(HomologSchema.load(tenant)["common"], {"must_be": 1})
+
+        dump_schema_file({"common": {"must_be": 22}}, base)
+        self.assertEqual(HomologSchema.load(tenant)["common"], {"must_be": 22})
+
+    def test_cycle(self):
+        self._dump("a.yaml", {SCHEMA_EXTENDS_KEY: "b.yaml"})
+        self._dump("b.yaml", {SCHEMA_EXTENDS_KEY: "a.yaml"})
+        with self.assertRaises(ValueError):
+            HomologSchema.load(self.directory / "a.yaml")
@@ -0,0 +1,115 @@
+import unittest
+from dataclasses import InitVar, dataclass, field
+from test.schema.base import OtherTestClass, TestClass, TestDataclass
+from typing import ClassVar, Optional
+
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+from schemantic.model.field_info import (
+    class_field_alias_to_type_string,
+    dataclass_field_alias_to_field_info,
+    is_dataclass_with_generated_init,
+    resolved_parameters,
+)
+from schemantic.model.schematic import extract_schematic, extract_schematics
+
+
+class Base:
+    def __init__(self, a: "int", b: "Optional[str]" = None, c: "str | None" = "c"):
+        pass
+
+
+class Inheriting(Base):
+    pass
+
+
+class TestResolvedParameters(unittest.TestCase):
+    def test_shared_by_inheriting_classes(self):
+        self.assertIs(resolved_parameters(Base.__init__), resolved_parameters(Inheriting.__init__))
+        self.assertEqual(
+            [parameter.type_hint for parameter in resolved_parameters(Base.__init__)],
+            [int, Optional[str], str | None],
+        )
+
+    def test_defaults_keep_their_owner(self):
+        base, inheriting = (class_field_alias_to_type_string(origin) for origin in (Base, Inheriting))
+        self.assertEqual(base["optional"]["c"].owner_to_default, {Base: "c"})
+        self.assertEqual(inheriting["optional"]["c"].owner_to_default, {Inheriting: "c"})
+        self.assertEqual(base["optional"]["b"].type_hint, "str")
+        self.assertEqual(base["optional"]["c"].type_hint, "str")
+
+    def test_batch_extraction(self):
+        origins = [TestClass, OtherTestClass, Base, Inheriting]
+        origin_to_schematic = extract_schematics(origins)
+        self.assertEqual(list(origin_to_schematic), origins)
+        for origin in origins:
+            self.assertIs(origin_to_schematic[origin], extract_schematic(origin))
+
+
+@dataclass
+class Rich:
+    a: int
+    b: InitVar[str]
+    c: Optional[str] = None
+    d: list = field(default_factory=list)
+    e: str = field(default="e", init=False)
+    f: ClassVar[int] = 0
+    g: str = field(default="g", kw_only=True)
+
+
+@pydantic_dataclass
+class PydanticRich:
+    a: int
+    c: Optional[str] = None
+    d: list = field(default_factory=list)
+    e: str = field(default="e", init=False)
+    g: str = field(default="g", kw_only=True)
+
+
+def _field_info_strings(result: dict) -> dict:
+    return {group: {name: info.field_info_string for name, info in infos.items()} for group, infos in result.items()}
+
+
+class TestDataclassExtraction(unittest.TestCase):
+    def test_parity_with_signature_extraction(self):
+        for kwargs in ({}, dict(fields_to_exclude={"exclude_me"}), dict(include_private=True)):
+            with self.subTest(**kwargs):
+                self.assertEqual(
+                    _field_info_strings(dataclass_field_alias_to_field_info(TestDataclass, **kwargs)),
+                    _field_info_strings(class_field_alias_to_type_string(TestDataclass, **kwargs)),
+                )
+
+    def test_field_options(self):
+        expected = {
+            "required": {"a": "int", "b": "str"},
+            "optional": {"c": "str", "d": "list", "g": "str(default: Rich -> g)"},
+        }
+        self.assertEqual(_field_info_strings(dataclass_field_alias_to_field_info(Rich)), expected)
+
+        del expected["required"]["b"]
+        expected["optional"]["g"] = "str(default: PydanticRich -> g)"
+        self.assertEqual(_field_info_strings(dataclass_field_alias_to_field_info(PydanticRich)), expected)
+
+    def test_routing(self):
+        self.assertTrue(is_dataclass_with_generated_init(TestDataclass))
+        self.assertTrue(is_dataclass_with_generated_init(PydanticRich))
+        self.assertFalse(is_dataclass_with_generated_init(TestClass))
+
+        class Undecorated(Rich):
+            def __init__(self, z: int):
+                pass
+
+        self.assertFalse(is_dataclass_with_generated_init(Undecorated))
+        self.assertEqual(list(extract_schematic(Undecorated).field_to_info), ["z"])
+        self.assertEqual(list(extract_schematic(PydanticRich).field_to_info), ["a", "c", "d", "g"])
+
+    def test_routing_hand_written_init(self):
+        @dataclass
+        class HandWritten:
+            a: str = "x"
+
+            def __init__(self, b: str):
+                self.a = b
+
+        self.assertFalse(is_dataclass_with_generated_init(HandWritten))
+        self.assertEqual(list(extract_schematic(HandWritten).field_to_info), ["b"])
@@ -0,0 +1,28 @@
+import pickle
+import unittest
+from test.schema.base import OtherTestModel, TestModel
+
+from ordered_set import OrderedSet
+from pydantic import BaseModel, create_model
+
+from schemantic.schema.main import HomologSchema, SingleSchema
+
+
+class TestRuntimeGenerics(unittest.TestCase):
+    def test_no_class_per_origin(self):
+        origins = [create_model(f"Origin{i}", value=(int, ...)) for i in range(20)]
+        subclass_count = len(SingleSchema.__subclasses__()) + len(HomologSchema.__subclasses__())
+
+        for origin in origins:
+            self.assertIs(SingleSchema[origin], SingleSchema)
+            self.assertIs(HomologSchema[origin], HomologSchema)
+
+        self.assertEqual(len(SingleSchema.__subclasses__()) + len(HomologSchema.__subclasses__()), subclass_count)
+
+    def test_typed_usage(self):
+        single: SingleSchema[TestModel] = SingleSchema[TestModel](origin=TestModel)
+        homolog = HomologSchema[TestModel](single_schema=single, instance_names=OrderedSet(("a", "b")))
+
+        self.assertEqual(homolog.parse_schema_to_instance({"common": {"must_be": 1}, "a": {}, "b": {}})["b"].must_be, 1)
+        self.assertEqual(pickle.loads(pickle.dumps(homolog)).schema(), homolog.schema())
+        self.assertEqual(SingleSchema[BaseModel](origin=OtherTestModel).mapping_name, "OtherTestModel")
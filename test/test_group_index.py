@@ -0,0 +1,82 @@
+import pickle
+import unittest
+from copy import deepcopy
+from test.schema.base import OtherTestClass, OtherTestModel, TestClass, TestModel
+
+from ordered_set import OrderedSet
+
+from schemantic.schema.main import GroupSchema, SingleSchema
+
+
+class TestGroupIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.group = GroupSchema.from_originating_types(
+            origins=OrderedSet((TestClass, OtherTestClass, TestModel)), mapping_name="group"
+        )
+
+    def test_indexes_cached(self):
+        name_index = self.group.schema_mapping_name_to_instance_schema
+        self.assertIs(self.group.schema_mapping_name_to_instance_schema, name_index)
+        self.assertIs(name_index["TestModel"].origin, TestModel)
+        self.assertEqual(
+            [schema.mapping_name for schema in self.group.origin_to_instance_schemas[OtherTestClass]],
+            ["OtherTestClass"],
+        )
+
+    def test_hash_stable(self):
+        rebuilt = GroupSchema.from_originating_types(
+            origins=OrderedSet((TestClass, OtherTestClass, TestModel)), mapping_name="group"
+        )
+        self.assertEqual(hash(self.group), hash(self.group))
+        self.assertEqual(hash(self.group), hash(rebuilt))
+
+        replaced = self.group.model_copy(update={"single_schemas": OrderedSet((SingleSchema(origin=TestModel),))})
+        self.assertNotEqual(hash(replaced), hash(self.group))
+        self.group.single_schemas = replaced.single_schemas
+        self.assertEqual(hash(self.group), hash(replaced))
+
+    def test_members_frozen(self):
+        self.assertIn("TestModel", self.group.schema_mapping_name_to_instance_schema)
+        for change in (
+            lambda members: members.add(SingleSchema(origin=OtherTestModel)),
+            lambda members: members.discard(next(iter(members))),
+            lambda members: members.pop(),
+            lambda members: members.clear(),
+            lambda members: members.difference_update(members),
+        ):
+            with self.assertRaises(TypeError):
+                change(self.group.single_schemas)
+
+        self.assertEqual(len(self.group.single_schemas), 3)
+        self.assertEqual(list(self.group.schema_mapping_name_to_instance_schema)[-1], "TestModel")
+
+    def test_replacing_members_invalidates(self):
+        hash(self.group)
+        self.assertIn("TestModel", self.group.member_label_to_origin)
+        self.group.single_schemas = OrderedSet((SingleSchema(origin=OtherTestModel),))
+
+        self.assertEqual(list(self.group.schema_mapping_name_to_instance_schema), ["OtherTestModel"])
+        self.assertEqual(self.group.member_label_to_origin, {"OtherTestModel": OtherTestModel})
+        self.assertEqual(list(self.group.origin_to_instance_schemas), [OtherTestModel])
+        self.assertEqual(hash(self.group), hash(frozenset(self.group.single_schemas)))
+
+    def test_copy_with_replaced_members_invalidates(self):
+        hash(self.group)
+        self.assertIn("TestModel", self.group.member_label_to_origin)
+        copied = self.group.model_copy(update={"single_schemas": OrderedSet((SingleSchema(origin=OtherTestModel),))})
+
+        self.assertEqual(copied.member_label_to_origin, {"OtherTestModel": OtherTestModel})
+        self.assertEqual(list(copied.origin_to_instance_schemas), [OtherTestModel])
+        self.assertEqual(hash(copied), hash(frozenset(copied.single_schemas)))
+        self.assertIn("TestModel", self.group.member_label_to_origin)
+
+    def test_copies(self):
+        hash(self.group)
+        self.assertIn("TestModel", self.group.schema_mapping_name_to_instance_schema)
+        for copied in (deepcopy(self.group), pickle.loads(pickle.dumps(self.group))):
+            with self.subTest(copied=copied):
+                self.assertEqual(hash(copied), hash(self.group))
+                self.assertEqual(
+                    list(copied.schema_mapping_name_to_instance_schema),
+                    list(self.group.schema_mapping_name_to_instance_schema),
+                )
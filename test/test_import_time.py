@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import unittest
+
+
+def _imported_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    return {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+class TestImportTime(unittest.TestCase):
+    def test_package_import_is_lazy(self):
+        modules = _imported_modules("import schemantic")
+        self.assertNotIn("pydantic", modules)
+        self.assertNotIn("ordered_set", modules)
+        self.assertNotIn("schemantic.schema.main", modules)
+
+    def test_abstract_does_not_import_implementations(self):
+        modules = _imported_modules("import schemantic.schema.abstract")
+        self.assertNotIn("schemantic.schema.main", modules)
+        self.assertNotIn("schemantic.project", modules)
+
+    def test_public_names_resolve_on_access(self):
+        import schemantic
+        from schemantic.schema import main
+
+        self.assertIs(schemantic.SingleSchema, main.SingleSchema)
+        self.assertIn("CultureSchema", dir(schemantic))
+        with self.assertRaises(AttributeError):
+            schemantic.NotAName  # noqa: B018
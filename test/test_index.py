@@ -0,0 +1,124 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from test.schema.bare import model_culture_schema
+from test.schema.base import TestModel
+from unittest import mock
+
+from ordered_set import OrderedSet
+from parameterized import parameterized
+
+from schemantic.schema.main import HomologSchema, SingleSchema
+from schemantic.utils import index
+from schemantic.utils.file import dump_schema_file, load_schema_file
+from schemantic.utils.index import build_index, defined_index, index_path, load_member, load_top_level
+
+document = {
+    "first": {"nested": {"x": 1, "y": [1, {"z": 'q"}{'}]}, "s": "back\\slash", "unicode": "über"},
+    "second": [1, 2.5, None, True],
+    "third": "value",
+}
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name: str) -> Path:
+        return Path(self.directory.name) / name
+
+    @parameterized.expand([(".json",), (".yaml",)])
+    def test_load_member(self, suffix: str):
+        path = self.path(f"defined{suffix}")
+        dump_schema_file(document, path)
+
+        for key, value in document.items():
+            self.assertEqual(load_member(path, key), value)
+        self.assertEqual(load_top_level(path, ("third", "missing")), {"third": "value"})
+        self.assertEqual(load_member(path, "first", nested_keys=("s", "missing")), {"s": "back\\slash"})
+        self.assertTrue(index_path(path).exists())
+
+    def test_only_region_decoded(self):
+        path = self.path("defined.json")
+        dump_schema_file(document, path)
+        defined_index(path)
+
+        with mock.patch.object(index.json, "loads", wraps=json.loads) as loads:
+            self.assertEqual(
+                load_member(path, "first", nested_keys=("nested",)), {"nested": document["first"]["nested"]}
+            )
+        loads.assert_called_once()
+        self.assertNotIn(b"third", loads.call_args.args[0])
+
+    def test_rebuilt_on_change(self):
+        path = self.path("defined.json")
+        dump_schema_file(document, path)
+        self.assertEqual(load_member(path, "third"), "value")
+
+        dump_schema_file({**document, "third": "changed value"}, path)
+        self.assertEqual(load_member(path, "third"), "changed value")
+        self.assertEqual(json.loads(index_path(path).read_text())["stamp"][1], path.stat().st_size)
+
+    def test_not_indexed(self):
+        for name, text in (
+            ("defined.json.gz", None),
+            ("anchors.yaml", "a: &x 1\nb: *x\n"),
+            ("extends.yaml", "extends: [base.yaml]\na: 1\n"),
+            ("flow.yaml", "{a: 1, b: 2}\n"),
+        ):
+            with self.subTest(name=name):
+                path = self.path(name)
+                if text is None:
+                    dump_schema_file(document, path)
+                else:
+                    path.write_text(text)
+                self.assertIsNone(build_index(path))
+
+        self.path("base.yaml").write_text("c: 3\n")
+        self.assertEqual(load_member(self.path("extends.yaml"), "c"), 3)
+        self.assertEqual(load_member(self.path("defined.json.gz"), "third"), "value")
+
+
+class TestSchemaIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = Path(self.directory.name) / "culture.json"
+        self.defined = {
+            "single_test": {"defined": {"must_be": 1}},
+            "homolog_test": {"common": {"must_be": 2}, "test_1": {"we": "a"}, "test_2": {}},
+            "group_test": {
+                "common": {"defined": {"we": "b"}},
+                "TestModel": {"defined": {"must_be": 3}},
+                "OtherTestModel": {"defined": {}},
+            },
+        }
+        dump_schema_file(self.defined, self.path)
+
+    def test_dump_with_index(self):
+        path = Path(self.directory.name) / "homolog.yaml"
+        homolog = HomologSchema(single_schema=SingleSchema(origin=TestModel), instance_names=OrderedSet(("a", "b")))
+        homolog.dump(path, with_index=True)
+
+        self.assertEqual(set(defined_index(path).spans), set(load_schema_file(path)))
+
+    def test_load_source(self):
+        self.assertEqual(model_culture_schema.load_source(self.path, "group_test"), self.defined["group_test"])
+        self.assertEqual(
+            model_culture_schema.parse_source_to_instance(self.path, "homolog_test", names=("test_1",)),
+            {"test_1": TestModel(must_be=2, we="a")},
+        )
+        with self.assertRaises(ValueError):
+            model_culture_schema.load_source(self.path, "single_test", names=("test_1",))
+
+    def test_homolog_names(self):
+        path = Path(self.directory.name) / "homolog.yaml"
+        dump_schema_file(self.defined["homolog_test"], path)
+        homolog = HomologSchema(
+            single_schema=SingleSchema(origin=TestModel), instance_names=OrderedSet(("test_1", "test_2"))
+        )
+
+        self.assertEqual(homolog.load_sharded(path, names=("test_2",)), {"common": {"must_be": 2}, "test_2": {}})
+        self.assertIsNotNone(defined_index(path))
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+from test.schema.bare import model_culture_schema
+from test.schema.base import TestModel
+
+from schemantic import SingleSchema
+from schemantic.instrument import PhaseStats, tracing
+from schemantic.utils.constant import SCHEMA_DEFINED_MAPPING_KEY
+
+
+class TestInstrumentation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.defined = model_culture_schema.schema()
+        cls.defined["single_test"][SCHEMA_DEFINED_MAPPING_KEY]["must_be"] = 1
+        cls.defined["homolog_test"]["common"]["must_be"] = 1
+        cls.defined["group_test"]["TestModel"][SCHEMA_DEFINED_MAPPING_KEY]["must_be"] = 1
+
+    def test_phases_tagged_with_mapping_name(self):
+        with tempfile.TemporaryDirectory() as directory:
+            defined_path = Path(directory) / "culture.yaml"
+            model_culture_schema.dump(defined_path)
+            model_culture_schema.load(defined_path)
+
+            with tracing(PhaseStats()) as stats:
+                model_culture_schema.parse_schema_to_instance(self.defined)
+                model_culture_schema.schema()
+                model_culture_schema.parse_schema(defined_path)
+
+        statistics = stats.statistics()
+        for key in (
+            ("parse", "homolog_test"),
+            ("merge", "group_test"),
+            ("instantiate", "single_test"),
+            ("render", "group_test"),
+            ("render", None),
+            ("load", None),
+        ):
+            self.assertIn(key, statistics)
+        self.assertEqual(statistics[("instantiate", "homolog_test")].count, 1)
+
+        self.assertIn("instantiate", stats.report())
+        self.assertEqual({row["phase"] for row in stats.export()}, {"parse", "merge", "instantiate", "render", "load"})
+
+    def test_extract(self):
+        with tracing(PhaseStats()) as stats:
+            schematic = SingleSchema(origin=TestModel, schema_alias="traced").schematic
+
+        self.assertEqual(schematic.class_name, "TestModel")
+        self.assertEqual(stats.statistics()[("extract", "traced")].count, 1)
+
+    def test_disabled_after_context(self):
+        with tracing(PhaseStats()) as stats:
+            pass
+        model_culture_schema.parse_schema_to_instance(self.defined)
+        self.assertFalse(stats.statistics())
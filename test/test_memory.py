@@ -0,0 +1,38 @@
+import unittest
+from test.schema.bare import model_culture_schema, model_homolog_schema
+
+from schemantic.utils.constant import SCHEMA_DEFINED_MAPPING_KEY
+from schemantic.utils.memory import deep_sizeof
+
+
+class TestMemoryReport(unittest.TestCase):
+    def test_deep_sizeof_counts_shared_once(self):
+        shared = list(range(100))
+        seen = set()
+        first = deep_sizeof({"a": shared}, seen)
+        second = deep_sizeof({"b": shared}, seen)
+        self.assertGreater(first, second)
+
+    def test_homolog_duplicates(self):
+        defined = model_homolog_schema.schema()
+        defined.update(common={"must_be": 1}, test_1={}, test_2={})
+
+        report = model_homolog_schema.memory_report(defined, model_homolog_schema.parse_schema_to_instance(defined))
+
+        self.assertEqual(report.duplicates[0].members, ["test_1", "test_2"])
+        self.assertGreater(report.wasted_bytes, 0)
+        self.assertGreater(report.by_category["instance"], 0)
+        self.assertGreater(report.by_member["test_1"], 0)
+        self.assertIn("duplicates:", report.format())
+
+    def test_culture_categories(self):
+        defined = model_culture_schema.schema()
+        defined["single_test"][SCHEMA_DEFINED_MAPPING_KEY]["must_be"] = 1
+        defined["homolog_test"]["common"]["must_be"] = 1
+        defined["homolog_test"]["test_2"]["must_be"] = 2
+
+        report = model_culture_schema.memory_report(defined)
+        self.assertTrue(
+            {"field_metadata", "schematic", "schema", "defined", "parsed_config"}.issubset(report.by_category)
+        )
+        self.assertEqual(report.total, sum(report.by_category.values()))
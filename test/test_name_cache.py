@@ -0,0 +1,102 @@
+import pickle
+import time
+import unittest
+from test.schema.base import TestClass
+from unittest import mock
+
+from ordered_set import OrderedSet
+
+from schemantic.registry import register_name_getter
+from schemantic.schema.main import HomologSchema, SingleSchema
+
+calls: list[dict] = []
+
+
+@register_name_getter
+def counting_name_getter(**kwargs) -> OrderedSet[str]:
+    calls.append(kwargs)
+    return OrderedSet(f"{kwargs['prefix']}_{i}" for i in range(2))
+
+
+def _homolog(ttl) -> HomologSchema:
+    return HomologSchema(
+        single_schema=SingleSchema(origin=TestClass),
+        instance_names=OrderedSet(("fixed",)),
+        name_getter=counting_name_getter,
+        name_getter_cache_ttl=ttl,
+    )
+
+
+class TestNameGetterCache(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_disabled_by_default(self):
+        schema = _homolog(None)
+        for _ in range(2):
+            schema.homolog_names(dict(prefix="a"))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(schema.name_cache_stats().size, 0)
+
+    def test_cached_per_kwargs(self):
+        schema = _homolog(float("inf"))
+        first = schema.homolog_names(dict(prefix="a"))
+        self.assertIs(schema.homolog_names(dict(prefix="a")), first)
+        self.assertEqual(list(first), ["a_0", "a_1", "fixed"])
+        with self.assertRaises(TypeError):
+            first.add("mutated")
+        schema.homolog_names(dict(prefix="b"))
+        schema.homolog_names(dict(prefix=["unhashable"]))
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(tuple(schema.name_cache_stats()), (1, 2, 1, 2))
+
+    def test_ttl_and_refresh(self):
+        schema = _homolog(0.05)
+        schema.homolog_names(dict(prefix="a"))
+        schema.homolog_names(dict(prefix="a"))
+        time.sleep(0.06)
+        schema.homolog_names(dict(prefix="a"))
+        self.assertEqual(len(calls), 2)
+
+        schema.name_getter_cache_ttl = float("inf")
+        schema.refresh_names(dict(prefix="a"))
+        schema.homolog_names(dict(prefix="a"))
+        schema.refresh_names()
+        schema.homolog_names(dict(prefix="a"))
+        self.assertEqual(len(calls), 4)
+
+    def test_replaced_instance_names_invalidate(self):
+        schema = _homolog(float("inf"))
+        schema.homolog_names(dict(prefix="a"))
+
+        schema.instance_names = OrderedSet(("other",))
+        self.assertEqual(list(schema.homolog_names(dict(prefix="a"))), ["a_0", "a_1", "other"])
+
+        copied = schema.model_copy(update={"instance_names": OrderedSet(("copied",))})
+        self.assertEqual(list(copied.homolog_names(dict(prefix="a"))), ["a_0", "a_1", "copied"])
+        self.assertEqual(list(schema.homolog_names(dict(prefix="a"))), ["a_0", "a_1", "other"])
+        self.assertEqual(len(calls), 3)
+
+    def test_eviction(self):
+        schema = _homolog(0.05)
+        schema.homolog_names(dict(prefix="a"))
+        time.sleep(0.06)
+        schema.homolog_names(dict(prefix="b"))
+        self.assertEqual(schema.name_cache_stats().size, 1)
+
+        schema.name_getter_cache_ttl = float("inf")
+        with mock.patch.object(HomologSchema, "name_cache_max_size", 2):
+            for prefix in "cde":
+                schema.homolog_names(dict(prefix=prefix))
+            self.assertEqual(schema.name_cache_stats().size, 2)
+            schema.homolog_names(dict(prefix="e"))
+            schema.homolog_names(dict(prefix="c"))
+        self.assertEqual([kwargs["prefix"] for kwargs in calls], ["a", "b", "c", "d", "e", "c"])
+
+    def test_cache_not_pickled(self):
+        schema = _homolog(float("inf"))
+        schema.homolog_names(dict(prefix="a"))
+        restored = pickle.loads(pickle.dumps(schema))
+        self.assertEqual(restored.name_cache_stats().size, 0)
+        self.assertEqual(restored.name_getter_cache_ttl, float("inf"))
@@ -0,0 +1,98 @@
+import tempfile
+import unittest
+from pathlib import Path
+from test.schema.base import TestClass, TestModel
+
+from parameterized import parameterized
+from pydantic import ValidationError
+
+from schemantic.model.names import NameProduct, NameRange, name_spec_from_dict
+from schemantic.schema.main import HomologSchema, SingleSchema
+from schemantic.utils.constant import SCHEMA_INSTANCE_NAMES_KEY
+
+
+class TestNameSpec(unittest.TestCase):
+    def test_range(self):
+        names = NameRange(template="worker-{:05d}", start=10, stop=100_000, step=10)
+        self.assertEqual(len(names), 9999)
+        self.assertEqual(list(names)[:2], ["worker-00010", "worker-00020"])
+        self.assertIn("worker-99990", names)
+        for name in ("worker-00011", "worker-10", "worker-100000", "worker-00000", "worker-", 10):
+            with self.subTest(name=name):
+                self.assertNotIn(name, names)
+
+    def test_range_width_padded(self):
+        names = NameRange(template="w{:3}", start=8, stop=12)
+        self.assertEqual(list(names), ["w  8", "w  9", "w 10", "w 11"])
+        for name in names:
+            with self.subTest(name=name):
+                self.assertIn(name, names)
+        self.assertNotIn("w8", names)
+
+    def test_product(self):
+        names = NameProduct(template="{}-{}", labels=[["eu", "us"], ["a", "b-c"]])
+        self.assertEqual(list(names), ["eu-a", "eu-b-c", "us-a", "us-b-c"])
+        self.assertEqual(len(names), 4)
+        self.assertIn("us-b-c", names)
+        self.assertNotIn("us-b", names)
+
+    def test_round_trip(self):
+        for names in (NameRange(template="w{:03d}", stop=5), NameProduct(template="{}{}", labels=[["a"], ["b", "c"]])):
+            with self.subTest(names=names):
+                self.assertEqual(name_spec_from_dict(names.to_dict()), names)
+
+    def test_invalid(self):
+        with self.assertRaises(ValidationError):
+            NameRange(template="{}-{}", stop=3)
+        for template in ("w{:x}", "w{:b}", "w{:+d}", "w{:>5}", "w{:,}", "w{:.2f}"):
+            with self.subTest(template=template), self.assertRaises(ValidationError):
+                NameRange(template=template, stop=3)
+        with self.assertRaises(ValidationError):
+            NameProduct(template="{}", labels=[["a"], ["b"]])
+        with self.assertRaises(ValueError):
+            name_spec_from_dict(dict(kind="unknown"))
+
+
+class TestHomologWithNameSpec(unittest.TestCase):
+    names = NameRange(template="worker-{:04d}", stop=1000)
+
+    def homolog(self, origin=TestClass, **kwargs) -> HomologSchema:
+        return HomologSchema(single_schema=SingleSchema(origin=origin), instance_names=self.names, **kwargs)
+
+    def test_schema_keeps_names_symbolic(self):
+        schema = self.homolog(pre_definitions={"worker-0001": {"age": 1}, "other": {"age": 2}}).schema()
+        self.assertEqual(schema[SCHEMA_INSTANCE_NAMES_KEY], self.names.to_dict())
+        self.assertEqual(schema["worker-0001"], {"age": 1})
+        self.assertNotIn("worker-0002", schema)
+        self.assertNotIn("other", schema)
+
+    def test_prohibited_names(self):
+        with self.assertRaises(AttributeError):
+            HomologSchema(
+                single_schema=SingleSchema(origin=TestClass),
+                instance_names=NameProduct(template="{}", labels=[["common", "a"]]),
+            ).homolog_names()
+
+    @parameterized.expand([(".yaml",), (".toml",), (".json",)])
+    def test_dump_and_parse(self, suffix):
+        for fast_constructor in (False, True):
+            schema = self.homolog(origin=TestModel, fast_constructor=fast_constructor)
+            defined = schema.schema()
+            defined["common"] = {"must_be": 1}
+            defined["worker-0007"] = {"age": 7}
+            defined["extra"] = {"age": 8}
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / f"homolog{suffix}"
+                schema.dump(path)
+                loaded = schema.load(path)
+                self.assertEqual(loaded[SCHEMA_INSTANCE_NAMES_KEY], self.names.to_dict())
+
+            parsed = schema.parse_schema(defined)
+            self.assertEqual(list(parsed), [*self.names, "extra"])
+            self.assertEqual(parsed["worker-0000"], {"must_be": 1})
+            self.assertEqual(parsed["worker-0007"], {"must_be": 1, "age": 7})
+
+            instances = schema.parse_schema_to_instance(defined)
+            self.assertEqual(len(instances), 1001)
+            self.assertEqual(instances["worker-0007"].age, 7)
@@ -0,0 +1,66 @@
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from test.schema.bare import class_culture_schema, class_homolog_schema, model_culture_schema
+from test.schema.base import TestClass
+
+from ordered_set import OrderedSet
+
+from schemantic.registry import register_name_getter
+from schemantic.schema.main import HomologSchema, SingleSchema
+from schemantic.schema.pickling import carrying_schematics, dumps
+
+fleet_name_getter = register_name_getter(lambda **kwargs: OrderedSet(f"fleet_{i}" for i in range(kwargs["n"])), "fleet")
+
+
+def _schema_in_worker(payload: bytes) -> dict:
+    return pickle.loads(payload).schema(name_getter_kwargs=dict(n=2))
+
+
+class TestPickling(unittest.TestCase):
+    def test_round_trip(self):
+        for schema in (class_homolog_schema, class_culture_schema, model_culture_schema):
+            with self.subTest(schema=schema):
+                restored = pickle.loads(pickle.dumps(schema))
+                self.assertIsNot(restored, schema)
+                self.assertEqual(restored.schema(), schema.schema())
+
+    def test_schematics_only_carried_on_request(self):
+        schema = SingleSchema(origin=TestClass)
+        schematic = schema.schematic
+
+        self.assertNotIn("schematic", pickle.loads(pickle.dumps(schema)).__dict__)
+        self.assertNotIn(b"Schematic", pickle.dumps(schema))
+
+        restored = pickle.loads(dumps(schema, with_schematics=True))
+        self.assertEqual(restored.__dict__["schematic"], schematic)
+        with carrying_schematics():
+            self.assertIn(b"Schematic", pickle.dumps(schema))
+
+    def test_name_getter_by_registered_name(self):
+        schema = HomologSchema(
+            single_schema=SingleSchema(origin=TestClass),
+            instance_names=OrderedSet(("a",)),
+            name_getter=fleet_name_getter,
+        )
+        restored = pickle.loads(pickle.dumps(schema))
+        self.assertIs(restored.name_getter, fleet_name_getter)
+
+        schema.name_getter = lambda **kwargs: OrderedSet()
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(schema)
+
+    def test_process_pool_worker(self):
+        schema = HomologSchema(
+            single_schema=SingleSchema(origin=TestClass),
+            instance_names=OrderedSet(("a",)),
+            name_getter=fleet_name_getter,
+        )
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(_schema_in_worker, pickle.dumps(schema)).result(timeout=60)
+        self.assertEqual(result, schema.schema(name_getter_kwargs=dict(n=2)))
+
+    def test_compact(self):
+        class_culture_schema.schema()
+        compact = pickle.dumps(class_culture_schema)
+        self.assertLess(len(compact), len(pickle.dumps(class_culture_schema.__getstate__())))
@@ -0,0 +1,48 @@
+import unittest
+from test.schema.base import TestClass, TestDataclass, TestModel
+
+from schemantic.project import SchemanticProjectMixin
+
+
+class TestResolvedSingleSchemaKwargs(unittest.TestCase):
+    def test_matches_class_properties(self):
+        for origin in (TestClass, TestDataclass, TestModel):
+            with self.subTest(origin=origin.__name__):
+                resolved = origin.resolved_single_schema_kwargs()
+                self.assertEqual(resolved["fields_to_exclude"], origin.fields_to_exclude_from_single_schema)
+                self.assertEqual(resolved["include_private"], origin.include_private)
+
+    def test_cached_and_immutable(self):
+        resolved = TestClass.resolved_single_schema_kwargs()
+        self.assertIs(resolved, TestClass.resolved_single_schema_kwargs())
+        self.assertIsInstance(resolved["fields_to_exclude"], frozenset)
+        with self.assertRaises(TypeError):
+            resolved["include_private"] = True  # type: ignore[index]
+
+    def test_recompute_after_runtime_change(self):
+        class Parent(SchemanticProjectMixin):
+            excluded: set[str] = {"a"}
+
+            @classmethod
+            @property
+            def fields_to_exclude_from_single_schema(cls) -> set[str]:
+                upstream = super().fields_to_exclude_from_single_schema
+                upstream.update(cls.excluded)
+                return upstream
+
+        class Child(Parent):
+            @classmethod
+            @property
+            def fields_to_exclude_from_single_schema(cls) -> set[str]:
+                upstream = super().fields_to_exclude_from_single_schema
+                upstream.update(("b",))
+                return upstream
+
+        self.assertEqual(Child.resolved_single_schema_kwargs()["fields_to_exclude"], {"a", "b"})
+
+        Parent.excluded = {"c"}
+        self.assertEqual(Child.resolved_single_schema_kwargs()["fields_to_exclude"], {"a", "b"})
+
+        Parent.recompute_single_schema_kwargs()
+        self.assertEqual(Parent.resolved_single_schema_kwargs()["fields_to_exclude"], {"c"})
+        self.assertEqual(Child.resolved_single_schema_kwargs()["fields_to_exclude"], {"b", "c"})
@@ -0,0 +1,91 @@
+import gc
+import unittest
+import weakref
+from test.schema.bare import class_culture_schema
+from test.schema.base import OtherTestClass, TestClass, TestDataclass, TestModel
+
+from schemantic.model.schematic import extract_schematic, schematic_cache
+from schemantic.project import SchemanticProjectMixin, SchemanticProjectModelMixin
+from schemantic.registry import register_origin, registered_origins, unregister_origin, warmup
+from schemantic.schema.main import GroupSchema, SingleSchema
+
+
+class TestRegistry(unittest.TestCase):
+    def test_mixin_subclasses_join(self):
+        origins = registered_origins()
+        for origin in (TestClass, TestDataclass, TestModel):
+            self.assertIn(origin, origins)
+        self.assertNotIn(SchemanticProjectModelMixin, origins)
+        self.assertNotIn(OtherTestClass, origins)
+
+    def test_opt_out_and_manual_registration(self):
+        class Base(SchemanticProjectMixin, register=False):
+            pass
+
+        class Member(Base):
+            def __init__(self, a: int):
+                pass
+
+        @register_origin
+        class Outsider(Base):
+            pass
+
+        self.assertEqual(registered_origins(Base), [Member, Outsider])
+        unregister_origin(Outsider)
+        self.assertEqual(registered_origins(Base), [Member])
+
+        group = GroupSchema.from_registry(base=Base, mapping_name="registered")
+        self.assertEqual([schema.origin for schema in group.single_schemas], [Member])
+
+    def test_warmup_fills_schematic_cache(self):
+        class Warm(SchemanticProjectMixin, register=False):
+            def __init__(self, a: int, b: str = "b"):
+                pass
+
+        class Empty(SchemanticProjectMixin, register=False):
+            pass
+
+        schematics = warmup([Warm, Empty]).result(timeout=10)
+        self.assertEqual(list(schematics), [Warm])
+        self.assertIn(Warm, schematic_cache)
+        self.assertIs(SingleSchema(origin=Warm).schematic, schematics[Warm])
+
+
+class TestSchematicCache(unittest.TestCase):
+    def test_shared_between_schemas(self):
+        self.assertIs(SingleSchema(origin=TestClass).schematic, SingleSchema(origin=TestClass).schematic)
+
+    def test_recompute_kwargs_invalidates(self):
+        class Excluding(SchemanticProjectMixin, register=False):
+            excluded: set[str] = set()
+
+            def __init__(self, a: int, b: int):
+                pass
+
+            @classmethod
+            @property
+            def fields_to_exclude_from_single_schema(cls) -> set[str]:
+                return set(cls.excluded)
+
+        self.assertEqual(list(extract_schematic(Excluding).field_to_info), ["a", "b"])
+        Excluding.excluded = {"b"}
+        Excluding.recompute_single_schema_kwargs()
+        self.assertEqual(list(extract_schematic(Excluding).field_to_info), ["a"])
+
+    def test_merging_leaves_shared_field_metadata_untouched(self):
+        before = {field: info.field_info_string for field, info in extract_schematic(TestClass).field_to_info.items()}
+        class_culture_schema.schema()
+        class_culture_schema.source_schemas[2].schema()
+        after = {field: info.field_info_string for field, info in extract_schematic(TestClass).field_to_info.items()}
+        self.assertEqual(before, after)
+
+    def test_entries_do_not_keep_origins_alive(self):
+        class Local:
+            def __init__(self, a: str = "a"):
+                pass
+
+        self.assertIn(Local, extract_schematic(Local).field_to_info["a"].owner_to_default)
+        origin_ref = weakref.ref(Local)
+        del Local
+        gc.collect()
+        self.assertIsNone(origin_ref())
@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from test.schema.base import TestModel
+
+from ordered_set import OrderedSet
+from parameterized import parameterized
+
+from schemantic.model.names import NameRange
+from schemantic.schema.main import HomologSchema, SingleSchema
+from schemantic.utils.constant import SCHEMA_SHARDS_KEY
+from schemantic.utils.file import load_schema_file
+from schemantic.utils.shard import shard_index, shard_path
+
+
+class TestShardedHomolog(unittest.TestCase):
+    names = OrderedSet(f"worker_{i}" for i in range(50))
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.schema = HomologSchema(
+            single_schema=SingleSchema(origin=TestModel),
+            instance_names=self.names,
+            pre_definitions={name: {"must_be": i} for i, name in enumerate(self.names)},
+        )
+
+    def test_shard_path(self):
+        self.assertEqual(shard_path(Path("a/homolog.yaml.gz"), 3), Path("a/homolog.shard-0003.yaml.gz"))
+
+    @parameterized.expand([("count", ".yaml"), ("hash", ".json"), ("hash", ".toml.gz")])
+    def test_round_trip(self, shard_by, suffix):
+        path = Path(self.directory.name) / f"homolog{suffix}"
+        self.schema.dump(path, shard_count=4, shard_by=shard_by)
+
+        header = load_schema_file(path)
+        self.assertEqual(header[SCHEMA_SHARDS_KEY]["by"], shard_by)
+        self.assertFalse(set(self.names) & set(header))
+        self.assertEqual(len(list(Path(self.directory.name).glob("homolog.shard-*"))), 4)
+
+        unsharded_path = Path(self.directory.name) / f"unsharded{suffix}"
+        self.schema.dump(unsharded_path)
+        expected = self.schema.parse_schema(unsharded_path)
+        self.assertEqual(self.schema.parse_schema(path), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(self.schema.parse_schema(self.schema.load_sharded(path, executor=executor)), expected)
+        self.assertEqual(len(self.schema.parse_schema_to_instance(path)), len(self.names))
+
+    def test_count_shards_are_balanced(self):
+        path = Path(self.directory.name) / "homolog.json"
+        self.schema.dump(path, shard_count=5, shard_by="count")
+        self.assertEqual([len(load_schema_file(shard_path(path, i))) for i in range(5)], [10] * 5)
+
+    def test_single_name_reads_one_hash_shard(self):
+        path = Path(self.directory.name) / "homolog.json"
+        self.schema.dump(path, shard_count=4, shard_by="hash")
+        name = "worker_7"
+        for i in range(4):
+            if i != shard_index(name, 4):
+                shard_path(path, i).unlink()
+
+        self.assertEqual(self.schema.parse_schema(self.schema.load_sharded(path, names=[name])), {name: {"must_be": 7}})
+
+    def test_names_with_symbolic_instance_names(self):
+        schema = HomologSchema(
+            single_schema=SingleSchema(origin=TestModel), instance_names=NameRange(template="w{}", stop=100)
+        )
+        path = Path(self.directory.name) / "homolog.yaml"
+        schema.dump(path, shard_count=2, shard_by="hash")
+        loaded = schema.load_sharded(path, names=["w3", "w200"])
+        self.assertEqual(list(schema.parse_schema(loaded)), ["w3"])
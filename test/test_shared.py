@@ -0,0 +1,80 @@
+import multiprocessing
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from test.schema.bare import model_culture_schema
+from test.schema.base import TestModel
+from unittest import mock
+
+from schemantic.schema.shared import SharedParsed, attach
+
+defined = {
+    "single_test": {"defined": {"must_be": 1}},
+    "homolog_test": {"common": {"must_be": 2}, "test_1": {"we": "a"}, "test_2": {}},
+    "group_test": {
+        "common": {"defined": {"we": "b"}},
+        "TestModel": {"defined": {"must_be": 3}},
+        "OtherTestModel": {"defined": {}},
+    },
+}
+
+
+def _instantiate_in_worker(path: Path, name: str):
+    with attach(path) as parsed:
+        return parsed.instantiate(name)
+
+
+class TestShared(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "segment"
+        self.segment = model_culture_schema.publish(defined, self.path)
+
+    def tearDown(self) -> None:
+        self.segment.unlink()
+        self.directory.cleanup()
+
+    def test_attached_mapping(self):
+        with attach(self.path) as parsed:
+            expected = model_culture_schema.parse_schema_with_origin(defined)
+            self.assertEqual(dict(parsed), {name: config for name, (_origin, config) in expected.items()})
+            self.assertEqual(parsed.origin_config("test_1"), (TestModel, {"must_be": 2, "we": "a"}))
+            self.assertEqual(parsed.instantiate("TestModel"), TestModel(must_be=3, we="b"))
+
+    def test_lazy_decoding(self):
+        patched_loads = mock.patch("schemantic.schema.shared.pickle.loads", wraps=pickle.loads)
+        with attach(self.path) as parsed, patched_loads as loads:
+            self.assertIn("test_2", parsed)
+            self.assertEqual(len(parsed), 5)
+            self.assertEqual(loads.call_count, 0)
+
+            self.assertEqual(parsed["test_2"], {"must_be": 2})
+            self.assertEqual(parsed["test_2"], {"must_be": 2})
+            self.assertEqual(loads.call_count, 1)
+
+    def test_read_only(self):
+        with attach(self.path) as parsed:
+            with self.assertRaises(TypeError):
+                parsed["test_1"]["we"] = "b"
+            self.assertEqual(parsed["test_1"], {"must_be": 2, "we": "a"})
+
+    def test_worker_processes(self):
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(2, mp_context=context) as executor:
+            instances = list(executor.map(_instantiate_in_worker, [self.path] * 2, ["test_1", "single_test"]))
+
+        self.assertEqual(instances, [TestModel(must_be=2, we="a"), TestModel(must_be=1)])
+
+    def test_republish_replaces_segment(self):
+        model_culture_schema.publish({**defined, "single_test": {"defined": {"must_be": 9}}}, self.path)
+        with attach(self.path) as parsed:
+            self.assertEqual(parsed["single_test"], {"must_be": 9})
+        self.assertEqual(self.segment["single_test"], {"must_be": 1})
+
+    def test_not_a_segment(self):
+        other = Path(self.directory.name) / "other"
+        other.write_bytes(b"not a segment")
+        with self.assertRaises(ValueError):
+            SharedParsed(other)
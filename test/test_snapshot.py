@@ -0,0 +1,95 @@
+import tempfile
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+from test.schema.bare import dataclass_culture_schema, model_culture_schema
+
+from ordered_set import OrderedSet
+from parameterized import parameterized
+from pydantic import BaseModel
+
+from schemantic.schema.main import CultureSchema, GroupSchema, HomologSchema, SingleSchema
+from schemantic.utils.file import load_schema_file
+
+
+class Robber(BaseModel):
+    name: str
+    weapon: str = "crowbar"
+    getaway: str = "car"
+
+
+@dataclass
+class Lookout:
+    name: str
+    getaway: str = "car"
+
+
+class Safecracker:
+    def __init__(self, name: str, tool: str = "stethoscope"):
+        self.name = name
+        self.tool = tool
+
+
+class TestDefinedFromInstances(unittest.TestCase):
+    def test_single(self):
+        schema = SingleSchema(origin=Robber)
+        defined = schema.defined_from_instances({"Robber": Robber(name="bonnie", getaway="bike")})
+
+        self.assertEqual(defined, {"class_name": "Robber", "defined": {"name": "bonnie", "getaway": "bike"}})
+
+    def test_homolog_factors_common(self):
+        schema = HomologSchema(single_schema=SingleSchema(origin=Robber), instance_names=OrderedSet(("a", "b", "c")))
+        instances = {
+            "a": Robber(name="bonnie", weapon="pistol", getaway="bike"),
+            "b": Robber(name="clyde", weapon="pistol"),
+            "c": Robber(name="ned", weapon="pistol", getaway="horse"),
+        }
+        defined = schema.defined_from_instances(instances)
+
+        self.assertEqual(defined["common"], {"weapon": "pistol"})
+        self.assertEqual(defined["b"], {"name": "clyde"})
+        self.assertEqual(schema.parse_schema_to_instance(defined), instances)
+
+    def test_group(self):
+        schema = GroupSchema.from_originating_types(
+            origins=OrderedSet((Robber, Lookout, Safecracker)), mapping_name="crew"
+        )
+        instances = {
+            "Robber": Robber(name="crew", getaway="van"),
+            "Lookout": Lookout(name="crew", getaway="van"),
+            "Safecracker": Safecracker(name="crew", tool="drill"),
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "defined.yaml"
+            defined = schema.defined_from_instances(instances, dump_path=path)
+            self.assertEqual(load_schema_file(path), defined)
+
+        self.assertEqual(defined["common"], {"defined": {"name": "crew"}})
+        self.assertEqual(defined["Robber"], {"class_name": "Robber", "defined": {"getaway": "van"}})
+        self.assertEqual(defined["Safecracker"]["defined"], {"tool": "drill"})
+
+        reparsed = schema.parse_schema_to_instance(defined)
+        self.assertEqual(reparsed["Robber"], instances["Robber"])
+        self.assertEqual(vars(reparsed["Safecracker"]), vars(instances["Safecracker"]))
+
+    def test_unknown_member(self):
+        schema = GroupSchema.from_originating_types(origins=OrderedSet((Robber, Lookout)), mapping_name="crew")
+        with self.assertRaises(ValueError):
+            schema.defined_from_instances({"Safecracker": Safecracker(name="x")})
+
+    @parameterized.expand([("dataclass", dataclass_culture_schema), ("model", model_culture_schema)])
+    def test_culture_round_trip(self, _name: str, schema: CultureSchema):
+        defined = {
+            "single_test": {"defined": {"must_be": 1}},
+            "homolog_test": {"common": {"must_be": 2}, "test_1": {"we": "a"}, "test_2": {}},
+            "group_test": {"common": {"defined": {"we": "b"}}},
+        }
+        for name, member in schema.source_schemas[2].schema_mapping_name_to_instance_schema.items():
+            defined["group_test"][name] = {"defined": {"must_be": 3} if member.schematic.required else {}}
+        instances = schema.parse_schema_to_instance(defined)
+
+        snapshot = schema.defined_from_instances(instances)
+        self.assertEqual(snapshot["homolog_test"]["test_2"], {})
+        self.assertEqual(schema.parse_schema_to_instance(snapshot), instances)
+        with self.assertRaises(ValueError):
+            schema.defined_from_instances({**instances, "stranger": instances["test_1"]})
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from test.schema.bare import model_culture_schema, model_homolog_schema
+from test.schema.base import TestModel
+from unittest import mock
+
+from schemantic.utils.file import dump_schema_file
+
+
+class TestSchemaWatcher(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.defined_path = Path(self._directory.name) / "homolog.yaml"
+
+        self.defined = model_homolog_schema.schema()
+        self.defined["common"] = {"must_be": 1}
+        self._dump()
+
+        self.notified = []
+        self.watcher = model_homolog_schema.watch(self.defined_path, callback=self.notified.append, start=False)
+
+    def tearDown(self):
+        self.watcher.stop()
+        self._directory.cleanup()
+
+    def _dump(self):
+        dump_schema_file(self.defined, self.defined_path)
+        # Make sure the change is visible even on file systems with a coarse mtime
+        stat = self.defined_path.stat()
+        os.utime(self.defined_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_initial_instances(self):
+        self.assertEqual(set(self.watcher.instances), {"test_1", "test_2"})
+        self.assertIsInstance(self.watcher.instances["test_1"], TestModel)
+
+    def test_unchanged(self):
+        self.assertFalse(self.watcher.poll())
+        self.assertFalse(self.notified)
+
+    def test_only_changed_member_is_reinstantiated(self):
+        untouched = self.watcher.instances["test_1"]
+
+        self.defined["test_2"] = {"must_be": 2}
+        self._dump()
+
+        self.assertEqual(list(self.watcher.poll()), ["test_2"])
+        self.assertEqual(list(self.notified[0]), ["test_2"])
+        self.assertIs(self.watcher.instances["test_1"], untouched)
+        self.assertEqual(self.watcher.instances["test_2"].must_be, 2)
+
+    def test_common_change_propagates(self):
+        self.defined["common"] = {"must_be": 3}
+        self._dump()
+
+        self.assertEqual(set(self.watcher.poll()), {"test_1", "test_2"})
+        self.assertEqual(self.watcher.instances["test_1"].must_be, 3)
+
+    def test_removed_member(self):
+        del self.defined["test_2"]
+        self._dump()
+
+        self.assertEqual(list(self.watcher.poll()), ["test_2"])
+        self.assertNotIn("test_2", self.watcher.instances)
+
+    def test_failed_reload_leaves_state_untouched(self):
+        before = dict(self.watcher.instances)
+        original_init = TestModel.__init__
+        calls = []
+
+        def fail_once_part_way(model, **kwargs):
+            calls.append(kwargs)
+            if len(calls) == 2:
+                msg = "transient"
+                raise RuntimeError(msg)
+            original_init(model, **kwargs)
+
+        self.defined["common"] = {"must_be": 3}
+        self._dump()
+        with mock.patch.object(TestModel, "__init__", autospec=True, side_effect=fail_once_part_way):
+            with self.assertRaises(RuntimeError):
+                self.watcher.poll()
+            self.assertEqual(self.watcher.instances, before)
+            self.assertEqual(self.watcher.configs["test_1"][1], {"must_be": 1})
+            # Not retried until the files change again
+            self.assertFalse(self.watcher.poll())
+            self.assertEqual(len(calls), 2)
+
+            self._dump()
+            self.assertEqual(set(self.watcher.poll()), {"test_1", "test_2"})
+
+        self.assertEqual([instance.must_be for instance in self.watcher.instances.values()], [3, 3])
+        self.assertEqual(list(self.notified[0]), ["test_1", "test_2"])
+
+    def test_background_polling(self):
+        reloaded = threading.Event()
+        self.watcher.add_callback(lambda _names: reloaded.set())
+        self.watcher.interval = 0.01
+
+        with self.watcher:
+            self.defined["test_1"] = {"must_be": 5}
+            self._dump()
+            self.assertTrue(reloaded.wait(5))
+
+        self.assertEqual(self.watcher.instances["test_1"].must_be, 5)
+
+    def test_culture(self):
+        defined = model_culture_schema.schema()
+        defined["single_test"]["defined"]["must_be"] = 1
+        defined["homolog_test"]["common"]["must_be"] = 1
+        defined["group_test"]["TestModel"]["defined"]["must_be"] = 1
+        dump_schema_file(defined, self.defined_path)
+
+        watcher = model_culture_schema.watch(self.defined_path, start=False)
+        self.assertEqual(set(watcher.instances), {"single_test", "test_1", "test_2", "TestModel", "OtherTestModel"})